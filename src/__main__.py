@@ -1,4 +1,4 @@
-from src.cli.app import main
+from src.cli.commands import main
 
 
 if __name__ == "__main__":
@@ -1 +1,8 @@
-from src.cli.app import CardScraperApp
+def __getattr__(name: str):
+    # Lazy so `src.cli.commands` can run headless without importing Textual.
+    if name == "CardScraperApp":
+        from src.cli.app import CardScraperApp
+
+        return CardScraperApp
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
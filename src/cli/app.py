@@ -1,7 +1,8 @@
 import asyncio
 import logging
 import shutil
-import sys
+from collections.abc import Callable
+from contextlib import aclosing
 from pathlib import Path
 from typing import Literal
 
@@ -48,8 +49,8 @@ from src.usecases.collections import (
     start_new_collection,
     undo_last,
 )
-from src.usecases.search_cards import search_cards
-from src.usecases.ydk_import import ImportDeckError, import_deck_file
+from src.usecases.search_cards import iter_search_cards, search_results_page
+from src.usecases.ydk_import import ImportDeckError, iter_import_deck_file
 from src.utils.utils import sanitize_filename
 
 
@@ -57,12 +58,10 @@ LOG = logging.getLogger(__name__)
 
 
 def main() -> None:
-    """Entry point for the console script."""
-    if len(sys.argv) > 1 and sys.argv[1] == "init":
-        asyncio.run(init_db())
-        return
-    app = CardScraperApp()
-    app.run()
+    """Kept for callers of ``src.cli.app:main``; see ``src.cli.commands``."""
+    from src.cli.commands import main as commands_main
+
+    commands_main()
 
 
 def _user_message(operation: str, error: Exception) -> str:
@@ -113,7 +112,8 @@ DEFAULT_HINTS = "s: search  i: import  c: collections  q: quit"
 COLLECTIONS_HINTS = "Enter: load  n: new  r: rename  d: delete  x: export"
 SEARCH_HINTS = (
     "Space: select  a: add  ctrl+z: undo  u: image  /: search  "
-    "PgUp/PgDn or '['/']': page  Ctrl+s: save  +/-: qty  d: remove  e: rename"
+    "PgUp/PgDn or '['/']': page  Ctrl+s: save  +/-: qty  d: remove  e: rename  "
+    "p/k: sort price/stock  f: in stock  t/m: rarity/condition"
 )
 SELECT_HINTS = (
     "SELECT: Space: toggle  a: add  ctrl+z: undo  u: image  /: search  Esc: back"
@@ -151,6 +151,11 @@ class RootScreen(Screen):
         Binding("pagedown", "next_page", "Next page", priority=True),
         Binding("[", "prev_page", "Prev page", priority=True),
         Binding("]", "next_page", "Next page", priority=True),
+        ("p", "sort_price", "Sort by price"),
+        ("k", "sort_stock", "Sort by stock"),
+        ("f", "filter_in_stock", "In stock only"),
+        ("t", "filter_rarity", "Filter rarity"),
+        ("m", "filter_condition", "Filter condition"),
     ]
 
     def compose(self) -> ComposeResult:
@@ -267,10 +272,27 @@ class RootScreen(Screen):
             )
         )
 
-    async def on_search_submitted(self, message: SearchSubmitted) -> None:
+    def on_search_submitted(self, message: SearchSubmitted) -> None:
+        self.run_worker(self._do_search(message.query), exclusive=True, group="search")
+
+    async def _do_search(self, query: str) -> None:
+        search_screen = self.query_one("#search-screen", SearchScreen)
+        search_screen.begin_results()
+
         try:
-            listings = await search_cards(message.query)
+            first_page = await search_results_page(query)
+
+            if first_page is not None and first_page.listings:
+                search_screen.append_results(first_page.listings)
+                search_screen.set_more_results(
+                    query, first_page.page + 1 if first_page.has_more else None
+                )
+            else:
+                async with aclosing(iter_search_cards(query)) as results:
+                    async for _card_name, listings in results:
+                        search_screen.append_results(listings)
         except Exception as e:
+            search_screen.finish_results()
             self._notify(_user_message("Search", e), "error")
             self._set_mode_state(
                 ModeState(
@@ -281,19 +303,24 @@ class RootScreen(Screen):
             )
             return
 
-        search_screen = self.query_one("#search-screen", SearchScreen)
-        search_screen.render_results(listings)
+        search_screen.finish_results()
+        listing_count = search_screen.get_result_count()
 
-        if listings:
+        if listing_count:
             pagination_state = search_screen.get_pagination_state()
-            if pagination_state is not None:
+            if search_screen.more_results() is not None:
+                self._notify(
+                    f"Found {listing_count} listings so far (]: more results)",
+                    "info",
+                )
+            elif pagination_state is not None:
                 current_page, total_pages = pagination_state
                 self._notify(
-                    f"Found {len(listings)} listings (Page {current_page}/{total_pages})",
+                    f"Found {listing_count} listings (Page {current_page}/{total_pages})",
                     "info",
                 )
             else:
-                self._notify(f"Found {len(listings)} listings", "info")
+                self._notify(f"Found {listing_count} listings", "info")
         else:
             self._notify("No results", "info")
 
@@ -306,7 +333,9 @@ class RootScreen(Screen):
         )
 
     def on_import_requested(self, message: ImportRequested) -> None:
-        self.run_worker(self._do_import(message.path), exclusive=False)
+        # Imports stream into the search table too, so they share the search
+        # group: starting one cancels the stream it would otherwise mix with.
+        self.run_worker(self._do_import(message.path), exclusive=True, group="search")
 
     def action_import_by_path(self) -> None:
         import_screen = self.query_one("#import-screen", ImportScreen)
@@ -404,47 +433,38 @@ class RootScreen(Screen):
         else:
             self._notify("Searching for cards...", "info")
 
+        search_screen = self.query_one("#search-screen", SearchScreen)
+        search_screen.begin_results()
+        self._show_screen("search-screen", "Home > Import > Results", SEARCH_HINTS)
+
         try:
-            listings = await import_deck_file(file_path)
+            async with aclosing(iter_import_deck_file(file_path)) as results:
+                async for _card_name, listings in results:
+                    search_screen.append_results(listings)
         except FileNotFoundError as error:
+            search_screen.finish_results()
             self._notify(_user_message("Import", error), "error")
             import_screen = self.query_one("#import-screen", ImportScreen)
             import_screen._refresh_file_list()
-            self._set_mode_state(
-                ModeState(
-                    mode="NAV",
-                    breadcrumb="Home > Import",
-                    hints=IMPORT_HINTS,
-                )
-            )
+            self._show_screen("import-screen", "Home > Import", IMPORT_HINTS)
             return
         except ImportDeckError as error:
+            search_screen.finish_results()
             self._notify(_user_message("Import", error), "error")
-            self._set_mode_state(
-                ModeState(
-                    mode="NAV",
-                    breadcrumb="Home > Import",
-                    hints=IMPORT_HINTS,
-                )
-            )
+            self._show_screen("import-screen", "Home > Import", IMPORT_HINTS)
             return
         except Exception as error:
+            search_screen.finish_results()
             self._notify(_user_message("Import", error), "error")
-            self._set_mode_state(
-                ModeState(
-                    mode="NAV",
-                    breadcrumb="Home > Import",
-                    hints=IMPORT_HINTS,
-                )
-            )
+            self._show_screen("import-screen", "Home > Import", IMPORT_HINTS)
             return
 
-        search_screen = self.query_one("#search-screen", SearchScreen)
-        search_screen.render_results(listings)
+        search_screen.finish_results()
+        listing_count = search_screen.get_result_count()
 
-        if listings:
+        if listing_count:
             self._notify(
-                f'Imported {len(listings)} listings from "{file_name}"',
+                f'Imported {listing_count} listings from "{file_name}"',
                 "success",
             )
         else:
@@ -453,8 +473,6 @@ class RootScreen(Screen):
         import_screen = self.query_one("#import-screen", ImportScreen)
         import_screen._refresh_file_list()
 
-        self._show_screen("search-screen", "Home > Import > Results", SEARCH_HINTS)
-
     def on_add_selected_requested(self, _: AddSelectedRequested) -> None:
         search_screen = self.query_one("#search-screen", SearchScreen)
         added_count = search_screen.add_selected_to_collection()
@@ -744,6 +762,19 @@ class RootScreen(Screen):
             return
 
         changed = search_screen.next_page()
+        more_results = search_screen.more_results()
+
+        # Past the last loaded page, each press fetches one more site page.
+        if not changed and more_results is not None:
+            self.run_worker(
+                self._load_more_results(*more_results), exclusive=True, group="search"
+            )
+            return
+
+        self._notify_next_page(changed)
+
+    def _notify_next_page(self, changed: bool) -> None:
+        search_screen = self.query_one("#search-screen", SearchScreen)
         state = search_screen.get_pagination_state()
 
         if not changed and state is not None:
@@ -761,6 +792,29 @@ class RootScreen(Screen):
             )
         )
 
+    async def _load_more_results(self, query: str, page: int) -> None:
+        search_screen = self.query_one("#search-screen", SearchScreen)
+        self._notify(f"Loading result page {page}…", "info")
+        results = await search_results_page(query, page)
+
+        if results is None:
+            search_screen.set_more_results(query, None)
+            self._notify("Could not load more results", "error")
+            return
+
+        search_screen.append_results(results.listings)
+        search_screen.set_more_results(
+            query, page + 1 if results.has_more and results.listings else None
+        )
+        changed = search_screen.next_page()
+
+        if not changed and search_screen.more_results() is not None:
+            # Everything on this page was filtered out; the next press loads more.
+            self._notify(f"No matching listings on result page {page} (]: more)")
+            return
+
+        self._notify_next_page(changed)
+
     def action_prev_page(self) -> None:
         search_screen = self.query_one("#search-screen", SearchScreen)
 
@@ -785,6 +839,29 @@ class RootScreen(Screen):
             )
         )
 
+    def action_sort_price(self) -> None:
+        self._change_search_view(SearchScreen.cycle_price_sort)
+
+    def action_sort_stock(self) -> None:
+        self._change_search_view(SearchScreen.cycle_stock_sort)
+
+    def action_filter_in_stock(self) -> None:
+        self._change_search_view(SearchScreen.toggle_in_stock_filter)
+
+    def action_filter_rarity(self) -> None:
+        self._change_search_view(SearchScreen.cycle_rarity_filter)
+
+    def action_filter_condition(self) -> None:
+        self._change_search_view(SearchScreen.cycle_condition_filter)
+
+    def _change_search_view(self, change: Callable[[SearchScreen], str]) -> None:
+        search_screen = self.query_one("#search-screen", SearchScreen)
+
+        if search_screen.has_class("is-hidden"):
+            return
+
+        self._notify(change(search_screen), "info")
+
     def action_back(self) -> None:
         if not self.query_one("#home-screen").has_class("is-hidden"):
             self._set_mode_state(
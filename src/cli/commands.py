@@ -0,0 +1,244 @@
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+from src.models.db_models import init_db
+from src.services.job_queue import (
+    JobQueueError,
+    enqueue_cards,
+    iter_job_results,
+    job_counts,
+    release_leases,
+    retry_failed,
+)
+from src.services.metrics import dump_metrics_at_exit
+from src.services.scraper import (
+    PARSE_MAX_WORKERS,
+    PARSE_MODES,
+    close_scraper_client,
+    set_page_archiving,
+    set_parse_mode,
+    shutdown_parse_executor,
+)
+from src.usecases.batch_scrape import (
+    BatchScrapeError,
+    scrape_deck_to_file,
+    write_listing_rows,
+)
+from src.usecases.reparse_archive import reparse_archive
+from src.usecases.scrape_jobs import JOB_WORKERS, run_scrape_job
+from src.usecases.ydk_import import ImportDeckError, deck_card_names
+
+
+DECK_SUFFIXES = {".ydk", ".txt"}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="coolstuffscrape",
+        description="Run without arguments to open the terminal UI.",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="PATH",
+        help="write scrape timings and cache counters as JSON on exit",
+    )
+    parser.add_argument(
+        "--archive-pages",
+        action="store_true",
+        help="keep compressed copies of fetched card pages for `reparse`",
+    )
+    parser.add_argument(
+        "--parse-mode",
+        choices=PARSE_MODES,
+        help="where card pages are parsed (default: thread)",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("init", help="create the database and app data dir")
+
+    scrape = commands.add_parser(
+        "scrape", help="scrape every card in a deck file without the UI"
+    )
+    scrape.add_argument("deck", help="deck file (.ydk or .txt)")
+    scrape.add_argument("--out", required=True, help="output file (.csv or .jsonl)")
+    scrape.add_argument(
+        "-v", "--verbose", action="store_true", help="log progress to stderr"
+    )
+
+    job = commands.add_parser(
+        "job", help="resumable scrape jobs that survive interruption"
+    )
+    job.add_argument(
+        "-v", "--verbose", action="store_true", help="log progress to stderr"
+    )
+    job_commands = job.add_subparsers(dest="job_command", required=True)
+
+    job_add = job_commands.add_parser("add", help="queue the cards of a deck file")
+    job_add.add_argument("name")
+    job_add.add_argument("deck", help="deck file (.ydk or .txt)")
+
+    job_run = job_commands.add_parser(
+        "run", help="drain a job; several processes may run at once"
+    )
+    job_run.add_argument("name")
+    job_run.add_argument("--workers", type=int, default=JOB_WORKERS)
+    job_run.add_argument(
+        "--reclaim",
+        action="store_true",
+        help="requeue in-flight cards left by a killed run (no other runner)",
+    )
+
+    job_status = job_commands.add_parser("status", help="show card counts by state")
+    job_status.add_argument("name")
+
+    job_retry = job_commands.add_parser("retry", help="requeue failed cards")
+    job_retry.add_argument("name")
+
+    job_export = job_commands.add_parser("export", help="write finished results")
+    job_export.add_argument("name")
+    job_export.add_argument("--out", required=True, help="output file (.csv or .jsonl)")
+
+    reparse = commands.add_parser(
+        "reparse",
+        help="rebuild cached listings from archived pages after a parser change",
+    )
+    reparse.add_argument("--workers", type=int, default=PARSE_MAX_WORKERS)
+    reparse.add_argument(
+        "--all",
+        action="store_true",
+        dest="reparse_all",
+        help="reparse every archived page, not just outdated ones",
+    )
+    reparse.add_argument(
+        "-v", "--verbose", action="store_true", help="log progress to stderr"
+    )
+
+    return parser
+
+
+async def _scrape(deck: str, out: str) -> int:
+    try:
+        stats = await scrape_deck_to_file(deck, out)
+    except (BatchScrapeError, ImportDeckError, OSError) as error:
+        print(f"scrape failed: {error}", file=sys.stderr)
+        return 1
+    finally:
+        await close_scraper_client()
+        shutdown_parse_executor()
+
+    print(f"wrote {out}: {stats.summary()}", file=sys.stderr)
+
+    return 0
+
+
+def run_scrape(deck: str, out: str) -> int:
+    deck_path = Path(deck)
+
+    if not deck_path.is_file():
+        print(f"scrape failed: deck file not found: {deck}", file=sys.stderr)
+        return 1
+
+    if deck_path.suffix.lower() not in DECK_SUFFIXES:
+        print("scrape failed: deck file must be .ydk or .txt", file=sys.stderr)
+        return 1
+
+    return asyncio.run(_scrape(str(deck_path), out))
+
+
+async def _job(args: argparse.Namespace) -> int:
+    try:
+        match args.job_command:
+            case "add":
+                if Path(args.deck).suffix.lower() not in DECK_SUFFIXES:
+                    raise ImportDeckError("deck file must be .ydk or .txt")
+
+                added = await enqueue_cards(args.name, await deck_card_names(args.deck))
+                print(f"job {args.name}: queued {added} new cards", file=sys.stderr)
+            case "run":
+                if args.reclaim:
+                    await release_leases(args.name)
+
+                try:
+                    stats = await run_scrape_job(args.name, workers=args.workers)
+                finally:
+                    await close_scraper_client()
+                    shutdown_parse_executor()
+
+                print(f"job {args.name}: {stats.summary()}", file=sys.stderr)
+                print(_format_counts(await job_counts(args.name)), file=sys.stderr)
+            case "status":
+                print(_format_counts(await job_counts(args.name)))
+            case "retry":
+                retried = await retry_failed(args.name)
+                print(f"job {args.name}: requeued {retried} cards", file=sys.stderr)
+            case "export":
+                # Fails on an unknown job before the output file is truncated.
+                await job_counts(args.name)
+                stats = await write_listing_rows(iter_job_results(args.name), args.out)
+                print(f"wrote {args.out}: {stats.summary()}", file=sys.stderr)
+    except (JobQueueError, BatchScrapeError, ImportDeckError, OSError) as error:
+        print(f"job {args.job_command} failed: {error}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+async def _reparse(workers: int, reparse_all: bool) -> int:
+    try:
+        stats = await reparse_archive(workers, reparse_all)
+    except OSError as error:
+        print(f"reparse failed: {error}", file=sys.stderr)
+        return 1
+
+    print(f"reparse: {stats.summary()}", file=sys.stderr)
+
+    return 0
+
+
+def _configure_logging(verbose: bool) -> None:
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+
+
+def _format_counts(counts: dict[str, int]) -> str:
+    return " ".join(f"{state}={count}" for state, count in counts.items())
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for the console script."""
+    args = _build_parser().parse_args(argv)
+
+    if args.metrics:
+        dump_metrics_at_exit(args.metrics)
+
+    if args.archive_pages:
+        set_page_archiving(True)
+
+    if args.parse_mode:
+        set_parse_mode(args.parse_mode)
+
+    if args.command == "init":
+        asyncio.run(init_db())
+        return
+
+    if args.command == "scrape":
+        _configure_logging(args.verbose)
+        sys.exit(run_scrape(args.deck, args.out))
+
+    if args.command == "job":
+        _configure_logging(args.verbose)
+        sys.exit(asyncio.run(_job(args)))
+
+    if args.command == "reparse":
+        _configure_logging(args.verbose)
+        sys.exit(asyncio.run(_reparse(args.workers, args.reparse_all)))
+
+    # Textual is only imported for the TUI so headless runs stay light.
+    from src.cli.app import CardScraperApp
+
+    CardScraperApp().run()
@@ -1,5 +1,3 @@
-from decimal import Decimal
-
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
@@ -12,6 +10,7 @@ from src.usecases.collections import (
     list_collections,
     load_collection_into_working,
 )
+from src.utils.utils import format_price
 
 
 class CollectionsScreen(Container):
@@ -160,12 +159,9 @@ class CollectionsScreen(Container):
                 item.card_name.split(" - ", 1)[0],
                 item.card_code,
                 item.card_rarity,
-                item.card_price,
+                format_price(item.card_price_cents),
                 str(item.card_quantity),
-                "${:,.2f}".format(
-                    item.card_quantity
-                    * Decimal(item.card_price.replace("$", "").replace(",", "."))
-                ),
+                format_price(item.card_quantity * (item.card_price_cents or 0)),
             )
 
         return table
@@ -193,8 +189,11 @@ class CollectionsScreen(Container):
 
         item_count = len(coll.items)
         total_qty = sum(i.card_quantity for i in coll.items)
+        total_cents = sum(
+            i.card_quantity * (i.card_price_cents or 0) for i in coll.items
+        )
         summary = Static(
-            f"{item_count} Item(s) · {total_qty} Total · ${str(sum(i.card_quantity * Decimal(i.card_price.replace("$", "").replace(",", ".")) for i in coll.items))} USD",
+            f"{item_count} Item(s) · {total_qty} Total · {format_price(total_cents)} USD",
             classes="muted",
         )
         content.mount(summary)
@@ -8,16 +8,18 @@ from textual.widgets.option_list import Option
 from src.cli.ui.messages import SearchSubmitted
 from src.cli.widgets.search_input import SearchInput
 from src.models.cards import CardListing
+from src.models.listing_table import ListingTable
+from src.services.metrics import timed
 from src.usecases.collections import (
-    add_items,
+    add_items_from_listings,
     adjust_quantity,
     get_working_collection,
     get_working_collection_name,
     is_in_collection,
-    make_collection_items_from_listings,
     remove_item,
 )
 from src.utils.constants import SEARCH_RESULTS_PER_PAGE
+from src.utils.utils import format_price
 
 
 ADDED_HIGHLIGHT_TTL = 2.0
@@ -34,8 +36,16 @@ class SearchScreen(Container):
         self._working_list_keys: list[str] = []
         self._recently_added_row_keys: set[str] = set()
         self._added_highlight_timer: object | None = None
-        self._all_listings: list[CardListing] = []
+        self._results = ListingTable()
+        self._visible: list[int] | None = None
+        self._page_rows: list[int] = []
         self._page_index: int = 0
+        self._sort_key: str | None = None
+        self._sort_descending = False
+        self._in_stock_only = False
+        self._rarity_filter: int | None = None
+        self._condition_filter: int | None = None
+        self._more_results: tuple[str, int] | None = None
 
     def compose(self) -> ComposeResult:
         with Horizontal(classes="split", id="search-split"):
@@ -73,26 +83,183 @@ class SearchScreen(Container):
         event.input.blur()
 
     def render_results(self, listings: list[CardListing]) -> None:
-        self._all_listings = list(listings)
-        self._page_index = 0
+        self._reset_results()
+        self._results.extend(listings)
         self._render_current_page()
 
-    def _render_current_page(self) -> None:
-        if not self._all_listings:
-            self._render_results([])
+    def begin_results(self) -> None:
+        self._reset_results()
+        self._render_results([], placeholder="Searching…")
+
+    def append_results(self, listings: list[CardListing]) -> None:
+        if not listings:
             return
 
+        first_new_index = len(self._results)
+        self._results.extend(listings)
+
+        if not self._row_to_listing:
+            self._render_current_page()
+            return
+
+        if self._has_view_options():
+            # New rows can land anywhere in a sorted/filtered view; only
+            # redraw when the visible page actually changes.
+            self._visible = None
+
+            if self._current_page_rows() != self._page_rows:
+                self._render_current_page()
+
+            return
+
+        page_start = self._page_index * SEARCH_RESULTS_PER_PAGE
+        page_end = page_start + SEARCH_RESULTS_PER_PAGE
+        table = self.query_one("#results-table", DataTable)
+
+        for index in range(
+            max(first_new_index, page_start), min(page_end, len(self._results))
+        ):
+            self._add_listing_row(table, self._results.listings[index])
+            self._page_rows.append(index)
+
+    def finish_results(self) -> None:
+        if not self._results:
+            self._render_results([])
+
+    def get_result_count(self) -> int:
+        return len(self._results)
+
+    def _reset_results(self) -> None:
+        # Label ids are per result set, so rarity/condition filters reset too.
+        self._results.clear()
+        self._visible = None
+        self._page_rows = []
+        self._page_index = 0
+        self._rarity_filter = None
+        self._condition_filter = None
+        self._more_results = None
+
+    def set_more_results(self, query: str, next_page: int | None) -> None:
+        """Remembers which site search page to fetch when paging past the end."""
+        self._more_results = None if next_page is None else (query, next_page)
+
+    def more_results(self) -> tuple[str, int] | None:
+        """``(query, page)`` of the next site search page, if there is one."""
+        return self._more_results
+
+    def _has_view_options(self) -> bool:
+        return (
+            self._sort_key is not None
+            or self._in_stock_only
+            or self._rarity_filter is not None
+            or self._condition_filter is not None
+        )
+
+    def _visible_rows(self) -> list[int] | range:
+        if not self._has_view_options():
+            return range(len(self._results))
+
+        if self._visible is None:
+            self._visible = self._results.select(
+                sort_key=self._sort_key,
+                descending=self._sort_descending,
+                in_stock_only=self._in_stock_only,
+                rarity_id=self._rarity_filter,
+                condition_id=self._condition_filter,
+            )
+
+        return self._visible
+
+    def _current_page_rows(self) -> list[int]:
         start = self._page_index * SEARCH_RESULTS_PER_PAGE
+        return list(self._visible_rows()[start : start + SEARCH_RESULTS_PER_PAGE])
+
+    def _render_current_page(self) -> None:
+        visible = self._visible_rows()
+
+        if not visible:
+            self._page_rows = []
+            placeholder = "No matching listings" if self._results else "No results"
+            self._render_results([], placeholder=placeholder)
+            return
 
-        if start >= len(self._all_listings):
+        if self._page_index * SEARCH_RESULTS_PER_PAGE >= len(visible):
             self._page_index = 0
-            start = 0
 
-        end = start + SEARCH_RESULTS_PER_PAGE
-        page_listings = self._all_listings[start:end]
-        self._render_results(page_listings)
+        with timed("ui.render_page"):
+            self._page_rows = self._current_page_rows()
+            listings = self._results.listings
+            self._render_results([listings[index] for index in self._page_rows])
 
-    def _render_results(self, listings: list[CardListing]) -> None:
+    def _apply_view_change(self) -> str:
+        self._visible = None
+        self._page_index = 0
+        self._render_current_page()
+        return self.describe_view()
+
+    def cycle_price_sort(self) -> str:
+        """Cycles price sorting: cheapest first, most expensive first, off."""
+        if self._sort_key != "price":
+            self._sort_key, self._sort_descending = "price", False
+        elif not self._sort_descending:
+            self._sort_descending = True
+        else:
+            self._sort_key = None
+
+        return self._apply_view_change()
+
+    def cycle_stock_sort(self) -> str:
+        """Cycles stock sorting: most stock first, least stock first, off."""
+        if self._sort_key != "stock":
+            self._sort_key, self._sort_descending = "stock", True
+        elif self._sort_descending:
+            self._sort_descending = False
+        else:
+            self._sort_key = None
+
+        return self._apply_view_change()
+
+    def toggle_in_stock_filter(self) -> str:
+        self._in_stock_only = not self._in_stock_only
+        return self._apply_view_change()
+
+    def cycle_rarity_filter(self) -> str:
+        self._rarity_filter = _next_label_id(
+            self._rarity_filter, len(self._results.rarities)
+        )
+        return self._apply_view_change()
+
+    def cycle_condition_filter(self) -> str:
+        self._condition_filter = _next_label_id(
+            self._condition_filter, len(self._results.conditions)
+        )
+        return self._apply_view_change()
+
+    def describe_view(self) -> str:
+        parts: list[str] = []
+
+        if self._sort_key is not None:
+            direction = "high → low" if self._sort_descending else "low → high"
+            parts.append(f"Sort: {self._sort_key} {direction}")
+
+        if self._rarity_filter is not None:
+            parts.append(f"Rarity: {self._results.rarities[self._rarity_filter]}")
+
+        if self._condition_filter is not None:
+            condition = self._results.conditions[self._condition_filter]
+            parts.append(f"Condition: {condition}")
+
+        if self._in_stock_only:
+            parts.append("In stock only")
+
+        if not parts:
+            return f"All {len(self._results)} listings"
+
+        return f"{' · '.join(parts)} ({len(self._visible_rows())} shown)"
+
+    def _render_results(
+        self, listings: list[CardListing], placeholder: str = "No results"
+    ) -> None:
         table = self.query_one("#results-table", DataTable)
         table.clear(columns=False)
         self._row_to_listing.clear()
@@ -101,25 +268,11 @@ class SearchScreen(Container):
         self._cancel_added_highlight_timer()
 
         if not listings:
-            table.add_row("No results", "", "", "", "", "", key="__no-results__")
+            table.add_row(placeholder, "", "", "", "", "", key="__no-results__")
             return
 
-        used_row_keys: set[str] = set()
-
         for listing in listings:
-            base_key = self._make_row_key(listing)
-            row_key = base_key
-            suffix = 1
-
-            while row_key in used_row_keys:
-                suffix += 1
-                row_key = f"{base_key}#{suffix}"
-
-            used_row_keys.add(row_key)
-            self._row_to_listing[row_key] = listing
-
-            cells = self._row_cell_renderables(row_key, listing)
-            table.add_row(*cells, key=row_key)
+            self._add_listing_row(table, listing)
 
         table.focus()
 
@@ -128,12 +281,28 @@ class SearchScreen(Container):
 
         self._render_working_collection()
 
+    def _add_listing_row(self, table: DataTable, listing: CardListing) -> None:
+        base_key = self._make_row_key(listing)
+        row_key = base_key
+        suffix = 1
+
+        while row_key in self._row_to_listing:
+            suffix += 1
+            row_key = f"{base_key}#{suffix}"
+
+        self._row_to_listing[row_key] = listing
+
+        cells = self._row_cell_renderables(row_key, listing)
+        table.add_row(*cells, key=row_key)
+
     def next_page(self) -> bool:
-        if not self._all_listings:
+        visible_count = len(self._visible_rows())
+
+        if not visible_count:
             return False
 
         total_pages = (
-            len(self._all_listings) + SEARCH_RESULTS_PER_PAGE - 1
+            visible_count + SEARCH_RESULTS_PER_PAGE - 1
         ) // SEARCH_RESULTS_PER_PAGE
 
         if self._page_index + 1 >= total_pages:
@@ -144,7 +313,7 @@ class SearchScreen(Container):
         return True
 
     def previous_page(self) -> bool:
-        if not self._all_listings:
+        if not self._visible_rows():
             return False
 
         if self._page_index == 0:
@@ -155,11 +324,13 @@ class SearchScreen(Container):
         return True
 
     def get_pagination_state(self) -> tuple[int, int] | None:
-        if not self._all_listings:
+        visible_count = len(self._visible_rows())
+
+        if not visible_count:
             return None
 
         total_pages = (
-            len(self._all_listings) + SEARCH_RESULTS_PER_PAGE - 1
+            visible_count + SEARCH_RESULTS_PER_PAGE - 1
         ) // SEARCH_RESULTS_PER_PAGE
 
         if total_pages <= 1:
@@ -196,7 +367,7 @@ class SearchScreen(Container):
         return (
             self._format_display_name(row_key, listing),
             listing.code,
-            listing.price,
+            format_price(listing.price_cents),
             listing.rarity,
             listing.condition,
             str(listing.stock),
@@ -344,8 +515,7 @@ class SearchScreen(Container):
             self._selected_row_keys.clear()
             return 0
 
-        items = make_collection_items_from_listings(listings, qty=1)
-        add_items(items)
+        add_items_from_listings(listings, qty=1)
 
         self._selected_row_keys.clear()
 
@@ -355,7 +525,7 @@ class SearchScreen(Container):
         self._added_highlight_timer = self.set_timer(
             ADDED_HIGHLIGHT_TTL, self._clear_added_highlight
         )
-        return len(items)
+        return len(listings)
 
     def get_selected_working_item_key(self) -> str | None:
         option_list = self.query_one("#working-collection-list", OptionList)
@@ -431,3 +601,13 @@ class SearchScreen(Container):
             return False
 
         return remove_item(key)
+
+
+def _next_label_id(current: int | None, label_count: int) -> int | None:
+    if current is None:
+        return 0 if label_count else None
+
+    if current + 1 < label_count:
+        return current + 1
+
+    return None
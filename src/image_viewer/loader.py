@@ -1,6 +1,9 @@
 import asyncio
+from collections.abc import Awaitable, Callable
 
-from httpx import AsyncClient, HTTPStatusError, RequestError, Timeout
+from httpx import AsyncClient, HTTPStatusError, RequestError, TimeoutException
+
+from src.services.http_transport import get_http_client
 
 
 DEFAULT_USER_AGENT = "card-image-viewer/1.0"
@@ -20,11 +23,13 @@ class HttpImageLoader:
         retries: int = 2,
         max_bytes: int = 10 * 1024 * 1024,
         user_agent: str = DEFAULT_USER_AGENT,
+        get_client: Callable[[], Awaitable[AsyncClient]] = get_http_client,
     ) -> None:
         self.timeout_seconds = timeout_seconds
         self.retries = retries
         self.max_bytes = max_bytes
         self.user_agent = user_agent
+        self._get_client = get_client
 
     async def fetch(self, url: str) -> bytes:
         if not url.strip():
@@ -33,22 +38,23 @@ class HttpImageLoader:
         headers = {"User-Agent": self.user_agent}
         attempts = self.retries + 1
 
-        async with AsyncClient(timeout=self.timeout_seconds, follow_redirects=True) as client:
-            for attempt in range(attempts):
-                try:
-                    return await self._fetch_once(client, url, headers)
-                except (Timeout, RequestError):
-                    if attempt == attempts - 1:
-                        raise ImageLoadError("Network timeout while fetching image")
-                except HTTPStatusError as error:
-                    status = error.response.status_code
-                    retriable = status >= 500
+        client = await self._get_client()
+
+        for attempt in range(attempts):
+            try:
+                return await self._fetch_once(client, url, headers)
+            except (TimeoutException, RequestError):
+                if attempt == attempts - 1:
+                    raise ImageLoadError("Network timeout while fetching image")
+            except HTTPStatusError as error:
+                status = error.response.status_code
+                retriable = status >= 500
 
-                    if not retriable or attempt == attempts - 1:
-                        raise ImageLoadError(f"Image request failed with status {status}")
+                if not retriable or attempt == attempts - 1:
+                    raise ImageLoadError(f"Image request failed with status {status}")
 
-                backoff_seconds = 0.2 * (2**attempt)
-                await asyncio.sleep(backoff_seconds)
+            backoff_seconds = 0.2 * (2**attempt)
+            await asyncio.sleep(backoff_seconds)
 
         raise ImageLoadError("Failed to fetch image")
 
@@ -58,7 +64,9 @@ class HttpImageLoader:
         url: str,
         headers: dict[str, str],
     ) -> bytes:
-        async with client.stream("GET", url, headers=headers) as response:
+        async with client.stream(
+            "GET", url, headers=headers, timeout=self.timeout_seconds
+        ) as response:
             response.raise_for_status()
 
             content_type = response.headers.get("content-type", "").lower()
@@ -1,28 +1,54 @@
+import sys
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CardListing:
     name: str
     set: str
     code: str
-    price: str
+    price_cents: int | None
     rarity: str
     condition: str
     stock: int = 0
 
+    def __post_init__(self) -> None:
+        # A handful of distinct sets/rarities/conditions repeat across every
+        # listing; interning makes them share one string each.
+        object.__setattr__(self, "set", sys.intern(self.set))
+        object.__setattr__(self, "rarity", sys.intern(self.rarity))
+        object.__setattr__(self, "condition", sys.intern(self.condition))
 
-@dataclass
+
+@dataclass(slots=True)
 class CollectionItem:
     name: str
     set: str
     code: str
     qty: int
-    price: str
+    price_cents: int | None
     rarity: str
     condition: str
     stock: int
 
+    def __post_init__(self) -> None:
+        self.set = sys.intern(self.set)
+        self.rarity = sys.intern(self.rarity)
+        self.condition = sys.intern(self.condition)
+
     @property
     def key(self) -> str:
         return f"{self.code}:{self.condition}"
+
+    @classmethod
+    def from_listing(cls, listing: CardListing, qty: int) -> "CollectionItem":
+        return cls(
+            listing.name,
+            listing.set,
+            listing.code,
+            qty,
+            listing.price_cents,
+            listing.rarity,
+            listing.condition,
+            listing.stock,
+        )
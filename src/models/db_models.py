@@ -1,4 +1,5 @@
-from collections.abc import AsyncIterator
+import sys
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 
@@ -6,9 +7,10 @@ from aiosqlite import connect
 from aiosqlite.core import Connection
 
 from src.utils.app_dirs import get_db_path
+from src.utils.utils import parse_price_cents
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionItem:
     id: int | None = None
     collection_id: int = 0
@@ -16,13 +18,18 @@ class CollectionItem:
     card_name: str = ""
     card_set: str = ""
     card_code: str = ""
-    card_price: str = ""
+    card_price_cents: int | None = None
     card_rarity: str = ""
     card_condition: str = ""
     card_quantity: int = 0
 
+    def __post_init__(self) -> None:
+        self.card_set = sys.intern(self.card_set)
+        self.card_rarity = sys.intern(self.card_rarity)
+        self.card_condition = sys.intern(self.card_condition)
 
-@dataclass(init=True)
+
+@dataclass(init=True, slots=True)
 class Collection:
     id: int
     name: str
@@ -43,9 +50,13 @@ COLLECTION_ITEMS_SCHEMA = (
     "CREATE TABLE IF NOT EXISTS collection_items ("
     "id INTEGER PRIMARY KEY AUTOINCREMENT, collection_id INTEGER NOT NULL, "
     "card_id INTEGER, card_name TEXT, card_set TEXT, card_code TEXT, "
-    "card_price TEXT, card_rarity TEXT, card_condition TEXT, quantity INTEGER NOT NULL, "
+    "card_price_cents INTEGER, card_rarity TEXT, card_condition TEXT, quantity INTEGER NOT NULL, "
     "FOREIGN KEY (collection_id) REFERENCES collections(id))"
 )
+COLLECTION_ITEM_COLUMNS = (
+    "id, collection_id, card_id, card_name, card_set, card_code, "
+    "card_price_cents, card_rarity, card_condition, quantity"
+)
 
 
 async def init_db() -> None:
@@ -53,9 +64,39 @@ async def init_db() -> None:
     async with connect(str(db_path)) as db:
         await db.execute(COLLECTIONS_SCHEMA)
         await db.execute(COLLECTION_ITEMS_SCHEMA)
+        await _migrate_price_cents(db)
         await db.commit()
 
 
+async def _migrate_price_cents(db: Connection) -> None:
+    # Databases from before integer prices have a "$4.99" card_price column;
+    # add card_price_cents next to it and backfill it once.
+    async with db.execute("PRAGMA table_info(collection_items)") as cursor:
+        columns = {row[1] for row in await cursor.fetchall()}
+
+    if "card_price_cents" in columns:
+        return
+
+    await db.execute("ALTER TABLE collection_items ADD COLUMN card_price_cents INTEGER")
+
+    if "card_price" not in columns:
+        return
+
+    async with db.execute(
+        "SELECT id, card_price FROM collection_items WHERE card_price IS NOT NULL"
+    ) as cursor:
+        rows = await cursor.fetchall()
+
+    await db.executemany(
+        "UPDATE collection_items SET card_price_cents = ? WHERE id = ?",
+        [(parse_price_cents(card_price), item_id) for item_id, card_price in rows],
+    )
+
+
+def _row_to_collection_item(row) -> CollectionItem:
+    return CollectionItem(*row)
+
+
 async def get_collection(collection_id: int) -> Collection | None:
     async with session() as db:
         async with db.execute(
@@ -80,37 +121,25 @@ async def get_collections() -> list[Collection]:
 async def get_collection_items(collection_id: int) -> list[CollectionItem]:
     async with session() as db:
         async with db.execute(
-            "SELECT * FROM collection_items WHERE collection_id = ?", (collection_id,)
+            f"SELECT {COLLECTION_ITEM_COLUMNS} FROM collection_items "
+            "WHERE collection_id = ?",
+            (collection_id,),
         ) as cursor:
             rows = await cursor.fetchall()
-            return [
-                CollectionItem(
-                    row[0],
-                    row[1],
-                    row[2],
-                    row[3],
-                    row[4],
-                    row[5],
-                    row[6],
-                    row[7],
-                    row[8],
-                    row[9],
-                )
-                for row in rows
-            ]
+            return [_row_to_collection_item(row) for row in rows]
 
 
 async def create_collection_item(collection_item: CollectionItem) -> CollectionItem:
     async with session() as db:
         await db.execute(
-            "INSERT INTO collection_items (collection_id, card_id, card_name, card_set, card_code, card_price, card_rarity, card_condition, quantity) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            "INSERT INTO collection_items (collection_id, card_id, card_name, card_set, card_code, card_price_cents, card_rarity, card_condition, quantity) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
             (
                 collection_item.collection_id,
                 collection_item.card_id,
                 collection_item.card_name,
                 collection_item.card_set,
                 collection_item.card_code,
-                collection_item.card_price,
+                collection_item.card_price_cents,
                 collection_item.card_rarity,
                 collection_item.card_condition,
                 collection_item.card_quantity,
@@ -128,7 +157,7 @@ async def create_collection_item(collection_item: CollectionItem) -> CollectionI
             collection_item.card_name,
             collection_item.card_set,
             collection_item.card_code,
-            collection_item.card_price,
+            collection_item.card_price_cents,
             collection_item.card_rarity,
             collection_item.card_condition,
             collection_item.card_quantity,
@@ -162,50 +191,42 @@ async def delete_collection_items_by_collection_id(collection_id: int) -> None:
 
 
 async def create_many_collection_items(
-    collection_id: int, items: list[CollectionItem]
+    collection_id: int, items: Iterable[CollectionItem], fetch: bool = True
 ) -> list[CollectionItem]:
+    """Inserts ``items`` and, unless ``fetch`` is False, returns the stored rows."""
     async with session() as db:
         cursor = await db.execute("SELECT MAX(id) FROM collection_items")
         old_max_id = await cursor.fetchone()
         await db.executemany(
-            "INSERT INTO collection_items (collection_id, card_id, card_name, card_set, card_code, card_price, card_rarity, card_condition, quantity) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            [
+            "INSERT INTO collection_items (collection_id, card_id, card_name, card_set, card_code, card_price_cents, card_rarity, card_condition, quantity) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
                 (
                     collection_id,
                     item.card_id,
                     item.card_name,
                     item.card_set,
                     item.card_code,
-                    item.card_price,
+                    item.card_price_cents,
                     item.card_rarity,
                     item.card_condition,
                     item.card_quantity,
                 )
                 for item in items
-            ],
+            ),
         )
         await db.commit()
+
+        if not fetch:
+            return []
+
         prev_max = old_max_id[0] if old_max_id and old_max_id[0] is not None else 0
         async with db.execute(
-            "SELECT * FROM collection_items WHERE id > ?", (prev_max,)
+            f"SELECT {COLLECTION_ITEM_COLUMNS} FROM collection_items WHERE id > ?",
+            (prev_max,),
         ) as cursor:
             rows = await cursor.fetchall()
 
-        return [
-            CollectionItem(
-                row[0],
-                row[1],
-                row[2],
-                row[3],
-                row[4],
-                row[5],
-                row[6],
-                row[7],
-                row[8],
-                row[9],
-            )
-            for row in rows
-        ]
+        return [_row_to_collection_item(row) for row in rows]
 
 
 async def create_collection(name: str, items: list[CollectionItem]) -> Collection:
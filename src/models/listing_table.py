@@ -0,0 +1,142 @@
+from array import array
+from itertools import compress
+
+from src.models.cards import CardListing
+
+
+SORT_KEYS = ("price", "stock")
+MISSING_PRICE = -1
+
+
+class ListingTable:
+    """Column-oriented result set that sorts and filters by row index.
+
+    Prices, stock and label ids live in typed arrays; rarity and condition
+    strings are stored once and referenced by id. Sort orders are computed
+    on first use and cached until more rows arrive, and filters walk those
+    orders with C-level iterators instead of comparing listing objects.
+    """
+
+    def __init__(self) -> None:
+        self.listings: list[CardListing] = []
+        self.names: list[str] = []
+        self.codes: list[str] = []
+        self.price_cents = array("q")
+        self.stock = array("q")
+        self.rarity_ids = array("H")
+        self.condition_ids = array("H")
+        self.rarities: list[str] = []
+        self.conditions: list[str] = []
+        self._rarity_index: dict[str, int] = {}
+        self._condition_index: dict[str, int] = {}
+        self._orders: dict[tuple[str, bool], array] = {}
+
+    def __len__(self) -> int:
+        return len(self.listings)
+
+    def clear(self) -> None:
+        for column in (
+            self.listings,
+            self.names,
+            self.codes,
+            self.rarities,
+            self.conditions,
+        ):
+            column.clear()
+
+        for values in (
+            self.price_cents,
+            self.stock,
+            self.rarity_ids,
+            self.condition_ids,
+        ):
+            del values[:]
+
+        self._rarity_index.clear()
+        self._condition_index.clear()
+        self._orders.clear()
+
+    def extend(self, listings: list[CardListing]) -> None:
+        if not listings:
+            return
+
+        for listing in listings:
+            self.listings.append(listing)
+            self.names.append(listing.name)
+            self.codes.append(listing.code)
+            self.price_cents.append(
+                MISSING_PRICE if listing.price_cents is None else listing.price_cents
+            )
+            self.stock.append(listing.stock)
+            self.rarity_ids.append(
+                _label_id(listing.rarity, self.rarities, self._rarity_index)
+            )
+            self.condition_ids.append(
+                _label_id(listing.condition, self.conditions, self._condition_index)
+            )
+
+        self._orders.clear()
+
+    def order(self, sort_key: str, descending: bool = False) -> array:
+        """Row indices sorted by ``sort_key``; listings without a price go last."""
+        cached = self._orders.get((sort_key, descending))
+
+        if cached is not None:
+            return cached
+
+        if sort_key not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {sort_key}")
+
+        column = self.price_cents if sort_key == "price" else self.stock
+        indices = sorted(
+            range(len(self.listings)), key=column.__getitem__, reverse=descending
+        )
+
+        if sort_key == "price" and not descending:
+            missing = self.price_cents.count(MISSING_PRICE)
+            indices = indices[missing:] + indices[:missing]
+
+        order = array("L", indices)
+        self._orders[(sort_key, descending)] = order
+
+        return order
+
+    def select(
+        self,
+        sort_key: str | None = None,
+        descending: bool = False,
+        in_stock_only: bool = False,
+        rarity_id: int | None = None,
+        condition_id: int | None = None,
+    ) -> list[int]:
+        indices = (
+            self.order(sort_key, descending)
+            if sort_key is not None
+            else range(len(self.listings))
+        )
+
+        if in_stock_only:
+            indices = list(compress(indices, map(self.stock.__getitem__, indices)))
+
+        if rarity_id is not None:
+            indices = _matching(indices, self.rarity_ids, rarity_id)
+
+        if condition_id is not None:
+            indices = _matching(indices, self.condition_ids, condition_id)
+
+        return list(indices)
+
+
+def _label_id(label: str, labels: list[str], index: dict[str, int]) -> int:
+    label_id = index.get(label)
+
+    if label_id is None:
+        label_id = len(labels)
+        labels.append(label)
+        index[label] = label_id
+
+    return label_id
+
+
+def _matching(indices, column: array, value: int) -> list[int]:
+    return list(compress(indices, map(value.__eq__, map(column.__getitem__, indices))))
@@ -1,2 +1,2 @@
-from src.services.scraper import scrape_cards
+from src.services.scraper import iter_scrape_cards, scrape_cards
 from src.services.ygopro_api import fuzzy_search, get_card_by_id
@@ -0,0 +1,122 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit driven by response latency and overload signals.
+
+    Every healthy response grows the limit by ``1 / limit`` (about +1 per
+    round of ``limit`` requests) while latency stays within
+    ``latency_tolerance`` times the best latency seen. Overload signals
+    (429, 5xx, timeouts) multiply the limit by ``decrease_factor``, at most
+    once per ``decrease_cooldown_seconds`` so one burst of failures counts
+    as a single congestion event.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 3.0,
+        decrease_cooldown_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min <= initial <= max")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_use = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._best_latency: float | None = None
+        self._last_decrease_at: float | None = None
+        self.successes = 0
+        self.overloads = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        return {
+            "limit": self.limit,
+            "in_use": self._in_use,
+            "waiting": len(self._waiters),
+            "best_latency_seconds": self._best_latency,
+            "successes": self.successes,
+            "overloads": self.overloads,
+        }
+
+    async def acquire(self) -> None:
+        if self._in_use < self.limit and not self._waiters:
+            self._in_use += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+            raise
+
+    def release(self) -> None:
+        self._in_use -= 1
+        self._wake_waiters()
+
+    def on_success(self, latency_seconds: float) -> None:
+        self.successes += 1
+
+        if self._best_latency is None or latency_seconds < self._best_latency:
+            self._best_latency = latency_seconds
+
+        if latency_seconds > self._best_latency * self.latency_tolerance:
+            return
+
+        self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+        self._wake_waiters()
+
+    def on_overload(self) -> None:
+        self.overloads += 1
+        now = self._clock()
+
+        if (
+            self._last_decrease_at is not None
+            and now - self._last_decrease_at < self.decrease_cooldown_seconds
+        ):
+            return
+
+        self._last_decrease_at = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_use < self.limit:
+            waiter = self._waiters.popleft()
+
+            if waiter.done():
+                continue
+
+            self._in_use += 1
+            waiter.set_result(None)
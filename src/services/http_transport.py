@@ -0,0 +1,56 @@
+from importlib.util import find_spec
+
+from httpx import AsyncClient, AsyncHTTPTransport, Limits, Timeout
+
+from src.utils.constants import REQUEST_TIMEOUT_SECONDS, USER_AGENT
+
+
+HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 40
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+HTTP_CONNECT_RETRIES = 2
+HTTP2_AVAILABLE = find_spec("h2") is not None
+USE_HTTP2 = HTTP2_AVAILABLE
+
+_HTTP_CLIENT: AsyncClient | None = None
+
+
+async def get_http_client() -> AsyncClient:
+    """Returns the process-wide client shared by the scraper, YGOPRO and images.
+
+    The connection pool keeps separate keep-alive connections per origin, so
+    each host pays its TCP/TLS handshake once and reuses it afterwards.
+    Connect failures are retried by the transport; callers pass their own
+    headers or timeout per request when they need something different.
+    """
+    global _HTTP_CLIENT
+
+    if _HTTP_CLIENT is None:
+        transport = AsyncHTTPTransport(
+            limits=Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=USE_HTTP2 and HTTP2_AVAILABLE,
+            retries=HTTP_CONNECT_RETRIES,
+        )
+        _HTTP_CLIENT = AsyncClient(
+            transport=transport,
+            headers={"User-Agent": USER_AGENT},
+            timeout=Timeout(
+                REQUEST_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS
+            ),
+            follow_redirects=True,
+        )
+
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    global _HTTP_CLIENT
+
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
@@ -0,0 +1,304 @@
+import os
+import socket
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from aiosqlite import connect
+from aiosqlite.core import Connection
+
+from src.models.cards import CardListing
+from src.services.listing_store import deserialize_listings, serialize_listings
+from src.utils.app_dirs import get_job_queue_path
+
+
+JOB_STATES = ("pending", "in_flight", "done", "failed")
+JOB_LEASE_SECONDS = 120.0
+JOB_MAX_ATTEMPTS = 3
+JOB_BUSY_TIMEOUT_SECONDS = 30.0
+
+SCRAPE_JOBS_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS scrape_jobs ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE, "
+    "created_at REAL NOT NULL)"
+)
+SCRAPE_TASKS_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS scrape_tasks ("
+    "job_id INTEGER NOT NULL, card_name TEXT NOT NULL, "
+    "state TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+    "lease_owner TEXT, lease_expires_at REAL, error TEXT, payload TEXT, "
+    "updated_at REAL NOT NULL, "
+    "PRIMARY KEY (job_id, card_name), "
+    "FOREIGN KEY (job_id) REFERENCES scrape_jobs(id))"
+)
+SCRAPE_TASKS_STATE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS scrape_tasks_state "
+    "ON scrape_tasks (job_id, state, lease_expires_at)"
+)
+
+_SCHEMA_READY = False
+
+
+class JobQueueError(Exception):
+    """Raised for unknown jobs or invalid queue operations."""
+
+
+@dataclass
+class TaskResult:
+    card_name: str
+    listings: list[CardListing] | None = None
+    error: str | None = None
+
+
+def new_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@asynccontextmanager
+async def queue_session() -> AsyncIterator[Connection]:
+    """Opens the queue in autocommit mode so callers control transactions.
+
+    WAL lets readers run while one worker writes, and the busy timeout makes
+    concurrent ``BEGIN IMMEDIATE`` claims from other processes wait instead
+    of failing.
+    """
+    global _SCHEMA_READY
+
+    async with connect(
+        str(get_job_queue_path()),
+        timeout=JOB_BUSY_TIMEOUT_SECONDS,
+        isolation_level=None,
+    ) as db:
+        if not _SCHEMA_READY:
+            await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute(SCRAPE_JOBS_SCHEMA)
+            await db.execute(SCRAPE_TASKS_SCHEMA)
+            await db.execute(SCRAPE_TASKS_STATE_INDEX)
+            _SCHEMA_READY = True
+
+        yield db
+
+
+@asynccontextmanager
+async def _immediate(db: Connection) -> AsyncIterator[Connection]:
+    # Takes the write lock up front so two workers can't claim the same rows.
+    await db.execute("BEGIN IMMEDIATE")
+
+    try:
+        yield db
+    except BaseException:
+        await db.execute("ROLLBACK")
+        raise
+
+    await db.execute("COMMIT")
+
+
+async def _job_id(db: Connection, name: str) -> int:
+    async with db.execute(
+        "SELECT id FROM scrape_jobs WHERE name = ?", (name,)
+    ) as cursor:
+        row = await cursor.fetchone()
+
+    if row is None:
+        raise JobQueueError(f"Unknown job: {name}")
+
+    return row[0]
+
+
+async def enqueue_cards(name: str, card_names: list[str]) -> int:
+    """Creates job ``name`` if needed and queues the cards it does not have yet.
+
+    Returns how many cards were added.
+    """
+    now = time.time()
+
+    async with queue_session() as db, _immediate(db):
+        await db.execute(
+            "INSERT OR IGNORE INTO scrape_jobs (name, created_at) VALUES (?, ?)",
+            (name, now),
+        )
+        job_id = await _job_id(db, name)
+        before = db.total_changes
+        await db.executemany(
+            "INSERT OR IGNORE INTO scrape_tasks (job_id, card_name, updated_at) "
+            "VALUES (?, ?, ?)",
+            [(job_id, card_name, now) for card_name in dict.fromkeys(card_names)],
+        )
+
+        return db.total_changes - before
+
+
+async def claim_tasks(
+    name: str,
+    worker_id: str,
+    limit: int,
+    lease_seconds: float = JOB_LEASE_SECONDS,
+) -> list[str]:
+    """Leases up to ``limit`` pending cards, or in-flight ones whose lease ran out."""
+    now = time.time()
+
+    async with queue_session() as db, _immediate(db):
+        job_id = await _job_id(db, name)
+
+        async with db.execute(
+            "SELECT card_name FROM scrape_tasks WHERE job_id = ? AND ("
+            "state = 'pending' OR (state = 'in_flight' AND lease_expires_at <= ?)) "
+            "ORDER BY rowid LIMIT ?",
+            (job_id, now, limit),
+        ) as cursor:
+            card_names = [row[0] for row in await cursor.fetchall()]
+
+        await db.executemany(
+            "UPDATE scrape_tasks SET state = 'in_flight', lease_owner = ?, "
+            "lease_expires_at = ?, attempts = attempts + 1, updated_at = ? "
+            "WHERE job_id = ? AND card_name = ?",
+            [
+                (worker_id, now + lease_seconds, now, job_id, card_name)
+                for card_name in card_names
+            ],
+        )
+
+    return card_names
+
+
+async def renew_leases(
+    name: str,
+    worker_id: str,
+    card_names: list[str],
+    lease_seconds: float = JOB_LEASE_SECONDS,
+) -> int:
+    """Extends the leases ``worker_id`` still holds on ``card_names``.
+
+    Returns how many were renewed; cards another worker has taken over are
+    left with that worker.
+    """
+    if not card_names:
+        return 0
+
+    now = time.time()
+
+    async with queue_session() as db, _immediate(db):
+        job_id = await _job_id(db, name)
+        before = db.total_changes
+        await db.executemany(
+            "UPDATE scrape_tasks SET lease_expires_at = ?, updated_at = ? "
+            "WHERE job_id = ? AND card_name = ? AND lease_owner = ? "
+            "AND state = 'in_flight'",
+            [
+                (now + lease_seconds, now, job_id, card_name, worker_id)
+                for card_name in card_names
+            ],
+        )
+
+        return db.total_changes - before
+
+
+async def complete_tasks(
+    name: str,
+    worker_id: str,
+    results: list[TaskResult],
+    max_attempts: int = JOB_MAX_ATTEMPTS,
+) -> None:
+    """Checkpoints a batch of results in one transaction.
+
+    Only rows still leased to ``worker_id`` are updated, so a worker whose
+    lease expired cannot overwrite the result of the worker that took over.
+    Failed cards go back to pending until they reach ``max_attempts``.
+    """
+    if not results:
+        return
+
+    now = time.time()
+
+    async with queue_session() as db, _immediate(db):
+        job_id = await _job_id(db, name)
+        await db.executemany(
+            "UPDATE scrape_tasks SET state = 'done', payload = ?, error = NULL, "
+            "lease_owner = NULL, lease_expires_at = NULL, updated_at = ? "
+            "WHERE job_id = ? AND card_name = ? AND lease_owner = ?",
+            [
+                (
+                    serialize_listings(result.listings),
+                    now,
+                    job_id,
+                    result.card_name,
+                    worker_id,
+                )
+                for result in results
+                if result.listings is not None
+            ],
+        )
+        await db.executemany(
+            "UPDATE scrape_tasks SET "
+            "state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "error = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ? "
+            "WHERE job_id = ? AND card_name = ? AND lease_owner = ?",
+            [
+                (max_attempts, result.error, now, job_id, result.card_name, worker_id)
+                for result in results
+                if result.listings is None
+            ],
+        )
+
+
+async def release_leases(name: str) -> int:
+    """Returns every in-flight card to pending, e.g. after a crashed run.
+
+    Only safe when no other worker is draining the job.
+    """
+    async with queue_session() as db, _immediate(db):
+        job_id = await _job_id(db, name)
+        cursor = await db.execute(
+            "UPDATE scrape_tasks SET state = 'pending', lease_owner = NULL, "
+            "lease_expires_at = NULL, updated_at = ? "
+            "WHERE job_id = ? AND state = 'in_flight'",
+            (time.time(), job_id),
+        )
+
+        return cursor.rowcount
+
+
+async def retry_failed(name: str) -> int:
+    async with queue_session() as db, _immediate(db):
+        job_id = await _job_id(db, name)
+        cursor = await db.execute(
+            "UPDATE scrape_tasks SET state = 'pending', attempts = 0, error = NULL, "
+            "updated_at = ? WHERE job_id = ? AND state = 'failed'",
+            (time.time(), job_id),
+        )
+
+        return cursor.rowcount
+
+
+async def job_counts(name: str) -> dict[str, int]:
+    counts = dict.fromkeys(JOB_STATES, 0)
+
+    async with queue_session() as db:
+        job_id = await _job_id(db, name)
+
+        async with db.execute(
+            "SELECT state, COUNT(*) FROM scrape_tasks WHERE job_id = ? GROUP BY state",
+            (job_id,),
+        ) as cursor:
+            for state, count in await cursor.fetchall():
+                counts[state] = count
+
+    return counts
+
+
+async def iter_job_results(
+    name: str,
+) -> AsyncIterator[tuple[str, list[CardListing]]]:
+    """Yields ``(card_name, listings)`` for finished cards in queue order."""
+    async with queue_session() as db:
+        job_id = await _job_id(db, name)
+
+        async with db.execute(
+            "SELECT card_name, payload FROM scrape_tasks "
+            "WHERE job_id = ? AND state = 'done' ORDER BY rowid",
+            (job_id,),
+        ) as cursor:
+            async for card_name, payload in cursor:
+                yield card_name, deserialize_listings(payload)
@@ -0,0 +1,403 @@
+import json
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from aiosqlite import connect
+from aiosqlite.core import Connection
+
+from src.models.cards import CardListing
+from src.utils.app_dirs import get_listing_cache_path
+
+
+SQLITE_MAX_PARAMS = 500
+STORE_SCHEMA_VERSION = 1
+
+CARD_LISTINGS_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS card_listings ("
+    "slug TEXT PRIMARY KEY, fetched_at REAL NOT NULL, payload TEXT NOT NULL, "
+    "digest TEXT, parser_version INTEGER)"
+)
+PAGE_VALIDATORS_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS page_validators ("
+    "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT)"
+)
+MISSING_PAGES_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS missing_pages ("
+    "slug TEXT PRIMARY KEY, checked_at REAL NOT NULL)"
+)
+CARD_ALIASES_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS card_aliases ("
+    "alias TEXT PRIMARY KEY, slug TEXT NOT NULL, url TEXT NOT NULL, "
+    "resolved_at REAL NOT NULL)"
+)
+STORE_TABLES = ("card_listings", "page_validators", "missing_pages", "card_aliases")
+
+_SCHEMA_READY = False
+
+
+@asynccontextmanager
+async def store_session() -> AsyncIterator[Connection]:
+    global _SCHEMA_READY
+
+    async with connect(str(get_listing_cache_path())) as db:
+        if not _SCHEMA_READY:
+            await _ensure_schema(db)
+            _SCHEMA_READY = True
+
+        yield db
+
+
+async def _ensure_schema(db: Connection) -> None:
+    # The store only holds re-fetchable data, so a version bump simply drops it.
+    async with db.execute("PRAGMA user_version") as cursor:
+        row = await cursor.fetchone()
+
+    if row is None or row[0] != STORE_SCHEMA_VERSION:
+        for table in STORE_TABLES:
+            await db.execute(f"DROP TABLE IF EXISTS {table}")
+
+        await db.execute(f"PRAGMA user_version = {STORE_SCHEMA_VERSION}")
+
+    await db.execute(CARD_LISTINGS_SCHEMA)
+    await db.execute(PAGE_VALIDATORS_SCHEMA)
+    await db.execute(MISSING_PAGES_SCHEMA)
+    await db.execute(CARD_ALIASES_SCHEMA)
+    await db.commit()
+
+
+def _batched(values: list[str]) -> list[list[str]]:
+    unique_values = list(dict.fromkeys(values))
+
+    return [
+        unique_values[index : index + SQLITE_MAX_PARAMS]
+        for index in range(0, len(unique_values), SQLITE_MAX_PARAMS)
+    ]
+
+
+async def _delete_older_than(
+    db: Connection, table: str, column: str, max_age_seconds: float | None
+) -> None:
+    # Rows past their max age are never read again; dropping them on save
+    # keeps the store from growing without bound.
+    if max_age_seconds is None:
+        return
+
+    await db.execute(
+        f"DELETE FROM {table} WHERE {column} <= ?", (time.time() - max_age_seconds,)
+    )
+
+
+def serialize_listings(listings: list[CardListing]) -> str:
+    rows = [
+        [
+            listing.name,
+            listing.set,
+            listing.code,
+            listing.price_cents,
+            listing.rarity,
+            listing.condition,
+            listing.stock,
+        ]
+        for listing in listings
+    ]
+
+    return json.dumps(rows, separators=(",", ":"))
+
+
+def deserialize_listings(payload: str) -> list[CardListing]:
+    return [CardListing(*row) for row in json.loads(payload)]
+
+
+async def load_listings(
+    slugs: list[str], max_age_seconds: float
+) -> dict[str, tuple[float, list[CardListing]]]:
+    """Returns ``{slug: (fetched_at, listings)}`` for entries younger than ``max_age_seconds``."""
+    found: dict[str, tuple[float, list[CardListing]]] = {}
+
+    if not slugs:
+        return found
+
+    oldest_allowed = time.time() - max_age_seconds
+
+    async with store_session() as db:
+        for batch in _batched(slugs):
+            placeholders = ",".join("?" for _ in batch)
+
+            async with db.execute(
+                "SELECT slug, fetched_at, payload FROM card_listings "
+                f"WHERE slug IN ({placeholders}) AND fetched_at > ?",
+                (*batch, oldest_allowed),
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            for slug, fetched_at, payload in rows:
+                try:
+                    found[slug] = (fetched_at, deserialize_listings(payload))
+                except (ValueError, TypeError):
+                    continue
+
+    return found
+
+
+async def save_listings(
+    entries: dict[str, list[CardListing]],
+    digests: dict[str, str] | None = None,
+    parser_version: int | None = None,
+    max_age_seconds: float | None = None,
+) -> None:
+    """Stores listings, each with the digest of the page they were parsed from
+    and the version of the parser that read it.
+
+    With ``max_age_seconds``, listings older than that are deleted as well.
+    """
+    if not entries:
+        return
+
+    fetched_at = time.time()
+    digests = digests or {}
+
+    await restore_listings(
+        {
+            slug: (fetched_at, listings, digests.get(slug))
+            for slug, listings in entries.items()
+        },
+        parser_version,
+        max_age_seconds,
+    )
+
+
+async def restore_listings(
+    entries: dict[str, tuple[float, list[CardListing], str | None]],
+    parser_version: int | None,
+    max_age_seconds: float | None = None,
+) -> None:
+    """Stores ``{slug: (fetched_at, listings, digest)}`` as given, e.g. listings
+    reparsed from archived pages, which keep the time the page was fetched.
+    """
+    if not entries:
+        return
+
+    async with store_session() as db:
+        await db.executemany(
+            "INSERT OR REPLACE INTO card_listings "
+            "(slug, fetched_at, payload, digest, parser_version) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    slug,
+                    fetched_at,
+                    serialize_listings(listings),
+                    digest,
+                    parser_version,
+                )
+                for slug, (fetched_at, listings, digest) in entries.items()
+            ],
+        )
+        await _delete_older_than(db, "card_listings", "fetched_at", max_age_seconds)
+        await db.commit()
+
+
+async def load_digests(slugs: list[str]) -> dict[str, str]:
+    """Returns ``{slug: digest}`` of the pages the stored listings came from."""
+    found: dict[str, str] = {}
+
+    if not slugs:
+        return found
+
+    async with store_session() as db:
+        for batch in _batched(slugs):
+            placeholders = ",".join("?" for _ in batch)
+
+            async with db.execute(
+                "SELECT slug, digest FROM card_listings "
+                f"WHERE slug IN ({placeholders}) AND digest IS NOT NULL",
+                batch,
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            for slug, digest in rows:
+                found[slug] = digest
+
+    return found
+
+
+async def load_listing_stamps(
+    slugs: list[str],
+) -> dict[str, tuple[float, str | None, int | None]]:
+    """Returns ``{slug: (fetched_at, digest, parser_version)}`` for stored listings."""
+    found: dict[str, tuple[float, str | None, int | None]] = {}
+
+    if not slugs:
+        return found
+
+    async with store_session() as db:
+        for batch in _batched(slugs):
+            placeholders = ",".join("?" for _ in batch)
+
+            async with db.execute(
+                "SELECT slug, fetched_at, digest, parser_version FROM card_listings "
+                f"WHERE slug IN ({placeholders})",
+                batch,
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            for slug, fetched_at, digest, parser_version in rows:
+                found[slug] = (fetched_at, digest, parser_version)
+
+    return found
+
+
+async def touch_listings(slugs: list[str]) -> None:
+    if not slugs:
+        return
+
+    fetched_at = time.time()
+
+    async with store_session() as db:
+        await db.executemany(
+            "UPDATE card_listings SET fetched_at = ? WHERE slug = ?",
+            [(fetched_at, slug) for slug in dict.fromkeys(slugs)],
+        )
+        await db.commit()
+
+
+async def load_validators(urls: list[str]) -> dict[str, tuple[str | None, str | None]]:
+    """Returns ``{url: (etag, last_modified)}`` for the known product URLs."""
+    found: dict[str, tuple[str | None, str | None]] = {}
+
+    if not urls:
+        return found
+
+    async with store_session() as db:
+        for batch in _batched(urls):
+            placeholders = ",".join("?" for _ in batch)
+
+            async with db.execute(
+                "SELECT url, etag, last_modified FROM page_validators "
+                f"WHERE url IN ({placeholders})",
+                batch,
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            for url, etag, last_modified in rows:
+                found[url] = (etag, last_modified)
+
+    return found
+
+
+async def save_validators(entries: dict[str, tuple[str | None, str | None]]) -> None:
+    if not entries:
+        return
+
+    async with store_session() as db:
+        await db.executemany(
+            "INSERT OR REPLACE INTO page_validators (url, etag, last_modified) "
+            "VALUES (?, ?, ?)",
+            [
+                (url, etag, last_modified)
+                for url, (etag, last_modified) in entries.items()
+            ],
+        )
+        await db.commit()
+
+
+async def load_missing(slugs: list[str], ttl_seconds: float) -> dict[str, float]:
+    """Returns ``{slug: checked_at}`` for pages recently confirmed not to exist."""
+    found: dict[str, float] = {}
+
+    if not slugs:
+        return found
+
+    oldest_allowed = time.time() - ttl_seconds
+
+    async with store_session() as db:
+        for batch in _batched(slugs):
+            placeholders = ",".join("?" for _ in batch)
+
+            async with db.execute(
+                "SELECT slug, checked_at FROM missing_pages "
+                f"WHERE slug IN ({placeholders}) AND checked_at > ?",
+                (*batch, oldest_allowed),
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            for slug, checked_at in rows:
+                found[slug] = checked_at
+
+    return found
+
+
+async def save_missing(slugs: list[str], ttl_seconds: float | None = None) -> None:
+    """Records pages confirmed not to exist; with ``ttl_seconds``, drops older ones."""
+    if not slugs:
+        return
+
+    checked_at = time.time()
+
+    async with store_session() as db:
+        await db.executemany(
+            "INSERT OR REPLACE INTO missing_pages (slug, checked_at) VALUES (?, ?)",
+            [(slug, checked_at) for slug in dict.fromkeys(slugs)],
+        )
+        await _delete_older_than(db, "missing_pages", "checked_at", ttl_seconds)
+        await db.commit()
+
+
+async def load_aliases(
+    aliases: list[str], max_age_seconds: float
+) -> dict[str, tuple[str, str]]:
+    """Returns ``{alias: (slug, url)}``: the canonical card slug and product URL."""
+    found: dict[str, tuple[str, str]] = {}
+
+    if not aliases:
+        return found
+
+    oldest_allowed = time.time() - max_age_seconds
+
+    async with store_session() as db:
+        for batch in _batched(aliases):
+            placeholders = ",".join("?" for _ in batch)
+
+            async with db.execute(
+                "SELECT alias, slug, url FROM card_aliases "
+                f"WHERE alias IN ({placeholders}) AND resolved_at > ?",
+                (*batch, oldest_allowed),
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+            for alias, slug, url in rows:
+                found[alias] = (slug, url)
+
+    return found
+
+
+async def save_aliases(
+    entries: dict[str, tuple[str, str]], max_age_seconds: float | None = None
+) -> None:
+    """Stores ``{alias: (slug, url)}``; with ``max_age_seconds``, drops older aliases."""
+    if not entries:
+        return
+
+    resolved_at = time.time()
+
+    async with store_session() as db:
+        await db.executemany(
+            "INSERT OR REPLACE INTO card_aliases (alias, slug, url, resolved_at) "
+            "VALUES (?, ?, ?, ?)",
+            [(alias, slug, url, resolved_at) for alias, (slug, url) in entries.items()],
+        )
+        await _delete_older_than(db, "card_aliases", "resolved_at", max_age_seconds)
+        await db.commit()
+
+
+async def delete_aliases(aliases: list[str]) -> None:
+    if not aliases:
+        return
+
+    async with store_session() as db:
+        await db.executemany(
+            "DELETE FROM card_aliases WHERE alias = ?",
+            [(alias,) for alias in dict.fromkeys(aliases)],
+        )
+        await db.commit()
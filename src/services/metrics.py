@@ -0,0 +1,174 @@
+import atexit
+import json
+import logging
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+
+LOG = logging.getLogger(__name__)
+
+# Upper bounds in seconds, doubling from 0.5 ms to ~65 s; one overflow bucket.
+LATENCY_BUCKETS = tuple(0.0005 * 2**exponent for exponent in range(18))
+METRICS_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+_HISTOGRAMS: dict[str, "Histogram"] = {}
+_COUNTERS: dict[str, int] = {}
+_DUMP_PATH: Path | None = None
+
+
+class Histogram:
+    """Fixed-bucket latency histogram: O(log buckets) per sample, no sample list.
+
+    Quantiles are estimated as the upper bound of the bucket they fall in
+    (capped at the largest sample), so they are accurate to within a factor
+    of two.
+    """
+
+    __slots__ = ("bounds", "buckets", "count", "total", "min", "max")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+        if self.min is None or value < self.min:
+            self.min = value
+
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+
+            if seen >= rank and bucket_count:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+
+                return self.max
+
+        return self.max
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        stats: dict[str, float | int | None] = {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+        }
+
+        for q in METRICS_QUANTILES:
+            stats[f"p{round(q * 100)}"] = self.quantile(q)
+
+        return stats
+
+
+class timed:
+    """Context manager that records the elapsed wall time into histogram ``name``.
+
+    Usable around awaits; the time spent suspended is included.
+    """
+
+    __slots__ = ("name", "started_at")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> "timed":
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        observe(self.name, time.perf_counter() - self.started_at)
+
+
+def observe(name: str, seconds: float) -> None:
+    histogram = _HISTOGRAMS.get(name)
+
+    if histogram is None:
+        histogram = _HISTOGRAMS[name] = Histogram()
+
+    histogram.observe(seconds)
+
+
+def increment(name: str, amount: int = 1) -> None:
+    _COUNTERS[name] = _COUNTERS.get(name, 0) + amount
+
+
+def get_counter(name: str) -> int:
+    return _COUNTERS.get(name, 0)
+
+
+def get_histogram(name: str) -> Histogram | None:
+    return _HISTOGRAMS.get(name)
+
+
+def hit_ratio(prefix: str) -> float | None:
+    """``<prefix>.hit / (<prefix>.hit + <prefix>.miss)``, or None before any lookup."""
+    hits = get_counter(f"{prefix}.hit")
+    lookups = hits + get_counter(f"{prefix}.miss")
+
+    return hits / lookups if lookups else None
+
+
+def snapshot() -> dict[str, dict]:
+    prefixes = sorted(
+        {
+            name.rsplit(".", 1)[0]
+            for name in _COUNTERS
+            if name.endswith((".hit", ".miss"))
+        }
+    )
+
+    return {
+        "timings": {
+            name: histogram.snapshot()
+            for name, histogram in sorted(_HISTOGRAMS.items())
+        },
+        "counters": dict(sorted(_COUNTERS.items())),
+        "hit_ratios": {prefix: hit_ratio(prefix) for prefix in prefixes},
+    }
+
+
+def reset() -> None:
+    _HISTOGRAMS.clear()
+    _COUNTERS.clear()
+
+
+def dump_metrics(path: str | Path) -> None:
+    Path(path).write_text(json.dumps(snapshot(), indent=2), encoding="utf-8")
+
+
+def dump_metrics_at_exit(path: str | Path) -> None:
+    """Writes ``snapshot()`` to ``path`` as JSON when the interpreter exits."""
+    global _DUMP_PATH
+
+    if _DUMP_PATH is None:
+        atexit.register(_dump_at_exit)
+
+    _DUMP_PATH = Path(path)
+
+
+def _dump_at_exit() -> None:
+    if _DUMP_PATH is None:
+        return
+
+    try:
+        dump_metrics(_DUMP_PATH)
+    except OSError:
+        LOG.exception("could not write metrics to %s", _DUMP_PATH)
@@ -0,0 +1,177 @@
+import time
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from aiosqlite import connect
+from aiosqlite.core import Connection
+
+from src.utils.app_dirs import get_page_archive_path
+
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+
+ARCHIVE_ZLIB_LEVEL = 6
+ARCHIVE_ZSTD_LEVEL = 9
+ARCHIVE_READ_BATCH_SIZE = 200
+ARCHIVE_MAX_PAGES_PER_SLUG = 3
+
+ARCHIVED_PAGES_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS archived_pages ("
+    "url TEXT NOT NULL, fetched_at REAL NOT NULL, slug TEXT NOT NULL, "
+    "card_name TEXT NOT NULL, codec TEXT NOT NULL, body BLOB NOT NULL, "
+    "partial INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (url, fetched_at))"
+)
+ARCHIVED_PAGES_SLUG_INDEX = (
+    "CREATE INDEX IF NOT EXISTS archived_pages_slug "
+    "ON archived_pages (slug, fetched_at)"
+)
+
+_SCHEMA_READY = False
+
+
+class PageArchiveError(Exception):
+    """Raised when an archived page uses a codec this install can't read."""
+
+
+@dataclass
+class ArchivedPage:
+    """A product page compressed with ``codec``.
+
+    ``partial`` pages hold only the header and products container that a
+    streamed fetch kept, so they can't be reparsed.
+    """
+
+    url: str
+    fetched_at: float
+    slug: str
+    card_name: str
+    codec: str
+    body: bytes
+    partial: bool = False
+
+    def html(self) -> str:
+        return decompress_page(self.codec, self.body)
+
+
+def compress_page(html: str) -> tuple[str, bytes]:
+    data = html.encode()
+
+    if zstd is not None:
+        return "zstd", zstd.compress(data, ARCHIVE_ZSTD_LEVEL)
+
+    return "zlib", zlib.compress(data, ARCHIVE_ZLIB_LEVEL)
+
+
+def decompress_page(codec: str, body: bytes) -> str:
+    if codec == "zlib":
+        return zlib.decompress(body).decode()
+
+    if codec == "zstd" and zstd is not None:
+        return zstd.decompress(body).decode()
+
+    raise PageArchiveError(f"Can't read {codec!r} archived pages on this install")
+
+
+def archive_page(
+    url: str, slug: str, card_name: str, html: str, partial: bool = False
+) -> ArchivedPage:
+    codec, body = compress_page(html)
+
+    return ArchivedPage(url, time.time(), slug, card_name, codec, body, partial)
+
+
+@asynccontextmanager
+async def archive_session() -> AsyncIterator[Connection]:
+    # Unlike the listing store, the archive is kept across schema and parser
+    # changes: rebuilding listings from it is the point.
+    global _SCHEMA_READY
+
+    async with connect(str(get_page_archive_path())) as db:
+        if not _SCHEMA_READY:
+            await db.execute(ARCHIVED_PAGES_SCHEMA)
+            await db.execute(ARCHIVED_PAGES_SLUG_INDEX)
+            await db.commit()
+            _SCHEMA_READY = True
+
+        yield db
+
+
+async def save_pages(
+    pages: list[ArchivedPage], keep_per_slug: int = ARCHIVE_MAX_PAGES_PER_SLUG
+) -> None:
+    """Stores ``pages`` and drops all but the newest ``keep_per_slug`` of each card."""
+    if not pages:
+        return
+
+    async with archive_session() as db:
+        await db.executemany(
+            "INSERT OR REPLACE INTO archived_pages "
+            "(url, fetched_at, slug, card_name, codec, body, partial) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    page.url,
+                    page.fetched_at,
+                    page.slug,
+                    page.card_name,
+                    page.codec,
+                    page.body,
+                    page.partial,
+                )
+                for page in pages
+            ],
+        )
+        await db.executemany(
+            "DELETE FROM archived_pages WHERE slug = ? AND fetched_at < ("
+            "SELECT fetched_at FROM archived_pages WHERE slug = ? "
+            "ORDER BY fetched_at DESC LIMIT 1 OFFSET ?)",
+            [
+                (slug, slug, keep_per_slug - 1)
+                for slug in dict.fromkeys(page.slug for page in pages)
+            ],
+        )
+        await db.commit()
+
+
+async def iter_latest_pages(
+    batch_size: int = ARCHIVE_READ_BATCH_SIZE,
+) -> AsyncIterator[list[ArchivedPage]]:
+    """Yields the newest complete archived page of every card slug, in batches."""
+    after = ""
+
+    while True:
+        async with archive_session() as db:
+            async with db.execute(
+                "SELECT url, MAX(fetched_at), slug, card_name, codec, body "
+                "FROM archived_pages WHERE slug > ? AND partial = 0 "
+                "GROUP BY slug ORDER BY slug LIMIT ?",
+                (after, batch_size),
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+        if not rows:
+            return
+
+        yield [ArchivedPage(*row) for row in rows]
+        after = rows[-1][2]
+
+
+async def archive_stats() -> tuple[int, int, int]:
+    """Returns ``(pages, card slugs, compressed bytes)`` held in the archive."""
+    async with archive_session() as db:
+        async with db.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT slug), COALESCE(SUM(LENGTH(body)), 0) "
+            "FROM archived_pages"
+        ) as cursor:
+            row = await cursor.fetchone()
+
+    return row if row is not None else (0, 0, 0)
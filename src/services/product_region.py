@@ -0,0 +1,195 @@
+import re
+from dataclasses import dataclass
+
+
+PRODUCTS_CONTAINER_CLASS = "products-container"
+CARD_NAME_CLASS = "card-name"
+
+_TOKEN_PATTERN = re.compile(
+    r"<!--|<(script|style)\b[^>]*>|<(h1|div)\b([^>]*)>|</(h1|div)\s*>",
+    re.IGNORECASE,
+)
+_RAW_TEXT_END_PATTERNS = {
+    "script": re.compile(r"</script\s*>", re.IGNORECASE),
+    "style": re.compile(r"</style\s*>", re.IGNORECASE),
+}
+_CLASS_ATTR_PATTERN = re.compile(
+    r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE
+)
+_COMMENT_END = "-->"
+_RAW_TEXT_END_MAX_LENGTH = 16
+
+
+@dataclass
+class ProductRegion:
+    """The ``h1.card-name`` header and ``div.products-container`` markup of a page."""
+
+    html: str
+    page_chars: int
+
+    @property
+    def has_prices(self) -> bool:
+        return "$" in self.html
+
+
+class ProductRegionScanner:
+    """Slices the card header and products container out of a page.
+
+    Text can be fed in chunks as it arrives; ``feed`` returns True once the
+    container's closing tag has been seen, after which the rest of the page
+    is not needed. Only the captured markup is kept, so memory is bounded by
+    the region size plus one partial tag. Comments, scripts and styles are
+    skipped so markup inside them can't open or close the region.
+    """
+
+    def __init__(self) -> None:
+        self.done = False
+        self.page_chars = 0
+        self._pending = ""
+        self._parts: list[str] = []
+        self._capture: str | None = None
+        self._depth = 0
+        self._header_found = False
+        self._skip_until: re.Pattern[str] | str | None = None
+
+    def feed(self, chunk: str) -> bool:
+        if self.done:
+            return True
+
+        self.page_chars += len(chunk)
+        text = self._pending + chunk
+        pos = 0
+
+        while True:
+            if self._skip_until is not None:
+                end, found = self._skip_end(text, pos)
+                pos = self._consume(text, pos, end)
+
+                if not found:
+                    break
+
+                self._skip_until = None
+                continue
+
+            match = _TOKEN_PATTERN.search(text, pos)
+
+            if match is None:
+                # Anything after the last "<" may be the start of a tag.
+                tail = text.rfind("<", pos)
+                pos = self._consume(text, pos, len(text) if tail == -1 else tail)
+                break
+
+            pos = self._consume(text, pos, match.start())
+
+            if self._handle_token(text, match):
+                return True
+
+            pos = self._consume(text, pos, match.end())
+
+        self._pending = text[pos:]
+
+        return False
+
+    def region(self) -> ProductRegion | None:
+        """The captured region, or None if no complete container was found."""
+        if not self.done:
+            return None
+
+        return ProductRegion("".join(self._parts), self.page_chars)
+
+    def _handle_token(self, text: str, match: re.Match[str]) -> bool:
+        token = match.group(0)
+
+        if token == "<!--":
+            self._skip_until = _COMMENT_END
+            return False
+
+        raw_tag = match.group(1)
+
+        if raw_tag is not None:
+            self._skip_until = _RAW_TEXT_END_PATTERNS[raw_tag.lower()]
+            return False
+
+        open_tag = (match.group(2) or "").lower()
+        close_tag = (match.group(4) or "").lower()
+
+        if self._capture == "region":
+            if open_tag == "div":
+                self._depth += 1
+            elif close_tag == "div":
+                self._depth -= 1
+
+                if self._depth == 0:
+                    self._consume(text, match.start(), match.end())
+                    self._pending = ""
+                    self.done = True
+                    return True
+
+            return False
+
+        if self._capture == "header":
+            if close_tag == "h1":
+                self._consume(text, match.start(), match.end())
+                self._capture = None
+                self._header_found = True
+
+            return False
+
+        attrs = match.group(3) or ""
+
+        if open_tag == "div" and _has_class(attrs, PRODUCTS_CONTAINER_CLASS):
+            self._capture = "region"
+            self._depth = 1
+        elif (
+            open_tag == "h1"
+            and not self._header_found
+            and _has_class(attrs, CARD_NAME_CLASS)
+        ):
+            self._capture = "header"
+
+        return False
+
+    def _consume(self, text: str, start: int, end: int) -> int:
+        if self._capture is not None and end > start:
+            self._parts.append(text[start:end])
+
+        return end
+
+    def _skip_end(self, text: str, pos: int) -> tuple[int, bool]:
+        """End of the comment/script being skipped, or how far it is safe to skip.
+
+        When the end marker hasn't arrived yet, a marker-sized tail is left
+        unscanned in case the marker is split across chunks.
+        """
+        if isinstance(self._skip_until, str):
+            end = text.find(self._skip_until, pos)
+
+            if end != -1:
+                return end + len(self._skip_until), True
+
+            return max(pos, len(text) - len(self._skip_until) + 1), False
+
+        match = self._skip_until.search(text, pos)
+
+        if match is not None:
+            return match.end(), True
+
+        return max(pos, len(text) - _RAW_TEXT_END_MAX_LENGTH), False
+
+
+def _has_class(attrs: str, class_name: str) -> bool:
+    match = _CLASS_ATTR_PATTERN.search(attrs)
+
+    if match is None:
+        return False
+
+    value = next(group for group in match.groups() if group is not None)
+
+    return class_name in value.split()
+
+
+def extract_product_region(html: str) -> ProductRegion | None:
+    scanner = ProductRegionScanner()
+    scanner.feed(html)
+
+    return scanner.region()
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from urllib.parse import urlsplit
+
+from src.utils.constants import DELAY_BETWEEN_REQUESTS_SECONDS
+
+
+DEFAULT_REQUESTS_PER_SECOND = 1 / DELAY_BETWEEN_REQUESTS_SECONDS
+DEFAULT_BURST = 25
+
+
+class TokenBucket:
+    """Allows ``burst`` requests at once, then one every ``1 / rate`` seconds.
+
+    Callers reserve a token immediately, even if that drives the balance
+    negative, and then sleep until it would have refilled. Reservations are
+    handed out in call order, so waiters are served FIFO without a lock.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long to wait before using it."""
+        self._refill()
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+
+        return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+
+        if delay <= 0:
+            return
+
+        self.waits += 1
+        self.waited_seconds += delay
+
+        try:
+            await self._sleep(delay)
+        except asyncio.CancelledError:
+            # Hand the unused reservation back to the callers behind us.
+            self._tokens += 1
+            raise
+
+    def snapshot(self) -> dict[str, float | int]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": self.tokens,
+            "waits": self.waits,
+            "waited_seconds": self.waited_seconds,
+        }
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+
+
+class HostRateLimiter:
+    """One token bucket per host, created on first use.
+
+    Hosts without an explicit rate use the defaults; a rate of ``None``
+    turns limiting off for that host.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_rate: float | None = DEFAULT_REQUESTS_PER_SECOND,
+        default_burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._clock = clock
+        self._sleep = sleep
+        self._rates: dict[str, tuple[float | None, int]] = {}
+        self._buckets: dict[str, TokenBucket | None] = {}
+
+    def set_host_rate(
+        self, host: str, rate: float | None, burst: int | None = None
+    ) -> None:
+        host = host.lower()
+        self._rates[host] = (rate, self.default_burst if burst is None else burst)
+        self._buckets.pop(host, None)
+
+    def bucket(self, host: str) -> TokenBucket | None:
+        host = host.lower()
+
+        if host in self._buckets:
+            return self._buckets[host]
+
+        rate, burst = self._rates.get(host, (self.default_rate, self.default_burst))
+        bucket = (
+            None
+            if rate is None
+            else TokenBucket(rate, burst, clock=self._clock, sleep=self._sleep)
+        )
+        self._buckets[host] = bucket
+
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        bucket = self.bucket(urlsplit(url).hostname or "")
+
+        if bucket is not None:
+            await bucket.acquire()
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        return {
+            host: bucket.snapshot()
+            for host, bucket in self._buckets.items()
+            if bucket is not None
+        }
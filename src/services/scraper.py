@@ -1,180 +1,1061 @@
 import asyncio
+import codecs
+import hashlib
+import logging
+import multiprocessing
+import os
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor
+from asyncio import FIRST_COMPLETED
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import TypeVar, cast
 from urllib.parse import quote
 
 from bs4 import BeautifulSoup
-from httpx import AsyncClient, HTTPStatusError, RequestError
+from httpx import AsyncClient, HTTPStatusError, RequestError, Response, TimeoutException
 
 from src.models.cards import CardListing
-from src.utils.constants import BASE_URL, REQUEST_TIMEOUT_SECONDS, USER_AGENT
-from src.utils.utils import deduplicate_listings, to_slug
-
+from src.services.adaptive_limiter import AdaptiveLimiter
+from src.services.http_transport import close_http_client, get_http_client
+from src.services.listing_store import (
+    delete_aliases,
+    load_aliases,
+    load_digests,
+    load_listings,
+    load_missing,
+    load_validators,
+    save_aliases,
+    save_listings,
+    save_missing,
+    save_validators,
+    touch_listings,
+)
+from src.services.metrics import increment, observe, timed
+from src.services.page_archive import ArchivedPage, archive_page, save_pages
+from src.services.product_region import ProductRegionScanner, extract_product_region
+from src.services.rate_limiter import HostRateLimiter
+from src.utils.constants import BASE_URL
+from src.utils.ttl_cache import TTLCache
+from src.utils.utils import (
+    PRICE_PATTERN,
+    deduplicate_listings,
+    parse_price_cents,
+    to_slug,
+)
+
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+LXML_AVAILABLE = find_spec("lxml") is not None
+
+
+LOG = logging.getLogger(__name__)
+
+CompactListing = tuple[str, str, str, int | None, str, str, int]
+_ParseResult = TypeVar("_ParseResult", bound=tuple)
 
 MAX_SCRAPE_CONCURRENCY = 50
-PARSE_MAX_WORKERS = 32
+INITIAL_SCRAPE_CONCURRENCY = 8
+PARSE_MODES = ("inline", "thread", "process")
+PARSE_MAX_WORKERS = os.cpu_count() or 1
+# Threads by default: streamed pages are only the product region, so a
+# process pool's worker start-up and pickling cost more than the parse and
+# delay the first result. Process mode is opt-in (``--parse-mode process``).
+PARSE_MODE = "thread"
 CARD_LISTINGS_TTL_SECONDS = 600
+LISTING_STORE_TTL_SECONDS = 6 * 60 * 60
+LISTING_STORE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+MISSING_CARD_TTL_SECONDS = 60 * 60
+# After this many failed fetches in a row a page is skipped for a while,
+# doubling from the base delay up to the cap.
+TRANSIENT_FAILURES_BEFORE_BACKOFF = 2
+TRANSIENT_BACKOFF_BASE_SECONDS = 30.0
+TRANSIENT_BACKOFF_MAX_SECONDS = 10 * 60.0
+CARD_LISTINGS_CACHE_MAX_ENTRIES = 5_000
+CARD_LISTINGS_CACHE_MAX_BYTES = 32 * 1024 * 1024
+CARD_CACHE_SWEEP_INTERVAL_SECONDS = 60.0
+USE_LISTING_STORE = True
+CARD_FETCH_DEADLINE_SECONDS = 10.0
+HEDGE_CARD_FETCHES = True
+HEDGE_LATENCY_QUANTILE = 0.95
+HEDGE_LATENCY_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MIN_DELAY_SECONDS = 0.05
+
+PARSER_ENGINES = ("selectolax", "lxml", "html.parser")
+PARSER_ENGINE: str | None = None
+# Bump whenever a parser change alters the listings read from the same HTML,
+# so pages memoized by an older parser are parsed again.
+PARSER_VERSION = 1
+
+PRODUCT_ROW_SELECTORS = (
+    "div.products-container div.row",
+    "div.row.product-row",
+    "div.row",
+)
+SET_LINK_SELECTOR = "a.ItemSet.display-title"
+# Text fallback: how far past a card number its price/stock and condition
+# may appear.
+TEXT_LISTING_WINDOW_CHARS = 300
+TEXT_CONDITION_WINDOW_CHARS = 100
+CARD_NAME_SELECTOR = "h1.card-name"
+# Parse only the header and products container instead of the whole page.
+SCOPED_PARSE = True
+# Keep only the header and products container while a card page streams in;
+# over HTTP/2 the download also stops once the container has closed.
+STREAM_CARD_PAGES = True
+# Keep a compressed copy of every parsed page so listings can be rebuilt
+# offline when the parser changes (see ``src.usecases.reparse_archive``).
+# Pages are then read in full rather than streamed.
+ARCHIVE_CARD_PAGES = False
+
+# One alternation per token of the text fallback. The leading lookahead on
+# the tokens' first characters lets the scan skip other text quickly.
+_TEXT_LISTING_TOKEN_PATTERN = re.compile(
+    r"(?=[RC$\dNP])(?:"
+    r"(?:Rarity:\s*(?P<rarity>[A-Za-z\s]+?))?"
+    r"Card #:\s*(?P<code>[A-Z]{2,4}\d*-[A-Z]{2,3}\d+)"
+    rf"|(?P<price>{PRICE_PATTERN.pattern})"
+    r"|(?P<stock>\d+)\s+In Stock"
+    r"|(?P<condition>Near Mint|Played))"
+)
+
+_PARSE_EXECUTOR: Executor | None = None
+_PARSE_EXECUTOR_MODE: str | None = None
+
+
+def _listings_size(listings: list[CardListing]) -> int:
+    # Rough footprint: list slot, dataclass and str headers plus the text.
+    return 56 + sum(
+        400
+        + len(listing.name)
+        + len(listing.set)
+        + len(listing.code)
+        + len(listing.rarity)
+        + len(listing.condition)
+        for listing in listings
+    )
 
-_SCRAPER_CLIENT: AsyncClient | None = None
-PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=PARSE_MAX_WORKERS)
-_CARD_LISTINGS_CACHE: dict[str, tuple[float, list[CardListing]]] = {}
 
+_CARD_LISTINGS_CACHE: TTLCache[str, list[CardListing]] = TTLCache(
+    CARD_LISTINGS_TTL_SECONDS,
+    max_entries=CARD_LISTINGS_CACHE_MAX_ENTRIES,
+    max_bytes=CARD_LISTINGS_CACHE_MAX_BYTES,
+    sizeof=_listings_size,
+    stale_seconds=LISTING_STORE_TTL_SECONDS,
+    sweep_interval_seconds=CARD_CACHE_SWEEP_INTERVAL_SECONDS,
+)
+_PAGE_VALIDATORS: TTLCache[str, tuple[str | None, str | None]] = TTLCache(
+    LISTING_STORE_MAX_AGE_SECONDS,
+    max_entries=CARD_LISTINGS_CACHE_MAX_ENTRIES,
+    sweep_interval_seconds=CARD_CACHE_SWEEP_INTERVAL_SECONDS,
+)
+_MISSING_CARDS: TTLCache[str, bool] = TTLCache(
+    MISSING_CARD_TTL_SECONDS,
+    max_entries=CARD_LISTINGS_CACHE_MAX_ENTRIES,
+    sweep_interval_seconds=CARD_CACHE_SWEEP_INTERVAL_SECONDS,
+)
+# Card slug -> digest of the page its cached listings were parsed from.
+_PAGE_DIGESTS: TTLCache[str, str] = TTLCache(
+    LISTING_STORE_MAX_AGE_SECONDS,
+    max_entries=CARD_LISTINGS_CACHE_MAX_ENTRIES,
+    sweep_interval_seconds=CARD_CACHE_SWEEP_INTERVAL_SECONDS,
+)
+# Card slug -> (canonical slug, final product URL) learned from redirects and
+# the page's own card name, so aliases skip the redirect and share one entry.
+_CARD_ALIASES: TTLCache[str, tuple[str, str]] = TTLCache(
+    LISTING_STORE_MAX_AGE_SECONDS,
+    max_entries=CARD_LISTINGS_CACHE_MAX_ENTRIES,
+    sweep_interval_seconds=CARD_CACHE_SWEEP_INTERVAL_SECONDS,
+)
+# Card slug -> (failures in a row, monotonic time before which it's skipped).
+_TRANSIENT_FAILURES: TTLCache[str, tuple[int, float]] = TTLCache(
+    MISSING_CARD_TTL_SECONDS,
+    max_entries=CARD_LISTINGS_CACHE_MAX_ENTRIES,
+    sweep_interval_seconds=CARD_CACHE_SWEEP_INTERVAL_SECONDS,
+)
+
+
+@dataclass
+class CardPage:
+    # Final URL after redirects.
+    url: str
+    html: str | None
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+    not_found: bool = False
+    partial: bool = False
+
+
+@dataclass
+class _CardFetch:
+    key: str
+    url: str
+    listings: list[CardListing]
+    missing: bool = False
+    parsed: bool = False
+    revalidated: bool = False
+    validators: tuple[str | None, str | None] | None = None
+    aliases: dict[str, tuple[str, str]] | None = None
+    # The page a remembered alias pointed at is gone (404).
+    dead_alias: bool = False
+    digest: str | None = None
+    archived: ArchivedPage | None = None
+
+
+@dataclass
+class _StoreWrites:
+    """Fetch results waiting to be saved to the listing store."""
+
+    fetched: dict[str, list[CardListing]] = field(default_factory=dict)
+    revalidated: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    validators: dict[str, tuple[str | None, str | None]] = field(default_factory=dict)
+    aliases: dict[str, tuple[str, str]] = field(default_factory=dict)
+    dead_aliases: list[str] = field(default_factory=list)
+    digests: dict[str, str] = field(default_factory=dict)
+    pages: list[ArchivedPage] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return any(
+            (
+                self.fetched,
+                self.revalidated,
+                self.missing,
+                self.validators,
+                self.aliases,
+                self.dead_aliases,
+                self.pages,
+            )
+        )
 
-async def get_scraper_client() -> AsyncClient:
-    global _SCRAPER_CLIENT
+    def add(self, result: _CardFetch) -> None:
+        if result.missing:
+            self.missing.append(result.key)
 
-    if _SCRAPER_CLIENT is None:
-        _SCRAPER_CLIENT = AsyncClient(
-            headers={"User-Agent": USER_AGENT},
-            timeout=REQUEST_TIMEOUT_SECONDS,
-            follow_redirects=True,
-        )
+        if result.parsed:
+            self.fetched[result.key] = result.listings
+
+        if result.digest is not None:
+            self.digests[result.key] = result.digest
+
+        if result.revalidated:
+            self.revalidated.append(result.key)
+
+        if result.validators is not None:
+            self.validators[result.url] = result.validators
 
-    return _SCRAPER_CLIENT
+        if result.aliases:
+            self.aliases.update(result.aliases)
+
+        if result.archived is not None:
+            self.pages.append(result.archived)
+
+
+_IN_FLIGHT: dict[str, asyncio.Task[_CardFetch | None]] = {}
+# Fetch results queued for the listing store and the task saving them.
+_STORE_WRITES = _StoreWrites()
+_STORE_WRITER: asyncio.Task[None] | None = None
+SCRAPE_LIMITER = AdaptiveLimiter(
+    initial_limit=INITIAL_SCRAPE_CONCURRENCY, max_limit=MAX_SCRAPE_CONCURRENCY
+)
+# Politeness: paces requests per host on top of the concurrency limit.
+# Use ``HOST_RATE_LIMITER.set_host_rate`` to change a host's rate or burst.
+HOST_RATE_LIMITER = HostRateLimiter()
+_FETCH_LATENCIES: deque[float] = deque(maxlen=HEDGE_LATENCY_WINDOW)
+# Background reads of HTTP/1.1 bodies past the product region.
+_BODY_DRAINS: set[asyncio.Task[None]] = set()
+
+
+async def get_scraper_client() -> AsyncClient:
+    return await get_http_client()
 
 
 async def close_scraper_client() -> None:
-    global _SCRAPER_CLIENT
+    # Let background body drains finish (they run under the fetch deadline)
+    # so none of them reads from a closed client.
+    if _BODY_DRAINS:
+        await asyncio.gather(*_BODY_DRAINS, return_exceptions=True)
 
-    if _SCRAPER_CLIENT is not None:
-        await _SCRAPER_CLIENT.aclose()
-        _SCRAPER_CLIENT = None
+    await close_http_client()
 
 
 def _card_cache_key(card_name: str) -> str:
     return to_slug(card_name)
 
 
+def card_page_url(card_name: str) -> str:
+    encoded_name = quote(card_name, safe="").replace("%20", "+")
+    return f"{BASE_URL}{encoded_name}"
+
+
+def _card_target(card_name: str) -> tuple[str, str]:
+    """``(cache key, product URL)`` for a card, following a learned alias."""
+    key = _card_cache_key(card_name)
+
+    return _CARD_ALIASES.get(key) or (key, card_page_url(card_name))
+
+
 async def scrape_cards(cards: list[str]) -> list[CardListing]:
-    all_listings: list[CardListing] = []
+    by_card: dict[str, list[CardListing]] = {}
+
+    async with aclosing(iter_scrape_cards(cards)) as results:
+        async for card_name, listings in results:
+            by_card[card_name] = listings
+
+    return [listing for card_name in cards for listing in by_card.get(card_name, [])]
+
 
+async def iter_scrape_cards(
+    cards: list[str],
+) -> AsyncIterator[tuple[str, list[CardListing]]]:
+    """Yields ``(card_name, listings)`` as soon as each card is resolved.
+
+    Cached cards come first; fetched cards follow in completion order.
+    Cards whose page could not be fetched are yielded with no listings.
+    Expired entries are revalidated with the page's ETag / Last-Modified,
+    and a 304 reuses the cached listings without reparsing, as does a 200
+    whose body hashes the same as the page they were parsed from.
+    """
     if not cards:
-        return all_listings
+        return
+
+    if USE_LISTING_STORE:
+        await _load_card_aliases(cards)
 
-    now = time.monotonic()
     pending_cards: list[str] = []
+    stale: dict[str, list[CardListing]] = {}
 
     for card_name in cards:
-        key = _card_cache_key(card_name)
-        cached = _CARD_LISTINGS_CACHE.get(key)
+        key, _url = _card_target(card_name)
 
-        if cached is None:
-            pending_cards.append(card_name)
+        if _MISSING_CARDS.get(key):
+            increment("scrape.negative_cache_hits")
+            yield card_name, []
             continue
 
-        expires_at, cached_listings = cached
+        cached_listings = _CARD_LISTINGS_CACHE.get(key)
 
-        if expires_at <= now:
-            pending_cards.append(card_name)
+        if cached_listings is not None:
+            increment("scrape.listing_cache.hit")
+            yield card_name, cached_listings
             continue
 
-        all_listings.extend(cached_listings)
+        increment("scrape.listing_cache.miss")
+
+        stale_listings = _CARD_LISTINGS_CACHE.get_stale(key)
+
+        if stale_listings is not None:
+            stale[key] = stale_listings
+
+        pending_cards.append(card_name)
+
+    if pending_cards and USE_LISTING_STORE:
+        stored = await _load_from_listing_store(pending_cards, stale)
+        still_pending: list[str] = []
+
+        for card_name in pending_cards:
+            key, _url = _card_target(card_name)
+            listings = stored.get(key)
+
+            if listings is not None:
+                increment("scrape.listing_store.hit")
+                yield card_name, listings
+            elif _MISSING_CARDS.get(key):
+                increment("scrape.negative_cache_hits")
+                yield card_name, []
+            else:
+                increment("scrape.listing_store.miss")
+                still_pending.append(card_name)
+
+        pending_cards = still_pending
+        stale_targets = [
+            (key, url) for key, url in map(_card_target, pending_cards) if key in stale
+        ]
+        await _load_page_validators([url for _key, url in stale_targets])
+        await _load_page_digests([key for key, _url in stale_targets])
 
     if not pending_cards:
-        return all_listings
+        return
 
     client = await get_scraper_client()
-    semaphore = asyncio.Semaphore(MAX_SCRAPE_CONCURRENCY)
-    tasks: list[asyncio.Task] = []
-    card_names: list[str] = []
 
-    async def _bounded_fetch(url: str) -> str | None:
-        async with semaphore:
-            return await fetch_card_page(client, url)
+    async def _shared_fetch(card_name: str, key: str, url: str) -> _CardFetch | None:
+        flight = _join_or_start_fetch(key, card_name, url, client, stale.get(key))
 
-    for card_name in pending_cards:
-        encoded_name = quote(card_name, safe="").replace("%20", "+")
-        url = f"{BASE_URL}{encoded_name}"
-        task = asyncio.create_task(_bounded_fetch(url))
-        tasks.append(task)
-        card_names.append(card_name)
+        return await asyncio.shield(flight)
 
-    htmls = await asyncio.gather(*tasks)
+    async def _fetch_and_parse(card_name: str) -> tuple[str, list[CardListing]]:
+        key, url = _card_target(card_name)
+        result = await _shared_fetch(card_name, key, url)
+        own_key, own_url = _card_cache_key(card_name), card_page_url(card_name)
 
-    loop = asyncio.get_running_loop()
+        if (
+            result is not None
+            and result.dead_alias
+            and (key, url) != (own_key, own_url)
+        ):
+            # Forget the alias and give the name's own URL one more try
+            # before calling the card missing.
+            _CARD_ALIASES.pop(own_key)
+
+            if USE_LISTING_STORE:
+                _queue_store_write(dead_alias=own_key)
 
-    parse_tasks = [
-        loop.run_in_executor(PARSE_EXECUTOR, parse_card_listings, html, card_name)
-        for card_name, html in zip(card_names, htmls)
-        if html
+            result = await _shared_fetch(card_name, own_key, own_url)
+
+        if result is None:
+            return card_name, []
+
+        return card_name, result.listings
+
+    tasks = [
+        asyncio.create_task(_fetch_and_parse(card_name)) for card_name in pending_cards
     ]
 
-    parsed_lists = await asyncio.gather(*parse_tasks)
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        if USE_LISTING_STORE:
+            await flush_store_writes()
+
+
+def _join_or_start_fetch(
+    key: str,
+    card_name: str,
+    url: str,
+    client: AsyncClient,
+    stale_listings: list[CardListing] | None,
+) -> asyncio.Task[_CardFetch | None]:
+    """Single-flight: concurrent callers for one page share a single fetch task.
+
+    ``key`` is the alias-resolved cache key, so names known to land on the
+    same page join one fetch. The task queues its own result for the listing
+    store, so it is saved once even if the caller that started it has gone.
+    """
+    flight = _IN_FLIGHT.get(key)
+
+    if flight is not None:
+        return flight
+
+    flight = asyncio.create_task(
+        _fetch_and_store_card(card_name, key, url, client, stale_listings)
+    )
+    _IN_FLIGHT[key] = flight
+
+    def _forget(done: asyncio.Task[_CardFetch | None]) -> None:
+        if _IN_FLIGHT.get(key) is done:
+            del _IN_FLIGHT[key]
+
+    flight.add_done_callback(_forget)
+
+    return flight
+
+
+async def _fetch_and_store_card(
+    card_name: str,
+    key: str,
+    url: str,
+    client: AsyncClient,
+    stale_listings: list[CardListing] | None,
+) -> _CardFetch | None:
+    result = await _fetch_card(card_name, key, url, client, stale_listings)
+
+    if result is not None and USE_LISTING_STORE:
+        _queue_store_write(result)
+
+    return result
+
+
+async def _fetch_card(
+    card_name: str,
+    key: str,
+    url: str,
+    client: AsyncClient,
+    stale_listings: list[CardListing] | None,
+) -> _CardFetch | None:
+    failures, retry_at = _TRANSIENT_FAILURES.get(key) or (0, 0.0)
+
+    if time.monotonic() < retry_at:
+        increment("scrape.fetch.backoff_skips")
+        return None
+
+    validators = None if stale_listings is None else _PAGE_VALIDATORS.get(url)
+
+    page = await fetch_card_page(client, url, validators)
+
+    if page is None:
+        # Errors and timeouts are not negatively cached, but a page that
+        # keeps failing is backed off instead of refetched on every search.
+        failures += 1
+        _TRANSIENT_FAILURES.set(key, (failures, _transient_retry_at(failures)))
+        LOG.debug("scrape_cards: %s failed (%d in a row)", url, failures)
+        return None
+
+    _TRANSIENT_FAILURES.pop(key)
+    _MISSING_CARDS.pop(key)
+    result = _CardFetch(key=key, url=page.url, listings=[])
+
+    if page.not_found:
+        _CARD_LISTINGS_CACHE.pop(key)
+
+        if (key, url) != (_card_cache_key(card_name), card_page_url(card_name)):
+            # Reached through an alias: callers retry their own URL instead.
+            result.dead_alias = True
+            return result
+
+        _MISSING_CARDS.set(key, True)
+        result.missing = True
+        return result
+
+    if page.etag or page.last_modified:
+        result.validators = (page.etag, page.last_modified)
+        _PAGE_VALIDATORS.set(page.url, result.validators)
+
+    if page.not_modified and stale_listings is not None:
+        result.listings = stale_listings
+        result.revalidated = True
+    elif page.html:
+        result.digest = page_digest(page.html)
+
+        if stale_listings is not None and _PAGE_DIGESTS.get(key) == result.digest:
+            # Same bytes as last time: the stored listings are still current.
+            increment("scrape.parse_memo.hit")
+            result.listings = stale_listings
+            result.revalidated = True
+        else:
+            if stale_listings is not None:
+                increment("scrape.parse_memo.miss")
+
+            page_card_name, result.listings = await parse_card_page_async(
+                page.html, card_name
+            )
+            result.parsed = True
+            _learn_card_alias(result, card_name, page_card_name)
+
+            if ARCHIVE_CARD_PAGES:
+                result.archived = archive_page(
+                    page.url, result.key, card_name, page.html, page.partial
+                )
+    else:
+        return None
+
+    _CARD_LISTINGS_CACHE.set(result.key, result.listings)
+
+    if result.digest is not None:
+        _PAGE_DIGESTS.set(result.key, result.digest)
+
+    return result
+
+
+def _transient_retry_at(failures: int) -> float:
+    if failures < TRANSIENT_FAILURES_BEFORE_BACKOFF:
+        return 0.0
+
+    delay = TRANSIENT_BACKOFF_BASE_SECONDS * 2 ** (
+        failures - TRANSIENT_FAILURES_BEFORE_BACKOFF
+    )
+
+    return time.monotonic() + min(delay, TRANSIENT_BACKOFF_MAX_SECONDS)
+
 
-    now_after_parse = time.monotonic()
+def _learn_card_alias(result: _CardFetch, card_name: str, page_card_name: str) -> None:
+    """Points the requested name (and the page's own name) at the final URL.
 
-    for card_name, listings in zip(card_names, parsed_lists):
+    Only redirects and renamed pages are recorded; everything else already
+    resolves to itself.
+    """
+    canonical_key = _card_cache_key(page_card_name) or result.key
+    aliases: dict[str, tuple[str, str]] = {}
+
+    for name in (card_name, page_card_name):
+        alias = _card_cache_key(name)
+
+        if alias and (alias, card_page_url(name)) != (canonical_key, result.url):
+            aliases[alias] = (canonical_key, result.url)
+
+    for alias, target in aliases.items():
+        _CARD_ALIASES.set(alias, target)
+
+    result.key = canonical_key
+    result.aliases = aliases
+
+
+async def _load_card_aliases(card_names: list[str]) -> None:
+    unknown: dict[str, str] = {}
+
+    for card_name in card_names:
         key = _card_cache_key(card_name)
-        _CARD_LISTINGS_CACHE[key] = (
-            now_after_parse + CARD_LISTINGS_TTL_SECONDS,
-            listings,
+
+        if _CARD_ALIASES.get(key) is None:
+            unknown[key] = card_name
+
+    if not unknown:
+        return
+
+    try:
+        stored = await load_aliases(list(unknown), LISTING_STORE_MAX_AGE_SECONDS)
+    except Exception:
+        LOG.exception("scrape_cards: card alias lookup failed")
+        return
+
+    # Names without a stored alias resolve to themselves; remembering that
+    # keeps repeat searches from asking the store again.
+    for key, card_name in unknown.items():
+        _CARD_ALIASES.set(key, stored.get(key) or (key, card_page_url(card_name)))
+
+
+def _queue_store_write(
+    result: _CardFetch | None = None, dead_alias: str | None = None
+) -> None:
+    """Queues a fetch result (or a dead alias) for the listing store writer."""
+    global _STORE_WRITER
+
+    if result is not None:
+        _STORE_WRITES.add(result)
+
+    if dead_alias is not None:
+        _STORE_WRITES.dead_aliases.append(dead_alias)
+
+    if _STORE_WRITER is None or _STORE_WRITER.done():
+        _STORE_WRITER = asyncio.create_task(_write_store())
+
+
+async def _write_store() -> None:
+    """Saves queued results until none are left.
+
+    Results queued while a save runs are saved together by the next one, so
+    a burst of fetches costs a few transactions rather than one per page.
+    """
+    global _STORE_WRITES
+
+    while _STORE_WRITES:
+        writes, _STORE_WRITES = _STORE_WRITES, _StoreWrites()
+        await _persist_scrape_results(writes)
+
+
+async def flush_store_writes() -> None:
+    """Waits until every queued fetch result has been saved."""
+    if _STORE_WRITER is not None and not _STORE_WRITER.done():
+        # Shielded: a caller cancelled while waiting doesn't lose the writes.
+        await asyncio.shield(_STORE_WRITER)
+
+
+async def _persist_scrape_results(writes: _StoreWrites) -> None:
+    try:
+        await save_pages(writes.pages)
+    except Exception:
+        LOG.exception("scrape_cards: could not archive %s page(s)", len(writes.pages))
+
+    try:
+        await save_listings(
+            writes.fetched,
+            writes.digests,
+            PARSER_VERSION,
+            LISTING_STORE_MAX_AGE_SECONDS,
+        )
+        await touch_listings(writes.revalidated)
+        await save_missing(writes.missing, MISSING_CARD_TTL_SECONDS)
+        await save_validators(writes.validators)
+        # Before saving, so a dead alias that was just relearned is kept.
+        await delete_aliases(writes.dead_aliases)
+        await save_aliases(writes.aliases, LISTING_STORE_MAX_AGE_SECONDS)
+    except Exception:
+        LOG.exception(
+            "scrape_cards: could not persist %s listing(s)",
+            len(writes.fetched) + len(writes.revalidated),
         )
-        all_listings.extend(listings)
 
-    return all_listings
 
+def get_parse_executor() -> Executor | None:
+    """Returns the executor for ``PARSE_MODE``, creating it on first use."""
+    global _PARSE_EXECUTOR, _PARSE_EXECUTOR_MODE
 
-def parse_listings_from_text(soup: BeautifulSoup, card_name: str) -> list[CardListing]:
-    listings: list[CardListing] = []
-    full_text = soup.get_text()
+    if PARSE_MODE == "inline":
+        return None
+
+    if _PARSE_EXECUTOR is not None and _PARSE_EXECUTOR_MODE == PARSE_MODE:
+        return _PARSE_EXECUTOR
+
+    shutdown_parse_executor()
+
+    if PARSE_MODE == "process":
+        _PARSE_EXECUTOR = ProcessPoolExecutor(
+            max_workers=PARSE_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_parse_worker,
+            initargs=(get_parser_engine(),),
+        )
+    else:
+        _PARSE_EXECUTOR = ThreadPoolExecutor(
+            max_workers=PARSE_MAX_WORKERS, thread_name_prefix="card-parse"
+        )
+
+    _PARSE_EXECUTOR_MODE = PARSE_MODE
+
+    return _PARSE_EXECUTOR
+
+
+def shutdown_parse_executor() -> None:
+    global _PARSE_EXECUTOR, _PARSE_EXECUTOR_MODE
+
+    if _PARSE_EXECUTOR is not None:
+        _PARSE_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _PARSE_EXECUTOR = None
+        _PARSE_EXECUTOR_MODE = None
+
+
+def set_page_archiving(enabled: bool) -> None:
+    global ARCHIVE_CARD_PAGES
+
+    ARCHIVE_CARD_PAGES = enabled
+
+
+def set_parse_mode(mode: str) -> None:
+    global PARSE_MODE
+
+    if mode not in PARSE_MODES:
+        raise ValueError(
+            f"Unknown parse mode {mode!r}; choose from {', '.join(PARSE_MODES)}"
+        )
+
+    PARSE_MODE = mode
+
+
+def _warm_parse_worker(engine: str) -> None:
+    set_parser_engine(engine)
+    build_document("<html><body></body></html>", engine)
+
+
+def parse_compact(parse: Callable[..., tuple], *args: object) -> tuple:
+    """Process-pool entry point: ``parse(*args)`` with its listings as tuples.
+
+    Tuples pickle far cheaper than dataclasses.
+    """
+    return tuple(
+        [_compact_listing(listing) for listing in value]
+        if isinstance(value, list)
+        else value
+        for value in parse(*args)
+    )
+
+
+def _compact_listing(listing: CardListing) -> CompactListing:
+    return (
+        listing.name,
+        listing.set,
+        listing.code,
+        listing.price_cents,
+        listing.rarity,
+        listing.condition,
+        listing.stock,
+    )
+
+
+async def run_parse(
+    parse: Callable[[str, str, str], _ParseResult], html: str, name: str
+) -> _ParseResult:
+    """Runs ``parse(html, name, engine)`` on the executor for ``PARSE_MODE``.
+
+    ``parse`` must be a module-level function returning a tuple in which
+    every list holds ``CardListing``s, so process workers can return them
+    compactly.
+    """
+    executor = get_parse_executor()
+    engine = get_parser_engine()
+
+    if executor is None:
+        return parse(html, name, engine)
+
+    loop = asyncio.get_running_loop()
+
+    if not isinstance(executor, ProcessPoolExecutor):
+        return await loop.run_in_executor(executor, parse, html, name, engine)
+
+    try:
+        compact = await loop.run_in_executor(
+            executor, parse_compact, parse, html, name, engine
+        )
+    except BrokenProcessPool:
+        LOG.warning("parse process pool died; parsing %r in a thread", name)
+        shutdown_parse_executor()
+        return await asyncio.to_thread(parse, html, name, engine)
+
+    return cast(
+        _ParseResult,
+        tuple(
+            [CardListing(*row) for row in value] if isinstance(value, list) else value
+            for value in compact
+        ),
+    )
 
-    code_pattern = re.compile(r"Card #:\s*([A-Z]{2,4}\d*-[A-Z]{2,3}\d+)")
-    codes = code_pattern.findall(full_text)
 
-    for code in codes:
-        code_pos = full_text.find("Card #:" + code)
-        if code_pos == -1:
-            code_pos = full_text.find(code)
+async def parse_card_listings_async(html: str, card_name: str) -> list[CardListing]:
+    _page_card_name, listings = await parse_card_page_async(html, card_name)
 
-        if code_pos == -1:
+    return listings
+
+
+async def parse_card_page_async(
+    html: str, card_name: str
+) -> tuple[str, list[CardListing]]:
+    # Timed from the event loop: pool workers have their own metrics registry,
+    # so this includes the queueing and pickling cost of thread/process modes.
+    with timed("scrape.parse_card_listings"):
+        return await run_parse(parse_card_page, html, card_name)
+
+
+async def _load_from_listing_store(
+    card_names: list[str], stale: dict[str, list[CardListing]]
+) -> dict[str, list[CardListing]]:
+    """Returns fresh stored listings; expired ones are added to ``stale``.
+
+    Known-missing pages from the store are loaded into ``_MISSING_CARDS``.
+    """
+    keys = [_card_target(card_name)[0] for card_name in card_names]
+
+    try:
+        stored = await load_listings(keys, LISTING_STORE_MAX_AGE_SECONDS)
+        stored_missing = await load_missing(keys, MISSING_CARD_TTL_SECONDS)
+    except Exception:
+        LOG.exception("scrape_cards: listing store lookup failed")
+        return {}
+
+    wall_now = time.time()
+    found: dict[str, list[CardListing]] = {}
+
+    for key, checked_at in stored_missing.items():
+        _MISSING_CARDS.set(
+            key, True, MISSING_CARD_TTL_SECONDS - (wall_now - checked_at)
+        )
+
+    for key, (fetched_at, listings) in stored.items():
+        remaining = LISTING_STORE_TTL_SECONDS - (wall_now - fetched_at)
+
+        if remaining <= 0:
+            stale.setdefault(key, listings)
             continue
 
-        start = max(0, code_pos - 500)
-        end = min(len(full_text), code_pos + 300)
-        section = full_text[start:end]
+        _CARD_LISTINGS_CACHE.set(
+            key, listings, min(CARD_LISTINGS_TTL_SECONDS, remaining)
+        )
+        found[key] = listings
+
+    return found
+
+
+async def _load_page_validators(urls: list[str]) -> None:
+    missing = [url for url in urls if _PAGE_VALIDATORS.get(url) is None]
+
+    if not missing:
+        return
+
+    try:
+        for url, validators in (await load_validators(missing)).items():
+            _PAGE_VALIDATORS.set(url, validators)
+    except Exception:
+        LOG.exception("scrape_cards: page validator lookup failed")
+
+
+async def _load_page_digests(keys: list[str]) -> None:
+    missing = [key for key in keys if _PAGE_DIGESTS.get(key) is None]
+
+    if not missing:
+        return
+
+    try:
+        for key, digest in (await load_digests(missing)).items():
+            _PAGE_DIGESTS.set(key, digest)
+    except Exception:
+        LOG.exception("scrape_cards: page digest lookup failed")
+
+
+def page_digest(html: str) -> str:
+    """Fingerprint of a page body for the parser version that reads it."""
+    digest = hashlib.blake2b(html.encode(), digest_size=16).hexdigest()
+
+    return f"{PARSER_VERSION}:{digest}"
+
+
+class _SoupDocument:
+    def __init__(self, html: str, features: str) -> None:
+        self._soup = BeautifulSoup(html, features)
+
+        # Match the lexbor engine, which strips these before reading text.
+        for node in self._soup(["script", "style"]):
+            node.decompose()
+
+    def select(self, selector: str) -> list:
+        return self._soup.select(selector)
+
+    def select_one(self, selector: str):
+        return self._soup.select_one(selector)
+
+    def node_text(self, node, strip: bool = False) -> str:
+        return node.get_text(strip=strip)
+
+    def node_attribute(self, node, name: str) -> str | None:
+        value = node.get(name)
+        return value if isinstance(value, str) else None
+
+    def row_text(self, row, selector: str) -> str:
+        node = row.select_one(selector)
+        return "" if node is None else node.get_text(strip=True)
+
+    def row_set_name(self, row) -> str:
+        return self.row_text(row, SET_LINK_SELECTOR)
 
-        rarity = "Unknown"
-        rarity_match = re.search(r"Rarity:\s*([A-Za-z\s]+?)(?:Card #|$)", section)
-        if rarity_match:
-            rarity = rarity_match.group(1).strip()
+    def text(self) -> str:
+        return self._soup.get_text()
 
-        price = "N/A"
-        price_match = re.search(r"\$(\d+\.?\d*)", section[section.find(code) :])
-        if price_match:
-            price = f"${price_match.group(1)}"
 
-        stock = 0
-        stock_match = re.search(
-            r"(?:Only\s+)?(\d+)\s+In Stock", section[section.find(code) :]
+class _LexborDocument:
+    def __init__(self, html: str) -> None:
+        self._tree = LexborHTMLParser(html)
+        self._tree.strip_tags(["script", "style"])
+
+    def select(self, selector: str) -> list:
+        return self._tree.css(selector)
+
+    def select_one(self, selector: str):
+        return self._tree.css_first(selector)
+
+    def node_text(self, node, strip: bool = False) -> str:
+        return node.text(strip=strip)
+
+    def node_attribute(self, node, name: str) -> str | None:
+        return node.attributes.get(name)
+
+    def row_text(self, row, selector: str) -> str:
+        node = row.css_first(selector)
+        return "" if node is None else node.text(strip=True)
+
+    def row_set_name(self, row) -> str:
+        return self.row_text(row, SET_LINK_SELECTOR)
+
+    def text(self) -> str:
+        return self._tree.root.text() if self._tree.root is not None else ""
+
+
+HtmlDocument = _SoupDocument | _LexborDocument
+
+
+def available_parser_engines() -> list[str]:
+    engines: list[str] = []
+
+    if LexborHTMLParser is not None:
+        engines.append("selectolax")
+
+    if LXML_AVAILABLE:
+        engines.append("lxml")
+
+    engines.append("html.parser")
+
+    return engines
+
+
+def get_parser_engine() -> str:
+    if PARSER_ENGINE is not None:
+        return PARSER_ENGINE
+
+    return available_parser_engines()[0]
+
+
+def set_parser_engine(engine: str | None) -> None:
+    """Forces a parser engine; ``None`` restores automatic selection."""
+    global PARSER_ENGINE
+
+    if engine is not None and engine not in available_parser_engines():
+        raise ValueError(
+            f"Parser engine {engine!r} is not available; "
+            f"choose from {', '.join(available_parser_engines())}"
         )
-        if stock_match:
-            stock = int(stock_match.group(1))
-
-        condition = "Unknown"
-        condition_section = section[section.find(code) :]
-        if "Near Mint" in condition_section[:100]:
-            condition = "Near Mint"
-        elif "Played" in condition_section[:100]:
-            condition = "Played"
-
-        if code and price != "N/A":
-            listings.append(
-                CardListing(
-                    name=card_name,
-                    code=code,
-                    price=price,
-                    rarity=rarity,
-                    condition=condition,
-                    stock=stock,
+
+    PARSER_ENGINE = engine
+
+
+def build_document(html: str, engine: str | None = None) -> HtmlDocument:
+    engine = engine or get_parser_engine()
+
+    if engine == "selectolax":
+        return _LexborDocument(html)
+
+    if engine in PARSER_ENGINES:
+        return _SoupDocument(html, engine)
+
+    raise ValueError(f"Unknown parser engine: {engine!r}")
+
+
+def parse_listings_from_text(full_text: str, card_name: str) -> list[CardListing]:
+    """Reads listings from a page's plain text when no product row matched.
+
+    Walks the text once: each ``Card #:`` starts a listing, taking the
+    ``Rarity:`` right before it, and the price, stock and condition that
+    follow it (up to the next card number) fill it in.
+    """
+    listings: list[CardListing] = []
+    code: str | None = None
+    rarity = condition = "Unknown"
+    price_cents: int | None = None
+    stock: int | None = None
+    code_start = window_end = 0
+
+    for match in _TEXT_LISTING_TOKEN_PATTERN.finditer(full_text):
+        if match["code"] is not None:
+            if code is not None and price_cents is not None:
+                listings.append(
+                    CardListing(
+                        card_name, "", code, price_cents, rarity, condition, stock or 0
+                    )
                 )
-            )
+
+            code = match["code"]
+            rarity = (match["rarity"] or "").strip() or "Unknown"
+            condition = "Unknown"
+            price_cents = stock = None
+            code_start = match.start("code")
+            window_end = code_start + TEXT_LISTING_WINDOW_CHARS
+            continue
+
+        if code is None or match.end() > window_end:
+            continue
+
+        if match["price"] is not None:
+            if price_cents is None:
+                price_cents = parse_price_cents(match["price"])
+        elif match["stock"] is not None:
+            if stock is None:
+                stock = int(match["stock"])
+        elif match.end() <= code_start + TEXT_CONDITION_WINDOW_CHARS:
+            if condition != "Near Mint":
+                condition = match["condition"]
+
+    if code is not None and price_cents is not None:
+        listings.append(
+            CardListing(card_name, "", code, price_cents, rarity, condition, stock or 0)
+        )
 
     return listings
 
 
-def extract_listing_from_row(row, card_name: str) -> CardListing | None:
-    row_text = row.get_text()
+def extract_listing_from_row(
+    document: HtmlDocument, row, card_name: str
+) -> CardListing | None:
+    row_text = document.node_text(row)
 
     if "$" not in row_text:
         return None
@@ -205,75 +1086,352 @@ def extract_listing_from_row(row, card_name: str) -> CardListing | None:
     if stock_match:
         stock = int(stock_match.group(1))
 
-    price = "N/A"
-    price_match = re.search(r"\$\s*(\d+\.?\d*)", row_text)
-    if price_match:
-        price = f"${price_match.group(1)}"
+    price_cents = parse_price_cents(row_text)
 
-    set_name = ""
-    set_link = row.select_one("a.ItemSet.display-title")
-    if set_link is not None:
-        set_name = set_link.get_text(strip=True)
+    set_name = document.row_set_name(row)
 
     return CardListing(
         name=f"{card_name} - {set_name}",
         set=set_name,
         code=code,
-        price=price,
+        price_cents=price_cents,
         rarity=rarity,
         condition=condition,
         stock=stock,
     )
 
 
-def parse_card_listings(html: str, card_name: str) -> list[CardListing]:
-    soup = BeautifulSoup(html, "html.parser")
+def parse_card_listings(
+    html: str, card_name: str, engine: str | None = None
+) -> list[CardListing]:
+    _page_card_name, listings = parse_card_page(html, card_name, engine)
+
+    return listings
+
+
+def parse_card_page(
+    html: str, card_name: str, engine: str | None = None
+) -> tuple[str, list[CardListing]]:
+    """Parses a card page into its canonical card name and listings.
+
+    With ``SCOPED_PARSE`` only the card header and products container are
+    handed to the HTML parser. The whole page is parsed instead when the
+    container is missing or unterminated, or when it has prices but no row
+    could be read from it, which is what a markup change looks like.
+    """
+    if SCOPED_PARSE:
+        region = extract_product_region(html)
+
+        if region is not None:
+            page_card_name, listings = _parse_listings_document(
+                build_document(region.html, engine), card_name, text_fallback=False
+            )
+
+            if listings or not region.has_prices:
+                return page_card_name, listings
+
+        increment("scrape.parse.full_page_fallbacks")
+        LOG.debug("parse_card_listings: no usable products container for %r", card_name)
+
+    return _parse_listings_document(build_document(html, engine), card_name)
+
+
+def _parse_listings_document(
+    document: HtmlDocument, card_name: str, text_fallback: bool = True
+) -> tuple[str, list[CardListing]]:
     listings: list[CardListing] = []
 
-    page_card_name = extract_page_card_name(soup, card_name)
-    product_rows = soup.select("div.products-container div.row")
+    page_card_name = extract_page_card_name(document, card_name)
+    product_rows: list = []
 
-    if not product_rows:
-        product_rows = soup.select("div.row.product-row")
+    for selector in PRODUCT_ROW_SELECTORS:
+        product_rows = document.select(selector)
 
-    if not product_rows:
-        product_rows = soup.find_all("div", class_="row")
+        if product_rows:
+            break
 
     for row in product_rows:
         try:
-            listing = extract_listing_from_row(row, page_card_name)
+            listing = extract_listing_from_row(document, row, page_card_name)
             if listing:
                 listings.append(listing)
         except Exception:
             continue
 
-    if not listings:
-        listings = parse_listings_from_text(soup, page_card_name)
+    if not listings and text_fallback:
+        listings = parse_listings_from_text(document.text(), page_card_name)
 
-    return deduplicate_listings(listings)
+    return page_card_name, deduplicate_listings(listings)
 
 
-def extract_page_card_name(soup: BeautifulSoup, default_name: str) -> str:
-    header = soup.find("h1", class_="card-name")
+def extract_page_card_name(document: HtmlDocument, default_name: str) -> str:
+    header = document.select_one(CARD_NAME_SELECTOR)
     if header is None:
         return default_name
 
-    page_name = header.get_text(strip=True)
+    page_name = document.node_text(header, strip=True)
     if not page_name:
         return default_name
 
     return page_name
 
 
-async def fetch_card_page(client: AsyncClient, url: str) -> str | None:
+async def fetch_card_page(
+    client: AsyncClient,
+    url: str,
+    validators: tuple[str | None, str | None] | None = None,
+    scoped: bool = True,
+) -> CardPage | None:
+    """GETs ``url`` through the host rate limiter and the adaptive limiter.
+
+    With ``scoped`` (card pages) the page is returned once the products
+    container closes; pass False for pages whose content lies beyond it.
+    Each attempt must finish within ``CARD_FETCH_DEADLINE_SECONDS``. With
+    ``HEDGE_CARD_FETCHES``, a card page attempt still running after the
+    recent p95 card page latency gets one duplicate, and whichever succeeds
+    first wins. Other pages (search results) are neither hedged nor counted
+    in that latency, since they are slower and would skew it.
+    """
+    headers: dict[str, str] = {}
+
+    if validators is not None:
+        etag, last_modified = validators
+
+        if etag:
+            headers["If-None-Match"] = etag
+
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    hedge_delay = _hedge_delay() if HEDGE_CARD_FETCHES and scoped else None
+
+    if hedge_delay is None:
+        return await _fetch_card_page_once(client, url, headers, validators, scoped)
+
+    return await _hedged_fetch(
+        lambda started: _fetch_card_page_once(
+            client, url, headers, validators, scoped, started
+        ),
+        hedge_delay,
+    )
+
+
+async def _hedged_fetch(
+    fetch: Callable[[asyncio.Event | None], Awaitable[CardPage | None]],
+    hedge_delay: float,
+) -> CardPage | None:
+    # The hedge timer starts once the first attempt holds its limiter slot,
+    # so time spent waiting on the rate or concurrency limits doesn't count.
+    started = asyncio.Event()
+    primary = asyncio.create_task(fetch(started))
+    pending: set[asyncio.Task[CardPage | None]] = {primary}
+    started_wait = asyncio.create_task(started.wait())
+
     try:
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.text
+        await asyncio.wait({primary, started_wait}, return_when=FIRST_COMPLETED)
+
+        if not primary.done():
+            await asyncio.wait({primary}, timeout=hedge_delay)
+
+        if primary.done():
+            return primary.result()
+
+        increment("scrape.fetch.hedged")
+        pending.add(asyncio.create_task(fetch(None)))
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+
+            for task in done:
+                page = task.result()
+
+                if page is not None:
+                    if task is not primary:
+                        increment("scrape.fetch.hedge_won")
+
+                    return page
+
+        return None
+    finally:
+        started_wait.cancel()
+
+        for task in pending:
+            task.cancel()
+
+
+def _hedge_delay() -> float | None:
+    """The recent p95 fetch latency, or None until there are enough samples."""
+    if len(_FETCH_LATENCIES) < HEDGE_MIN_SAMPLES:
+        return None
+
+    latencies = sorted(_FETCH_LATENCIES)
+    p95 = latencies[int(HEDGE_LATENCY_QUANTILE * (len(latencies) - 1))]
+
+    return max(HEDGE_MIN_DELAY_SECONDS, p95)
+
+
+async def _fetch_card_page_once(
+    client: AsyncClient,
+    url: str,
+    headers: dict[str, str],
+    validators: tuple[str | None, str | None] | None,
+    scoped: bool,
+    started: asyncio.Event | None = None,
+) -> CardPage | None:
+    # Wait for a token before taking a concurrency slot, so paced requests
+    # don't hold slots while they sleep.
+    with timed("scrape.rate_limit_wait"):
+        await HOST_RATE_LIMITER.acquire(url)
+
+    with timed("scrape.limiter_wait"):
+        await SCRAPE_LIMITER.acquire()
+
+    if started is not None:
+        started.set()
+
+    started_at = time.monotonic()
+    response: Response | None = None
+    unread_body: AsyncIterator[bytes] | None = None
+
+    try:
+        async with asyncio.timeout(CARD_FETCH_DEADLINE_SECONDS):
+            response = await client.send(
+                client.build_request("GET", url, headers=headers), stream=True
+            )
+            _record_fetch_outcome(response.status_code, time.monotonic() - started_at)
+
+            if response.history:
+                increment("scrape.fetch.redirected")
+
+            if response.status_code == 304 and validators is not None:
+                increment("scrape.fetch.not_modified")
+                _record_fetch_latency(time.monotonic() - started_at, scoped)
+                etag, last_modified = validators
+                return CardPage(
+                    url=str(response.url),
+                    html=None,
+                    etag=response.headers.get("ETag", etag),
+                    last_modified=response.headers.get("Last-Modified", last_modified),
+                    not_modified=True,
+                )
+
+            response.raise_for_status()
+            html, partial, unread_body = await _read_card_page_body(response, scoped)
+            _record_fetch_latency(time.monotonic() - started_at, scoped)
+            increment("scrape.bytes_received", response.num_bytes_downloaded)
+
+            return CardPage(
+                url=str(response.url),
+                html=html,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                partial=partial,
+            )
     except HTTPStatusError as error:
-        if error.response.status_code == 404:
-            return None
+        if error.response.status_code in (404, 410):
+            increment("scrape.fetch.not_found")
+            return CardPage(url=url, html=None, not_found=True)
 
+        increment("scrape.fetch.http_errors")
+        return None
+    except TimeoutException:
+        SCRAPE_LIMITER.on_overload()
+        increment("scrape.fetch.timeouts")
+        return None
+    except TimeoutError:
+        SCRAPE_LIMITER.on_overload()
+        increment("scrape.fetch.deadline_exceeded")
         return None
     except RequestError:
+        increment("scrape.fetch.request_errors")
         return None
+    finally:
+        SCRAPE_LIMITER.release()
+
+        if unread_body is not None:
+            _drain_in_background(response, unread_body)
+        elif response is not None:
+            await response.aclose()
+
+
+def _record_fetch_latency(latency_seconds: float, card_page: bool) -> None:
+    if not card_page:
+        observe("scrape.fetch_search_page", latency_seconds)
+        return
+
+    observe("scrape.fetch_card_page", latency_seconds)
+    _FETCH_LATENCIES.append(latency_seconds)
+
+
+async def _read_card_page_body(
+    response: Response, scoped: bool
+) -> tuple[str, bool, AsyncIterator[bytes] | None]:
+    """Reads the page until the header and products container are in.
+
+    Returns the HTML, whether it is only the product region, and the unread
+    rest of the body when it still has to be drained. The region is returned
+    as soon as the container closes. On HTTP/2 the stream is then reset,
+    which is cheap, so the footer and trailing scripts aren't downloaded. On
+    HTTP/1.1 leaving early would close the connection, so the caller drains
+    the rest in the background (``_drain_in_background``) and the connection
+    goes back to the pool.
+    Pages without a recognisable container are read in full, as are all
+    pages while ``ARCHIVE_CARD_PAGES`` is on so the archive can be reparsed.
+    """
+    if not (scoped and STREAM_CARD_PAGES and SCOPED_PARSE) or ARCHIVE_CARD_PAGES:
+        await response.aread()
+        return response.text, False, None
+
+    scanner = ProductRegionScanner()
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+        errors="replace"
+    )
+    body = response.aiter_bytes()
+    # Only kept in case the page has no container to fall back on.
+    chunks: list[str] = []
+
+    async for data in body:
+        chunk = decoder.decode(data)
+
+        if scanner.feed(chunk):
+            region = scanner.region().html
+
+            if response.http_version == "HTTP/2":
+                increment("scrape.fetch.early_close")
+                return region, True, None
+
+            return region, True, body
+
+        chunks.append(chunk)
+
+    chunks.append(decoder.decode(b"", final=True))
+
+    return "".join(chunks), False, None
+
+
+def _drain_in_background(response: Response, body: AsyncIterator[bytes]) -> None:
+    task = asyncio.create_task(_drain_body(response, body))
+    _BODY_DRAINS.add(task)
+    task.add_done_callback(_BODY_DRAINS.discard)
+
+
+async def _drain_body(response: Response, body: AsyncIterator[bytes]) -> None:
+    """Reads and drops the rest of an HTTP/1.1 body so the connection is reused."""
+    read_before = response.num_bytes_downloaded
+
+    try:
+        async with asyncio.timeout(CARD_FETCH_DEADLINE_SECONDS):
+            async for _data in body:
+                pass
+    except (RequestError, TimeoutError):
+        increment("scrape.fetch.drain_errors")
+    finally:
+        await response.aclose()
+        increment("scrape.bytes_received", response.num_bytes_downloaded - read_before)
+
+
+def _record_fetch_outcome(status_code: int, latency_seconds: float) -> None:
+    if status_code == 429 or status_code >= 500:
+        SCRAPE_LIMITER.on_overload()
+    else:
+        SCRAPE_LIMITER.on_success(latency_seconds)
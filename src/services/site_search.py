@@ -0,0 +1,130 @@
+import logging
+import re
+from dataclasses import dataclass
+from urllib.parse import quote_plus
+
+from src.models.cards import CardListing
+from src.services.scraper import (
+    HtmlDocument,
+    build_document,
+    extract_listing_from_row,
+    fetch_card_page,
+    get_scraper_client,
+    run_parse,
+)
+from src.utils.constants import (
+    BASE_URL_SEARCH,
+    SEARCH_DEFAULT_PAGE,
+    SEARCH_RESULTS_PER_PAGE,
+)
+from src.utils.utils import deduplicate_listings
+
+
+LOG = logging.getLogger(__name__)
+
+SEARCH_ROW_SELECTORS = (
+    "div.products-container div.row",
+    "div.row.product-search-row",
+    "div.row.product-row",
+)
+SEARCH_NAME_SELECTORS = (
+    "[itemprop=name]",
+    "a.productLink",
+    "h3 a",
+)
+PAGINATION_LINK_SELECTOR = 'a[href*="page="]'
+
+_PAGE_PARAM_PATTERN = re.compile(r"[?&]page=(\d+)")
+
+
+@dataclass
+class SearchResultsPage:
+    query: str
+    page: int
+    listings: list[CardListing]
+    has_more: bool
+
+
+def search_page_url(query: str, page: int = SEARCH_DEFAULT_PAGE) -> str:
+    return (
+        f"{BASE_URL_SEARCH}?pa=searchOnName&page={page}"
+        f"&resultsPerPage={SEARCH_RESULTS_PER_PAGE}&q={quote_plus(query)}"
+    )
+
+
+async def fetch_search_page(
+    query: str, page: int = SEARCH_DEFAULT_PAGE
+) -> SearchResultsPage | None:
+    """Fetches one page of CoolStuffInc's own name search.
+
+    Returns None when the page could not be fetched, so callers can fall
+    back to per-card lookups.
+    """
+    client = await get_scraper_client()
+    result = await fetch_card_page(client, search_page_url(query, page), scoped=False)
+
+    if result is None or result.not_found or not result.html:
+        return None
+
+    listings, last_page, row_count = await run_parse(
+        parse_search_results, result.html, query
+    )
+    has_more = (
+        last_page > page
+        if last_page is not None
+        else row_count >= SEARCH_RESULTS_PER_PAGE
+    )
+
+    return SearchResultsPage(query, page, listings, has_more)
+
+
+def parse_search_results(
+    html: str, query: str, engine: str | None = None
+) -> tuple[list[CardListing], int | None, int]:
+    """Returns the page's listings, the last linked page number and its row count."""
+    document = build_document(html, engine)
+    rows: list = []
+
+    for selector in SEARCH_ROW_SELECTORS:
+        rows = document.select(selector)
+
+        if rows:
+            break
+
+    listings: list[CardListing] = []
+
+    for row in rows:
+        try:
+            listing = extract_listing_from_row(
+                document, row, _row_card_name(document, row, query)
+            )
+        except Exception:
+            LOG.debug("parse_search_results: skipping unreadable row", exc_info=True)
+            continue
+
+        if listing is not None:
+            listings.append(listing)
+
+    return deduplicate_listings(listings), _last_page(document), len(rows)
+
+
+def _row_card_name(document: HtmlDocument, row, default_name: str) -> str:
+    for selector in SEARCH_NAME_SELECTORS:
+        name = document.row_text(row, selector)
+
+        if name:
+            return name
+
+    return default_name
+
+
+def _last_page(document: HtmlDocument) -> int | None:
+    last_page: int | None = None
+
+    for link in document.select(PAGINATION_LINK_SELECTOR):
+        match = _PAGE_PARAM_PATTERN.search(document.node_attribute(link, "href") or "")
+
+        if match is not None:
+            last_page = max(last_page or 0, int(match.group(1)))
+
+    return last_page
@@ -1,12 +1,14 @@
-import time
 from collections.abc import Mapping, Sequence
 from typing import TypedDict
 from urllib.parse import quote_plus
 
 from httpx import AsyncClient, HTTPStatusError, RequestError
 
+from src.services.http_transport import get_http_client
+from src.services.metrics import increment, timed
 from src.utils.constants import YGO_API_URL
 from src.utils.file_cache import load_cache_entry, save_cache_entry
+from src.utils.ttl_cache import TTLCache
 
 
 class YGOPROCardImage(TypedDict):
@@ -29,27 +31,16 @@ class YGROPROResponse(TypedDict):
     error: str | None = None
 
 
-_YGOPRO_CLIENT: AsyncClient | None = None
 YGOPRO_FUZZY_TTL_SECONDS = 900
-_YGOPRO_FUZZY_CACHE: dict[str, tuple[float, list[YGROPROResponse]]] = {}
+YGOPRO_FUZZY_CACHE_MAX_ENTRIES = 256
+_YGOPRO_FUZZY_CACHE: TTLCache[str, list[YGROPROResponse]] = TTLCache(
+    YGOPRO_FUZZY_TTL_SECONDS, max_entries=YGOPRO_FUZZY_CACHE_MAX_ENTRIES
+)
 USE_YGOPRO_FILE_CACHE = False
 
 
 async def get_ygopro_client() -> AsyncClient:
-    global _YGOPRO_CLIENT
-
-    if _YGOPRO_CLIENT is None:
-        _YGOPRO_CLIENT = AsyncClient()
-
-    return _YGOPRO_CLIENT
-
-
-async def close_ygopro_client() -> None:
-    global _YGOPRO_CLIENT
-
-    if _YGOPRO_CLIENT is not None:
-        await _YGOPRO_CLIENT.aclose()
-        _YGOPRO_CLIENT = None
+    return await get_http_client()
 
 
 async def fuzzy_search(query: str) -> list[YGROPROResponse]:
@@ -58,14 +49,13 @@ async def fuzzy_search(query: str) -> list[YGROPROResponse]:
     if not normalized_query:
         return []
 
-    now = time.monotonic()
-    cached = _YGOPRO_FUZZY_CACHE.get(normalized_query)
+    cached_payload = _YGOPRO_FUZZY_CACHE.get(normalized_query)
 
-    if cached is not None:
-        expires_at, cached_payload = cached
+    if cached_payload is not None:
+        increment("ygopro.fuzzy_cache.hit")
+        return cached_payload
 
-        if expires_at > now:
-            return cached_payload
+    increment("ygopro.fuzzy_cache.miss")
 
     if USE_YGOPRO_FILE_CACHE:
         file_payload = load_cache_entry("ygopro_fuzzy", normalized_query)
@@ -73,18 +63,19 @@ async def fuzzy_search(query: str) -> list[YGROPROResponse]:
         if file_payload is not None:
             try:
                 cache_value = file_payload
-                _YGOPRO_FUZZY_CACHE[normalized_query] = (
-                    now + YGOPRO_FUZZY_TTL_SECONDS,
-                    cache_value,
-                )
+                _YGOPRO_FUZZY_CACHE.set(normalized_query, cache_value)
 
                 return cache_value
             except Exception:
                 pass
 
     client = await get_ygopro_client()
-    response = await client.get(f"{YGO_API_URL}?fname={normalized_query}")
-    payload = response.json()
+
+    with timed("ygopro.fuzzy_search"):
+        response = await client.get(f"{YGO_API_URL}?fname={normalized_query}")
+        payload = response.json()
+
+    increment("ygopro.bytes_received", len(response.content))
 
     try:
         cache_value: list[YGROPROResponse]
@@ -94,10 +85,7 @@ async def fuzzy_search(query: str) -> list[YGROPROResponse]:
         else:
             cache_value = [payload]
 
-        _YGOPRO_FUZZY_CACHE[normalized_query] = (
-            now + YGOPRO_FUZZY_TTL_SECONDS,
-            cache_value,
-        )
+        _YGOPRO_FUZZY_CACHE.set(normalized_query, cache_value)
 
         if USE_YGOPRO_FILE_CACHE:
             save_cache_entry("ygopro_fuzzy", normalized_query, cache_value)
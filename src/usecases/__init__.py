@@ -1 +1 @@
-from .search_cards import search_cards
+from .search_cards import iter_search_cards, search_cards
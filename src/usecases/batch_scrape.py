@@ -0,0 +1,146 @@
+import csv
+import io
+import json
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TextIO
+
+import aiofiles
+from aiofiles.threadpool.text import AsyncTextIOWrapper
+
+from src.models.cards import CardListing
+from src.usecases.ydk_import import iter_import_deck_file
+from src.utils.utils import format_price
+
+
+OUTPUT_FORMATS = ("csv", "jsonl")
+OUTPUT_COLUMNS = (
+    "query",
+    "name",
+    "set",
+    "code",
+    "price",
+    "price_cents",
+    "rarity",
+    "condition",
+    "stock",
+)
+
+
+class BatchScrapeError(Exception):
+    """Raised when a batch scrape cannot start, e.g. an unknown output format."""
+
+
+@dataclass
+class BatchScrapeStats:
+    cards: int = 0
+    cards_without_listings: int = 0
+    listings: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def cards_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+
+        return self.cards / self.elapsed_seconds
+
+    def summary(self) -> str:
+        return (
+            f"{self.cards} cards ({self.cards_without_listings} without listings), "
+            f"{self.listings} listings in {self.elapsed_seconds:.1f}s "
+            f"({self.cards_per_second:.1f} cards/s)"
+        )
+
+
+def output_format(path: Path) -> str:
+    output = path.suffix.lower().lstrip(".")
+
+    if output not in OUTPUT_FORMATS:
+        raise BatchScrapeError(
+            f"Unsupported output type: {path.suffix or path.name} "
+            f"(expected .{' or .'.join(OUTPUT_FORMATS)})"
+        )
+
+    return output
+
+
+def _output_row(query: str, listing: CardListing) -> dict[str, object]:
+    return {
+        "query": query,
+        **asdict(listing),
+        "price": format_price(listing.price_cents),
+    }
+
+
+class _CsvRowWriter:
+    def __init__(self, stream: TextIO) -> None:
+        self._writer = csv.DictWriter(stream, fieldnames=OUTPUT_COLUMNS)
+        self._writer.writeheader()
+
+    def write(self, query: str, listing: CardListing) -> None:
+        self._writer.writerow(_output_row(query, listing))
+
+
+class _JsonlRowWriter:
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def write(self, query: str, listing: CardListing) -> None:
+        row = _output_row(query, listing)
+        self._stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+async def _write_buffered(buffer: io.StringIO, stream: AsyncTextIOWrapper) -> None:
+    await stream.write(buffer.getvalue())
+    await stream.flush()
+    buffer.seek(0)
+    buffer.truncate()
+
+
+async def write_listing_rows(
+    results: AsyncIterator[tuple[str, list[CardListing]]], out_path: str
+) -> BatchScrapeStats:
+    """Streams ``(card_name, listings)`` pairs to a .csv or .jsonl file.
+
+    Each card's rows are formatted in memory and written with aiofiles, so
+    disk I/O stays off the event loop. Rows are flushed after each card, so
+    a partial file is still usable if the run is interrupted.
+    """
+    path = Path(out_path)
+    output = output_format(path)
+    stats = BatchScrapeStats()
+    started_at = time.perf_counter()
+    buffer = io.StringIO()
+    writer = _CsvRowWriter(buffer) if output == "csv" else _JsonlRowWriter(buffer)
+
+    async with aiofiles.open(path, "w", encoding="utf-8", newline="") as stream:
+        # The CSV header, if any.
+        await _write_buffered(buffer, stream)
+
+        async with aclosing(results):
+            async for card_name, listings in results:
+                stats.cards += 1
+                stats.listings += len(listings)
+
+                if not listings:
+                    stats.cards_without_listings += 1
+
+                for listing in listings:
+                    writer.write(card_name, listing)
+
+                await _write_buffered(buffer, stream)
+
+    stats.elapsed_seconds = time.perf_counter() - started_at
+
+    return stats
+
+
+async def scrape_deck_to_file(deck_path: str, out_path: str) -> BatchScrapeStats:
+    """Scrapes every card in a deck file and streams the listings to ``out_path``."""
+    output_format(Path(out_path))
+
+    return await write_listing_rows(iter_import_deck_file(deck_path), out_path)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from src.models import cards
 from src.models.db_models import Collection
@@ -46,7 +46,7 @@ def cards_item_to_db_item(
         card_name=cards_item.name,
         card_set=cards_item.set,
         card_code=cards_item.code,
-        card_price=cards_item.price,
+        card_price_cents=cards_item.price_cents,
         card_rarity=cards_item.rarity,
         card_condition=cards_item.condition,
         card_quantity=cards_item.qty,
@@ -59,7 +59,7 @@ def db_item_to_cards_item(db_item: DbCollectionItem) -> cards.CollectionItem:
         set=db_item.card_set,
         code=db_item.card_code,
         qty=db_item.card_quantity,
-        price=db_item.card_price,
+        price_cents=db_item.card_price_cents,
         rarity=db_item.card_rarity,
         condition=db_item.card_condition,
         stock=0,
@@ -69,25 +69,21 @@ def db_item_to_cards_item(db_item: DbCollectionItem) -> cards.CollectionItem:
 def _make_collection_item(
     listing: cards.CardListing, qty: int = 1
 ) -> cards.CollectionItem:
-    qty_safe = _ensure_positive_quantity(qty)
-    return cards.CollectionItem(
-        name=listing.name,
-        set=listing.set,
-        code=listing.code,
-        qty=qty_safe,
-        price=listing.price,
-        rarity=listing.rarity,
-        condition=listing.condition,
-        stock=listing.stock,
-    )
+    return cards.CollectionItem.from_listing(listing, _ensure_positive_quantity(qty))
 
 
 def add_items_from_listings(listings: list[cards.CardListing], qty: int = 1) -> None:
+    # The items are built here, so the draft can adopt them without a copy.
     items = [_make_collection_item(listing, qty) for listing in listings]
-    add_items(items)
+    _add_items(items, adopt=True)
 
 
 def add_items(items: list[cards.CollectionItem]) -> None:
+    """Adds copies of ``items`` to the draft; the passed objects are not changed."""
+    _add_items(items, adopt=False)
+
+
+def _add_items(items: list[cards.CollectionItem], adopt: bool) -> None:
     if not items:
         return
 
@@ -100,16 +96,11 @@ def add_items(items: list[cards.CollectionItem]) -> None:
         changes.append((key, previous_qty))
 
         if existing is None:
-            _WORKING_COLLECTION[key] = cards.CollectionItem(
-                name=item.name,
-                set=item.set,
-                code=item.code,
-                qty=_ensure_positive_quantity(item.qty),
-                price=item.price,
-                rarity=item.rarity,
-                condition=item.condition,
-                stock=item.stock,
-            )
+            if not adopt:
+                item = replace(item)
+
+            item.qty = _ensure_positive_quantity(item.qty)
+            _WORKING_COLLECTION[key] = item
         else:
             existing.qty = _ensure_positive_quantity(existing.qty + item.qty)
 
@@ -192,21 +183,12 @@ def adjust_quantity(key: str, delta: int) -> bool:
     new_qty = _ensure_positive_quantity(item.qty + delta)
 
     if new_qty <= 0:
-        restored = cards.CollectionItem(
-            name=item.name,
-            set=item.set,
-            code=item.code,
-            qty=previous_qty,
-            price=item.price,
-            rarity=item.rarity,
-            condition=item.condition,
-            stock=item.stock,
-        )
+        # The removed item is untouched, so undo can put the same object back.
         _WORKING_COLLECTION.pop(key, None)
         _UNDO_STACK.append(
             _UndoAction(
                 changes=[(key, previous_qty)],
-                restored_items=[(key, restored)],
+                restored_items=[(key, item)],
             )
         )
 
@@ -225,19 +207,9 @@ def remove_item(key: str) -> bool:
         return False
 
     previous_qty = item.qty
-    restored = cards.CollectionItem(
-        name=item.name,
-        set=item.set,
-        code=item.code,
-        qty=previous_qty,
-        price=item.price,
-        rarity=item.rarity,
-        condition=item.condition,
-        stock=item.stock,
-    )
     _WORKING_COLLECTION.pop(key, None)
     _UNDO_STACK.append(
-        _UndoAction(changes=[(key, previous_qty)], restored_items=[(key, restored)])
+        _UndoAction(changes=[(key, previous_qty)], restored_items=[(key, item)])
     )
 
     return True
@@ -312,15 +284,18 @@ async def rename_collection(collection_id: int, name: str) -> Collection | None:
 async def save_working_collection(name: str) -> Collection | None:
     global _WORKING_COLLECTION_ID, _WORKING_COLLECTION_NAME
     items = get_working_collection()
-    db_items = [
-        cards_item_to_db_item(cards_item, collection_id=0) for cards_item in items
-    ]
 
     if _WORKING_COLLECTION_ID is not None:
         await delete_collection_items_by_collection_id_db(_WORKING_COLLECTION_ID)
 
-        if db_items:
-            await create_many_collection_items_db(_WORKING_COLLECTION_ID, db_items)
+        if items:
+            # Rows are converted one at a time while inserting; the collection
+            # is re-read below, so the inserted rows aren't fetched back.
+            await create_many_collection_items_db(
+                _WORKING_COLLECTION_ID,
+                (cards_item_to_db_item(item, collection_id=0) for item in items),
+                fetch=False,
+            )
 
         existing = await get_collection_db(_WORKING_COLLECTION_ID)
 
@@ -333,6 +308,7 @@ async def save_working_collection(name: str) -> Collection | None:
 
         return coll
 
+    db_items = [cards_item_to_db_item(item, collection_id=0) for item in items]
     coll = await create_collection_db(name, db_items)
     _WORKING_COLLECTION_ID = coll.id
     _WORKING_COLLECTION_NAME = name
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from src.models.cards import CardListing
+from src.services.listing_store import load_listing_stamps, restore_listings
+from src.services.page_archive import (
+    ArchivedPage,
+    decompress_page,
+    iter_latest_pages,
+)
+from src.services.product_region import extract_product_region
+from src.services.scraper import (
+    PARSE_MAX_WORKERS,
+    PARSER_VERSION,
+    CompactListing,
+    get_parser_engine,
+    page_digest,
+    parse_card_page,
+    parse_compact,
+)
+
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass
+class ReparseStats:
+    pages: int = 0
+    reparsed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    listings: int = 0
+    elapsed_seconds: float = 0.0
+
+    def summary(self) -> str:
+        rate = self.reparsed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+        return (
+            f"{self.reparsed} of {self.pages} archived pages reparsed "
+            f"({self.skipped} up to date, {self.failed} failed), "
+            f"{self.listings} listings in {self.elapsed_seconds:.1f}s "
+            f"({rate:.1f} pages/s)"
+        )
+
+
+def reparse_page(
+    codec: str, body: bytes, card_name: str, engine: str
+) -> tuple[list[CompactListing], str, str | None]:
+    """Process-pool entry point: decompresses and parses one archived page.
+
+    Returns the compact listing rows, the page digest and the digest of the
+    page's product region, which is what a streamed fetch stores.
+    """
+    html = decompress_page(codec, body)
+    _page_card_name, rows = parse_compact(parse_card_page, html, card_name, engine)
+    region = extract_product_region(html)
+
+    return rows, page_digest(html), None if region is None else page_digest(region.html)
+
+
+async def reparse_archive(
+    workers: int = PARSE_MAX_WORKERS, reparse_all: bool = False
+) -> ReparseStats:
+    """Rebuilds stored listings from the page archive without touching the network.
+
+    Each card's newest complete archived page is reparsed when its stored
+    listings were written by another ``PARSER_VERSION`` or are gone, e.g.
+    after a listing store schema bump. With ``reparse_all`` every page is reparsed,
+    which doubles as an offline parser benchmark. Listings that came from a
+    page newer than the archived one are left alone.
+    """
+    stats = ReparseStats()
+    started_at = time.monotonic()
+    executor = ProcessPoolExecutor(
+        max_workers=max(1, workers), mp_context=multiprocessing.get_context("spawn")
+    )
+
+    try:
+        async for pages in iter_latest_pages():
+            stats.pages += len(pages)
+            await _reparse_batch(executor, pages, reparse_all, stats)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        stats.elapsed_seconds = time.monotonic() - started_at
+
+    return stats
+
+
+async def _reparse_batch(
+    executor: Executor,
+    pages: list[ArchivedPage],
+    reparse_all: bool,
+    stats: ReparseStats,
+) -> None:
+    stamps = await load_listing_stamps([page.slug for page in pages])
+    due = [
+        page
+        for page in pages
+        if reparse_all
+        or page.slug not in stamps
+        or stamps[page.slug][2] != PARSER_VERSION
+    ]
+    stats.skipped += len(pages) - len(due)
+
+    if not due:
+        return
+
+    loop = asyncio.get_running_loop()
+    engine = get_parser_engine()
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                executor, reparse_page, page.codec, page.body, page.card_name, engine
+            )
+            for page in due
+        ),
+        return_exceptions=True,
+    )
+    entries: dict[str, tuple[float, list[CardListing], str | None]] = {}
+
+    for page, result in zip(due, results):
+        if isinstance(result, BaseException):
+            LOG.warning("reparse: %s failed: %s", page.url, result)
+            stats.failed += 1
+            continue
+
+        rows, full_digest, region_digest = result
+        fetched_at, stored_digest, _parser_version = stamps.get(
+            page.slug, (page.fetched_at, None, None)
+        )
+        digest = _matching_digest(stored_digest, full_digest, region_digest)
+
+        if digest is None:
+            stats.skipped += 1
+            continue
+
+        entries[page.slug] = (fetched_at, [CardListing(*row) for row in rows], digest)
+        stats.listings += len(rows)
+
+    await restore_listings(entries, PARSER_VERSION)
+    stats.reparsed += len(entries)
+
+
+def _matching_digest(
+    stored_digest: str | None, full_digest: str, region_digest: str | None
+) -> str | None:
+    """The archived page's digest that the stored listings were keyed by, or
+    None if they came from a different page.
+
+    Streamed fetches store the digest of the product region rather than the
+    whole page, so both are tried, and the match is kept so the next fetch
+    of the same page still hits the parse memo. Digests are
+    "<parser version>:<hash>"; only the hash identifies the page.
+    """
+    if stored_digest is None:
+        return full_digest
+
+    stored_hash = stored_digest.partition(":")[2]
+
+    for digest in (full_digest, region_digest):
+        if digest is not None and digest.partition(":")[2] == stored_hash:
+            return digest
+
+    return None
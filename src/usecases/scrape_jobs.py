@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+from httpx import AsyncClient
+
+from src.services.job_queue import (
+    JOB_LEASE_SECONDS,
+    TaskResult,
+    claim_tasks,
+    complete_tasks,
+    job_counts,
+    new_worker_id,
+    renew_leases,
+)
+from src.services.scraper import (
+    card_page_url,
+    fetch_card_page,
+    get_scraper_client,
+    parse_card_listings_async,
+)
+
+
+LOG = logging.getLogger(__name__)
+
+JOB_WORKERS = 8
+JOB_CLAIM_BATCH_SIZE = 10
+# Host pacing can hold a batch far longer than one lease, so leases are
+# renewed while the batch is still being fetched.
+JOB_LEASE_RENEW_INTERVAL_SECONDS = JOB_LEASE_SECONDS / 3
+
+
+@dataclass
+class JobRunStats:
+    done: int = 0
+    retried: int = 0
+    elapsed_seconds: float = 0.0
+
+    def summary(self) -> str:
+        rate = self.done / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+        return (
+            f"{self.done} cards done, {self.retried} errors in "
+            f"{self.elapsed_seconds:.1f}s ({rate:.1f} cards/s)"
+        )
+
+
+async def _scrape_task(client: AsyncClient, card_name: str) -> TaskResult:
+    try:
+        page = await fetch_card_page(client, card_page_url(card_name))
+    except Exception as error:
+        LOG.exception("scrape job: fetching %r failed", card_name)
+        return TaskResult(card_name, error=str(error) or type(error).__name__)
+
+    if page is None:
+        return TaskResult(card_name, error="request failed")
+
+    if page.not_found or not page.html:
+        return TaskResult(card_name, listings=[])
+
+    try:
+        listings = await parse_card_listings_async(page.html, card_name)
+    except Exception as error:
+        LOG.exception("scrape job: parsing %r failed", card_name)
+        return TaskResult(card_name, error=str(error) or type(error).__name__)
+
+    return TaskResult(card_name, listings=listings)
+
+
+async def _drain(
+    name: str,
+    worker_id: str,
+    client: AsyncClient,
+    batch_size: int,
+    stats: JobRunStats,
+) -> None:
+    while card_names := await claim_tasks(name, worker_id, batch_size):
+        renewer = asyncio.create_task(_keep_leases(name, worker_id, card_names))
+
+        try:
+            results = await asyncio.gather(
+                *(_scrape_task(client, card_name) for card_name in card_names)
+            )
+        finally:
+            renewer.cancel()
+
+        await complete_tasks(name, worker_id, results)
+
+        for result in results:
+            if result.listings is None:
+                stats.retried += 1
+            else:
+                stats.done += 1
+
+
+async def _keep_leases(name: str, worker_id: str, card_names: list[str]) -> None:
+    while True:
+        await asyncio.sleep(JOB_LEASE_RENEW_INTERVAL_SECONDS)
+
+        try:
+            await renew_leases(name, worker_id, card_names)
+        except Exception:
+            LOG.exception("scrape job: renewing leases for %s failed", worker_id)
+
+
+async def run_scrape_job(
+    name: str,
+    workers: int = JOB_WORKERS,
+    batch_size: int = JOB_CLAIM_BATCH_SIZE,
+) -> JobRunStats:
+    """Drains job ``name`` with ``workers`` coroutines until nothing is claimable.
+
+    Each worker leases a batch, scrapes it and checkpoints the batch before
+    claiming the next one, so an interrupted run loses at most the batches
+    in flight. Other processes may drain the same job concurrently.
+    """
+    worker_id = new_worker_id()
+    client = await get_scraper_client()
+    stats = JobRunStats()
+    started_at = time.perf_counter()
+
+    await asyncio.gather(
+        *(
+            _drain(name, f"{worker_id}/{index}", client, batch_size, stats)
+            for index in range(workers)
+        )
+    )
+
+    stats.elapsed_seconds = time.perf_counter() - started_at
+    LOG.info("scrape job %s: %s, %s", name, stats.summary(), await job_counts(name))
+
+    return stats
@@ -1,9 +1,21 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
 from src.models.cards import CardListing
-from src.services.scraper import scrape_cards
+from src.services.scraper import iter_scrape_cards, scrape_cards
+from src.services.site_search import SearchResultsPage, fetch_search_page
 from src.services.ygopro_api import fuzzy_search as ygopro_fuzzy_search
+from src.utils.constants import SEARCH_DEFAULT_PAGE
 from src.utils.utils import to_slug
 
 
+LOG = logging.getLogger(__name__)
+
+# Query CoolStuffInc's own search first; YGOPRO + per-card pages is the fallback.
+USE_SITE_SEARCH = True
+
+
 async def _ygopro_candidate_names(query: str) -> list[str]:
     normalized_query = query.strip()
 
@@ -47,7 +59,10 @@ async def _ygopro_candidate_names(query: str) -> list[str]:
     return sorted(names)
 
 
-async def search_cards(query: str) -> list[CardListing]:
+MAX_SEARCH_CANDIDATES = 25
+
+
+async def _search_card_names(query: str) -> list[str]:
     raw_query = query.strip()
 
     if not raw_query:
@@ -56,12 +71,55 @@ async def search_cards(query: str) -> list[CardListing]:
     candidate_names = await _ygopro_candidate_names(raw_query)
 
     if candidate_names:
-        limited_names = candidate_names[:25]
-        return await scrape_cards(limited_names)
+        return candidate_names[:MAX_SEARCH_CANDIDATES]
 
     normalized_query = to_slug(raw_query)
 
     if not normalized_query:
         return []
 
-    return await scrape_cards([normalized_query])
+    return [normalized_query]
+
+
+async def search_results_page(
+    query: str, page: int = SEARCH_DEFAULT_PAGE
+) -> SearchResultsPage | None:
+    """One page of site search results, or None if site search is unavailable."""
+    raw_query = query.strip()
+
+    if not raw_query or not USE_SITE_SEARCH:
+        return None
+
+    try:
+        return await fetch_search_page(raw_query, page)
+    except Exception:
+        LOG.exception("site search for %r (page %d) failed", raw_query, page)
+        return None
+
+
+async def search_cards(query: str) -> list[CardListing]:
+    first_page = await search_results_page(query)
+
+    if first_page is not None and first_page.listings:
+        return first_page.listings
+
+    card_names = await _search_card_names(query)
+
+    if not card_names:
+        return []
+
+    return await scrape_cards(card_names)
+
+
+async def iter_search_cards(
+    query: str,
+) -> AsyncIterator[tuple[str, list[CardListing]]]:
+    """Per-card search: YGOPRO fuzzy names, then one product page per name."""
+    card_names = await _search_card_names(query)
+
+    if not card_names:
+        return
+
+    async with aclosing(iter_scrape_cards(card_names)) as results:
+        async for card_name, listings in results:
+            yield card_name, listings
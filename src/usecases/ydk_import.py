@@ -1,8 +1,10 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from pathlib import Path
 
 from src.models.cards import CardListing
-from src.services.scraper import scrape_cards
+from src.services.scraper import iter_scrape_cards, scrape_cards
 from src.services.ygopro_api import YGOPROCard, get_cards_by_ids, safe_get_card_by_id
 from src.usecases.file_parser import parse_file, parse_ydk_file
 
@@ -92,7 +94,7 @@ async def _resolve_card_names_from_ids(card_ids: list[str]) -> tuple[list[str],
     return names, failed_ids
 
 
-async def import_ydk_file(file_path: str) -> list[CardListing]:
+async def _ydk_card_names(file_path: str) -> list[str]:
     card_ids = await parse_ydk_file(file_path)
 
     if not card_ids:
@@ -112,16 +114,47 @@ async def import_ydk_file(file_path: str) -> list[CardListing]:
         LOG.info("import_ydk_file: no resolvable card names for %s", file_path)
         return []
 
+    return names
+
+
+async def _txt_card_names(file_path: str) -> list[str]:
+    card_names = await parse_file(file_path)
+
+    if not card_names:
+        LOG.info("import_txt_file: no card names parsed from %s", file_path)
+        return []
+
+    return card_names
+
+
+async def deck_card_names(path: str) -> list[str]:
+    file_path = Path(path)
+    suffix = file_path.suffix.lower()
+
+    if suffix == ".ydk":
+        return await _ydk_card_names(path)
+
+    if suffix == ".txt":
+        return await _txt_card_names(path)
+
+    raise ImportDeckError(f"Unsupported deck file type: {suffix}")
+
+
+async def import_ydk_file(file_path: str) -> list[CardListing]:
+    names = await _ydk_card_names(file_path)
+
+    if not names:
+        return []
+
     listings = await scrape_cards(names)
 
     return listings
 
 
 async def import_txt_file(file_path: str) -> list[CardListing]:
-    card_names = await parse_file(file_path)
+    card_names = await _txt_card_names(file_path)
 
     if not card_names:
-        LOG.info("import_txt_file: no card names parsed from %s", file_path)
         return []
 
     listings = await scrape_cards(card_names)
@@ -130,13 +163,22 @@ async def import_txt_file(file_path: str) -> list[CardListing]:
 
 
 async def import_deck_file(path: str) -> list[CardListing]:
-    file_path = Path(path)
-    suffix = file_path.suffix.lower()
+    card_names = await deck_card_names(path)
 
-    if suffix == ".ydk":
-        return await import_ydk_file(path)
+    if not card_names:
+        return []
 
-    if suffix == ".txt":
-        return await import_txt_file(path)
+    return await scrape_cards(card_names)
 
-    raise ImportDeckError(f"Unsupported deck file type: {suffix}")
+
+async def iter_import_deck_file(
+    path: str,
+) -> AsyncIterator[tuple[str, list[CardListing]]]:
+    card_names = await deck_card_names(path)
+
+    if not card_names:
+        return
+
+    async with aclosing(iter_scrape_cards(card_names)) as results:
+        async for card_name, listings in results:
+            yield card_name, listings
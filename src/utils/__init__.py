@@ -9,7 +9,8 @@ from src.utils.constants import (
 )
 from src.utils.utils import (
     deduplicate_listings,
-    extract_price_value,
+    format_price,
+    parse_price_cents,
     sort_listings,
     to_slug,
 )
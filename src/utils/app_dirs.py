@@ -5,6 +5,9 @@ from platformdirs import user_data_dir
 
 APP_NAME = "coolstuffscrape"
 DB_FILENAME = "card_database.db"
+LISTING_CACHE_FILENAME = "listing_cache.db"
+JOB_QUEUE_FILENAME = "scrape_jobs.db"
+PAGE_ARCHIVE_FILENAME = "page_archive.db"
 DB_SUBDIR = "db"
 TEMPLATE_FILENAME = "Template.xlsx"
 
@@ -24,5 +27,17 @@ def get_db_path() -> Path:
     return db_dir / DB_FILENAME
 
 
+def get_listing_cache_path() -> Path:
+    return get_db_path().parent / LISTING_CACHE_FILENAME
+
+
+def get_job_queue_path() -> Path:
+    return get_db_path().parent / JOB_QUEUE_FILENAME
+
+
+def get_page_archive_path() -> Path:
+    return get_db_path().parent / PAGE_ARCHIVE_FILENAME
+
+
 def get_template_path() -> Path:
     return get_app_data_dir() / TEMPLATE_FILENAME
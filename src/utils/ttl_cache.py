@@ -0,0 +1,166 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    expires_at: float
+    size: int
+
+
+class TTLCache(Generic[K, V]):
+    """LRU cache whose entries expire, bounded by entry count and/or bytes.
+
+    ``get`` only returns fresh entries. Expired entries are kept for
+    ``stale_seconds`` more so callers can still revalidate them through
+    ``get_stale``; after that they are dropped lazily on access and by a
+    sweep that runs at most every ``sweep_interval_seconds`` on writes.
+    ``sizeof`` estimates an entry's bytes for the ``max_bytes`` budget.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        sizeof: Callable[[V], int] | None = None,
+        stale_seconds: float = 0.0,
+        sweep_interval_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("max_bytes needs a sizeof function")
+
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_seconds = stale_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._bytes = 0
+        self._next_sweep_at = clock() + sweep_interval_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        now = self._clock()
+
+        if entry is None or entry.expires_at <= now:
+            self.misses += 1
+
+            if entry is not None and entry.expires_at + self.stale_seconds <= now:
+                self._drop(key)
+                self.expirations += 1
+
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def get_stale(self, key: K) -> V | None:
+        """Returns an expired entry still inside its stale window."""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry.expires_at + self.stale_seconds <= self._clock():
+            self._drop(key)
+            self.expirations += 1
+            return None
+
+        return entry.value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        now = self._clock()
+
+        if now >= self._next_sweep_at:
+            self.sweep()
+
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+
+        if key in self._entries:
+            self._drop(key)
+
+        size = self._sizeof(value) if self._sizeof is not None else 0
+        self._entries[key] = _Entry(value, now + ttl_seconds, size)
+        self._bytes += size
+        self._evict_over_budget()
+
+    def pop(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        self._drop(key)
+        return entry.value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def sweep(self) -> int:
+        """Drops every entry past its stale window and returns how many."""
+        now = self._clock()
+        self._next_sweep_at = now + self.sweep_interval_seconds
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if entry.expires_at + self.stale_seconds <= now
+        ]
+
+        for key in expired:
+            self._drop(key)
+
+        self.expirations += len(expired)
+        return len(expired)
+
+    def _drop(self, key: K) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict_over_budget(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.evictions += 1
@@ -1,6 +1,5 @@
 import re
 import unicodedata
-from decimal import Decimal
 from typing import TYPE_CHECKING
 
 
@@ -9,11 +8,11 @@ if TYPE_CHECKING:
 
 
 def deduplicate_listings(listings: list["CardListing"]) -> list["CardListing"]:
-    seen: set[tuple[str, str, str]] = set()
+    seen: set[tuple[str, str, int | None]] = set()
     unique: list["CardListing"] = []
 
     for listing in listings:
-        key = (listing.code, listing.condition, listing.price)
+        key = (listing.code, listing.condition, listing.price_cents)
         if key not in seen:
             seen.add(key)
             unique.append(listing)
@@ -21,21 +20,34 @@ def deduplicate_listings(listings: list["CardListing"]) -> list["CardListing"]:
     return unique
 
 
+PRICE_PATTERN = re.compile(r"\$\s*(\d{1,3}(?:,\d{3})+|\d+)(?:\.(\d{1,2}))?")
+
+
 def sort_listings(listings: list["CardListing"]) -> list["CardListing"]:
     return sorted(
         listings,
-        key=lambda x: (x.name.lower(), -extract_price_value(x.price)),
+        key=lambda x: (x.name.lower(), -(x.price_cents or 0)),
         reverse=True,  # ascending order
     )
 
 
-def extract_price_value(price_str: str) -> float:
-    if price_str == "N/A":
-        return 0.0
-    try:
-        return Decimal(price_str.replace("$", "").replace(",", ""))
-    except ValueError:
-        return Decimal(0)
+def parse_price_cents(text: str) -> int | None:
+    """Returns the first ``$1,234.56``-style amount in ``text`` as integer cents."""
+    match = PRICE_PATTERN.search(text)
+
+    if match is None:
+        return None
+
+    dollars, cents = match.groups()
+
+    return int(dollars.replace(",", "")) * 100 + int((cents or "0").ljust(2, "0"))
+
+
+def format_price(price_cents: int | None) -> str:
+    if price_cents is None:
+        return "N/A"
+
+    return f"${price_cents // 100:,}.{price_cents % 100:02d}"
 
 
 def to_slug(s: str) -> str:
@@ -0,0 +1,90 @@
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.services import (
+    http_transport,
+    job_queue,
+    listing_store,
+    metrics,
+    page_archive,
+    scraper,
+)
+from src.services.adaptive_limiter import AdaptiveLimiter
+from src.services.rate_limiter import HostRateLimiter
+
+
+def _clear_scraper_caches() -> None:
+    for cache in (
+        scraper._CARD_LISTINGS_CACHE,
+        scraper._PAGE_VALIDATORS,
+        scraper._MISSING_CARDS,
+        scraper._PAGE_DIGESTS,
+        scraper._CARD_ALIASES,
+        scraper._TRANSIENT_FAILURES,
+    ):
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def scraper_state(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Gives every test its own stores and fresh scraper module state.
+
+    The SQLite stores live in ``tmp_path``; caches, limiters, in-flight
+    fetches, queued store writes and metrics start empty; pages are parsed
+    inline and never hedged unless a test opts in.
+    """
+    monkeypatch.setattr(
+        listing_store, "get_listing_cache_path", lambda: tmp_path / "listings.db"
+    )
+    monkeypatch.setattr(listing_store, "_SCHEMA_READY", False)
+    monkeypatch.setattr(
+        page_archive, "get_page_archive_path", lambda: tmp_path / "archive.db"
+    )
+    monkeypatch.setattr(page_archive, "_SCHEMA_READY", False)
+    monkeypatch.setattr(job_queue, "get_job_queue_path", lambda: tmp_path / "jobs.db")
+    monkeypatch.setattr(job_queue, "_SCHEMA_READY", False)
+    monkeypatch.setattr(http_transport, "_HTTP_CLIENT", None)
+
+    monkeypatch.setattr(scraper, "PARSE_MODE", "inline")
+    monkeypatch.setattr(scraper, "USE_LISTING_STORE", True)
+    monkeypatch.setattr(scraper, "ARCHIVE_CARD_PAGES", False)
+    monkeypatch.setattr(scraper, "HEDGE_CARD_FETCHES", False)
+    monkeypatch.setattr(scraper, "HOST_RATE_LIMITER", HostRateLimiter())
+    monkeypatch.setattr(
+        scraper,
+        "SCRAPE_LIMITER",
+        AdaptiveLimiter(
+            initial_limit=scraper.INITIAL_SCRAPE_CONCURRENCY,
+            max_limit=scraper.MAX_SCRAPE_CONCURRENCY,
+        ),
+    )
+    monkeypatch.setattr(
+        scraper, "_FETCH_LATENCIES", deque(maxlen=scraper.HEDGE_LATENCY_WINDOW)
+    )
+    monkeypatch.setattr(scraper, "_IN_FLIGHT", {})
+    monkeypatch.setattr(scraper, "_STORE_WRITES", scraper._StoreWrites())
+    monkeypatch.setattr(scraper, "_STORE_WRITER", None)
+    monkeypatch.setattr(scraper, "_BODY_DRAINS", set())
+    _clear_scraper_caches()
+    metrics.reset()
+
+
+@pytest.fixture
+def store_path(tmp_path: Path) -> Path:
+    return tmp_path / "listings.db"
+
+
+@pytest.fixture
+def archive_path(tmp_path: Path) -> Path:
+    return tmp_path / "archive.db"
+
+
+@pytest.fixture
+def forget_in_memory_state() -> Callable[[], None]:
+    """Clears the scraper's in-process caches, as a restart would; the
+    SQLite stores keep their rows.
+    """
+    return _clear_scraper_caches
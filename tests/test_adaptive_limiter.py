@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from src.services.adaptive_limiter import AdaptiveLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_healthy_responses_grow_the_limit_by_about_one_per_round() -> None:
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=10)
+
+    for _ in range(4):
+        limiter.on_success(0.1)
+
+    assert limiter.limit == 4
+
+    limiter.on_success(0.1)
+    assert limiter.limit == 5
+
+
+def test_slow_responses_do_not_grow_the_limit() -> None:
+    limiter = AdaptiveLimiter(initial_limit=4, latency_tolerance=3.0)
+    limiter.on_success(0.1)
+    limit = limiter.limit
+
+    for _ in range(20):
+        limiter.on_success(0.5)
+
+    assert limiter.limit == limit
+    assert limiter.successes == 21
+
+
+def test_limit_never_exceeds_max() -> None:
+    limiter = AdaptiveLimiter(initial_limit=3, max_limit=3)
+
+    for _ in range(20):
+        limiter.on_success(0.1)
+
+    assert limiter.limit == 3
+
+
+def test_overload_halves_the_limit_once_per_cooldown() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(
+        initial_limit=8, decrease_cooldown_seconds=1.0, clock=clock
+    )
+    limiter.on_overload()
+    limiter.on_overload()
+
+    assert limiter.limit == 4
+    assert limiter.overloads == 2
+
+    clock.now = 1.0
+    limiter.on_overload()
+    assert limiter.limit == 2
+
+
+def test_overload_never_drops_below_min() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial_limit=4, min_limit=2, clock=clock)
+
+    for step in range(5):
+        clock.now = float(step * 10)
+        limiter.on_overload()
+
+    assert limiter.limit == 2
+
+
+def test_limits_are_validated() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial_limit=10, max_limit=5)
+
+
+def test_cancelled_waiter_gives_up_its_place() -> None:
+    limiter = AdaptiveLimiter(initial_limit=1)
+
+    async def run() -> int:
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        limiter.release()
+        await asyncio.wait_for(limiter.acquire(), 1)
+
+        return limiter.in_use
+
+    assert asyncio.run(run()) == 1
+
+
+def test_waiter_cancelled_after_being_woken_releases_its_slot() -> None:
+    limiter = AdaptiveLimiter(initial_limit=1)
+
+    async def run() -> int:
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        # The slot is handed over, but the waiter is cancelled before it runs.
+        limiter.release()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        return limiter.in_use
+
+    assert asyncio.run(run()) == 0
@@ -0,0 +1,67 @@
+import csv
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.cli import commands
+from src.services import http_transport, scraper
+from src.usecases.batch_scrape import OUTPUT_COLUMNS
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+MISSING_URL = scraper.card_page_url("Unknown Card")
+
+
+@pytest.fixture(autouse=True)
+def site(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url) == MISSING_URL:
+            return httpx.Response(404)
+
+        return httpx.Response(200, text=PAGE_HTML)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+
+
+def _run_scrape(tmp_path: Path, suffix: str) -> Path:
+    deck = tmp_path / "deck.txt"
+    deck.write_text("Main Deck:\n3x Dark Magician\n1x Unknown Card\n", encoding="utf-8")
+    out = tmp_path / f"prices{suffix}"
+
+    with pytest.raises(SystemExit) as exit_info:
+        commands.main(["scrape", str(deck), "--out", str(out)])
+
+    assert exit_info.value.code == 0
+
+    return out
+
+
+def _expected_codes() -> list[str]:
+    return [listing.code for listing in scraper.parse_card_listings(PAGE_HTML, "")]
+
+
+def test_scrape_writes_csv_rows(tmp_path: Path) -> None:
+    out = _run_scrape(tmp_path, ".csv")
+
+    with out.open(encoding="utf-8", newline="") as stream:
+        reader = csv.DictReader(stream)
+        rows = list(reader)
+
+    assert tuple(reader.fieldnames or ()) == OUTPUT_COLUMNS
+    assert [row["code"] for row in rows] == _expected_codes()
+    assert {row["query"] for row in rows} == {"Dark Magician"}
+    assert all(row["price"].startswith("$") for row in rows)
+
+
+def test_scrape_writes_jsonl_rows(tmp_path: Path) -> None:
+    out = _run_scrape(tmp_path, ".jsonl")
+
+    rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+
+    assert [row["code"] for row in rows] == _expected_codes()
+    assert {row["query"] for row in rows} == {"Dark Magician"}
+    assert all(isinstance(row["price_cents"], int) for row in rows)
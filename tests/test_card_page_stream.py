@@ -0,0 +1,176 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.services import http_transport, metrics, scraper
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+PAGE_URL = "https://www.coolstuffinc.com/p/YuGiOh/Dark+Magician"
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """A body in small chunks that records whether it was read to the end.
+
+    The connection pool only takes an HTTP/1.1 connection back once its
+    response body has been read in full.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        chunk_size: int = 128,
+        gate_at: int | None = None,
+        gate: asyncio.Event | None = None,
+    ) -> None:
+        self._body = body
+        self._chunk_size = chunk_size
+        self._gate_at = gate_at
+        self._gate = gate
+        self.drained = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._body), self._chunk_size):
+            if self._gate is not None and start >= (self._gate_at or 0):
+                await self._gate.wait()
+
+            yield self._body[start : start + self._chunk_size]
+
+        self.drained = True
+
+
+def _fetch(http_version: bytes) -> tuple[scraper.CardPage | None, _TrackedStream]:
+    stream = _TrackedStream(PAGE_HTML.encode())
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, stream=stream, extensions={"http_version": http_version}
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def fetch() -> scraper.CardPage | None:
+        async with client:
+            page = await scraper.fetch_card_page(client, PAGE_URL)
+            await asyncio.gather(*scraper._BODY_DRAINS)
+
+            return page
+
+    return asyncio.run(fetch()), stream
+
+
+@pytest.mark.parametrize("http_version", [b"HTTP/1.1", b"HTTP/2"])
+def test_card_pages_keep_only_the_product_region(http_version: bytes) -> None:
+    page, _stream = _fetch(http_version)
+
+    assert page is not None and page.partial and page.html is not None
+    assert "Dark Magician" in page.html
+    assert "Free shipping" not in page.html
+
+
+def test_http1_bodies_are_drained_so_the_connection_is_reused() -> None:
+    _page, stream = _fetch(b"HTTP/1.1")
+
+    assert stream.drained
+
+
+def test_http2_streams_stop_once_the_products_close() -> None:
+    _page, stream = _fetch(b"HTTP/2")
+
+    assert not stream.drained
+
+
+def test_http1_region_is_returned_before_the_rest_of_the_body() -> None:
+    async def fetch() -> tuple[scraper.CardPage | None, bool, bool]:
+        gate = asyncio.Event()
+        stream = _TrackedStream(
+            PAGE_HTML.encode(),
+            chunk_size=16,
+            gate_at=PAGE_HTML.index("<footer>"),
+            gate=gate,
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, stream=stream, extensions={"http_version": b"HTTP/1.1"}
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            page = await scraper.fetch_card_page(client, PAGE_URL)
+            drained_on_return = stream.drained
+            gate.set()
+            await asyncio.gather(*scraper._BODY_DRAINS)
+
+            return page, drained_on_return, stream.drained
+
+    page, drained_on_return, drained = asyncio.run(fetch())
+
+    assert page is not None and page.partial and page.html is not None
+    assert "Dark Magician" in page.html
+    assert not drained_on_return
+    assert drained
+
+
+def test_closing_the_client_waits_for_background_drains(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fetch() -> tuple[bool, bool]:
+        gate = asyncio.Event()
+        stream = _TrackedStream(
+            PAGE_HTML.encode(),
+            chunk_size=16,
+            gate_at=PAGE_HTML.index("<footer>"),
+            gate=gate,
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, stream=stream, extensions={"http_version": b"HTTP/1.1"}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+        await scraper.fetch_card_page(client, PAGE_URL)
+        closing = asyncio.create_task(scraper.close_scraper_client())
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        closed_before_drain = closing.done()
+        gate.set()
+        await closing
+
+        return closed_before_drain, stream.drained
+
+    closed_before_drain, drained = asyncio.run(fetch())
+
+    assert not closed_before_drain
+    assert drained
+    assert http_transport._HTTP_CLIENT is None
+    assert metrics.get_counter("scrape.fetch.drain_errors") == 0
+
+
+def test_only_card_pages_feed_the_hedge_latency_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    latencies: deque[float] = deque(maxlen=scraper.HEDGE_LATENCY_WINDOW)
+    monkeypatch.setattr(scraper, "_FETCH_LATENCIES", latencies)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=PAGE_HTML)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def fetch(scoped: bool) -> None:
+        await scraper.fetch_card_page(client, PAGE_URL, scoped=scoped)
+
+    asyncio.run(fetch(scoped=False))
+    assert len(latencies) == 0
+
+    asyncio.run(fetch(scoped=True))
+    assert len(latencies) == 1
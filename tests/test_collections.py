@@ -0,0 +1,36 @@
+import pytest
+
+from src.models.cards import CardListing, CollectionItem
+from src.usecases import collections
+
+
+LISTING = CardListing(
+    "Dark Magician", "Starter Deck: Yugi", "YSYR-EN006", 199, "Common", "NM", 3
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_draft() -> None:
+    collections.start_new_collection()
+
+
+def test_add_items_leaves_the_callers_items_alone() -> None:
+    item = CollectionItem.from_listing(LISTING, 2)
+
+    collections.add_items([item])
+    collections.add_items([item])
+
+    (stored,) = collections.get_working_collection()
+
+    assert stored is not item
+    assert stored.qty == 4
+    assert item.qty == 2
+
+
+def test_undo_restores_the_previous_quantity() -> None:
+    collections.add_items_from_listings([LISTING], qty=1)
+    collections.add_items_from_listings([LISTING], qty=2)
+
+    collections.undo_last()
+
+    assert [item.qty for item in collections.get_working_collection()] == [1]
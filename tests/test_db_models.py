@@ -0,0 +1,65 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.models import db_models
+
+
+OLD_COLLECTION_ITEMS_SCHEMA = (
+    "CREATE TABLE collection_items ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, collection_id INTEGER NOT NULL, "
+    "card_id INTEGER, card_name TEXT, card_set TEXT, card_code TEXT, "
+    "card_price TEXT, card_rarity TEXT, card_condition TEXT, quantity INTEGER NOT NULL, "
+    "FOREIGN KEY (collection_id) REFERENCES collections(id))"
+)
+
+
+@pytest.fixture
+def db_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    path = tmp_path / "card_database.db"
+    monkeypatch.setattr(db_models, "get_db_path", lambda: path)
+
+    return path
+
+
+def test_old_price_strings_are_migrated_to_cents(db_path: Path) -> None:
+    prices = ["$4.99", "$1,234.56", "$7", "", "N/A", None]
+
+    with sqlite3.connect(db_path) as db:
+        db.execute(db_models.COLLECTIONS_SCHEMA)
+        db.execute(OLD_COLLECTION_ITEMS_SCHEMA)
+        db.execute("INSERT INTO collections (id, name) VALUES (1, 'Deck')")
+        db.executemany(
+            "INSERT INTO collection_items (collection_id, card_name, card_set, "
+            "card_code, card_price, card_rarity, card_condition, quantity) "
+            "VALUES (1, ?, 'LOB', 'LOB-001', ?, 'Ultra Rare', 'Near Mint', 1)",
+            [(f"Card {index}", price) for index, price in enumerate(prices)],
+        )
+
+    asyncio.run(db_models.init_db())
+    # A second start must leave the migrated values alone.
+    asyncio.run(db_models.init_db())
+
+    collection = asyncio.run(db_models.get_collection(1))
+
+    assert collection is not None
+    assert [item.card_price_cents for item in collection.items] == [
+        499,
+        123456,
+        700,
+        None,
+        None,
+        None,
+    ]
+
+
+def test_new_databases_get_the_cents_column(db_path: Path) -> None:
+    asyncio.run(db_models.init_db())
+
+    with sqlite3.connect(db_path) as db:
+        columns = {row[1] for row in db.execute("PRAGMA table_info(collection_items)")}
+
+    assert "card_price_cents" in columns
+    assert "card_price" not in columns
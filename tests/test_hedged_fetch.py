@@ -0,0 +1,93 @@
+import asyncio
+from collections import deque
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.services import metrics, scraper
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+PAGE_URL = "https://www.coolstuffinc.com/p/YuGiOh/Dark+Magician"
+RECENT_LATENCY_SECONDS = 0.01
+
+
+@pytest.fixture(autouse=True)
+def recent_latencies(monkeypatch: pytest.MonkeyPatch) -> None:
+    latencies: deque[float] = deque(
+        [RECENT_LATENCY_SECONDS] * scraper.HEDGE_MIN_SAMPLES,
+        maxlen=scraper.HEDGE_LATENCY_WINDOW,
+    )
+    monkeypatch.setattr(scraper, "_FETCH_LATENCIES", latencies)
+    monkeypatch.setattr(scraper, "HEDGE_CARD_FETCHES", True)
+
+
+def test_slow_card_fetch_is_hedged_after_the_p95_delay() -> None:
+    started: list[float] = []
+    primary_cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.append(asyncio.get_running_loop().time())
+
+        if len(started) == 1:
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+
+        return httpx.Response(200, text=PAGE_HTML)
+
+    async def run() -> scraper.CardPage | None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            page = await scraper.fetch_card_page(client, PAGE_URL)
+            await asyncio.wait_for(primary_cancelled.wait(), 1)
+
+            return page
+
+    page = asyncio.run(run())
+
+    assert page is not None and page.html is not None
+    assert len(started) == 2
+    assert started[1] - started[0] >= scraper.HEDGE_MIN_DELAY_SECONDS
+    assert metrics.get_counter("scrape.fetch.hedged") == 1
+    assert metrics.get_counter("scrape.fetch.hedge_won") == 1
+
+
+def test_attempt_past_the_deadline_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scraper, "HEDGE_CARD_FETCHES", False)
+    monkeypatch.setattr(scraper, "CARD_FETCH_DEADLINE_SECONDS", 0.05)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(30)
+
+        return httpx.Response(200, text=PAGE_HTML)
+
+    async def run() -> scraper.CardPage | None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scraper.fetch_card_page(client, PAGE_URL)
+
+    assert asyncio.run(run()) is None
+    assert metrics.get_counter("scrape.fetch.deadline_exceeded") == 1
+
+
+def test_search_pages_are_never_hedged() -> None:
+    requested: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        await asyncio.sleep(10 * scraper.HEDGE_MIN_DELAY_SECONDS)
+
+        return httpx.Response(200, text=PAGE_HTML)
+
+    async def run() -> scraper.CardPage | None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scraper.fetch_card_page(client, PAGE_URL, scoped=False)
+
+    page = asyncio.run(run())
+
+    assert page is not None
+    assert len(requested) == 1
+    assert metrics.get_counter("scrape.fetch.hedged") == 0
@@ -0,0 +1,86 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.models.cards import CardListing
+from src.services import http_transport, scraper
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+SLOW_CARD = "Dark Magician"
+FAST_CARD = "Dark Magician Girl"
+CACHED_CARD = "Blue-Eyes White Dragon"
+PRICES = {SLOW_CARD: "$ 4.99", FAST_CARD: "$ 7.25"}
+
+
+def _card_page(card_name: str) -> str:
+    """The fixture page for ``card_name``, with its own first-row price."""
+    return PAGE_HTML.replace("Dark Magician", card_name).replace(
+        "$ 4.99", PRICES[card_name]
+    )
+
+
+def test_results_stream_in_completion_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    requested: list[str] = []
+    cached = [
+        CardListing(
+            name="Blue-Eyes White Dragon - Legend of Blue Eyes White Dragon",
+            set="Legend of Blue Eyes White Dragon",
+            code="LOB-EN001",
+            price_cents=9999,
+            rarity="Ultra Rare",
+            condition="Near Mint",
+        )
+    ]
+    scraper._CARD_LISTINGS_CACHE.set(scraper._card_cache_key(CACHED_CARD), cached)
+
+    async def run() -> list[tuple[str, list[CardListing], int]]:
+        fast_received = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            card_name = (
+                SLOW_CARD if request.url.path.endswith("Magician") else FAST_CARD
+            )
+            requested.append(card_name)
+
+            if card_name == SLOW_CARD:
+                # Held back until the caller has the fast card's listings.
+                await asyncio.wait_for(fast_received.wait(), 1)
+
+            return httpx.Response(200, text=_card_page(card_name))
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+        received: list[tuple[str, list[CardListing], int]] = []
+
+        async for card_name, listings in scraper.iter_scrape_cards(
+            [SLOW_CARD, FAST_CARD, CACHED_CARD]
+        ):
+            received.append((card_name, listings, len(requested)))
+
+            if card_name == FAST_CARD:
+                fast_received.set()
+
+        return received
+
+    received = asyncio.run(run())
+
+    assert [card_name for card_name, _listings, _requests in received] == [
+        CACHED_CARD,
+        FAST_CARD,
+        SLOW_CARD,
+    ]
+    assert received[0][1] == cached
+    assert received[0][2] == 0
+    assert [listings[0].price_cents for _name, listings, _ in received[1:]] == [
+        725,
+        499,
+    ]
+    assert all(
+        listing.name.startswith(f"{card_name} - ")
+        for card_name, listings, _requests in received[1:]
+        for listing in listings
+    )
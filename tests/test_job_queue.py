@@ -0,0 +1,65 @@
+import asyncio
+
+
+from src.services import job_queue
+from src.services.job_queue import (
+    TaskResult,
+    claim_tasks,
+    complete_tasks,
+    enqueue_cards,
+    renew_leases,
+    retry_failed,
+)
+
+
+def test_renewed_leases_are_not_reclaimed() -> None:
+    async def run() -> tuple[int, list[str], list[str]]:
+        await enqueue_cards("nightly", ["Dark Magician", "Kuriboh"])
+        claimed = await claim_tasks("nightly", "worker-a", 10, lease_seconds=0.0)
+        renewed = await renew_leases("nightly", "worker-a", claimed)
+
+        return renewed, claimed, await claim_tasks("nightly", "worker-b", 10)
+
+    renewed, claimed, reclaimed = asyncio.run(run())
+
+    assert claimed == ["Dark Magician", "Kuriboh"]
+    assert renewed == 2
+    assert reclaimed == []
+
+
+def test_expired_leases_are_reclaimed_and_cannot_be_renewed() -> None:
+    async def run() -> tuple[list[str], int]:
+        await enqueue_cards("nightly", ["Dark Magician"])
+        await claim_tasks("nightly", "worker-a", 10, lease_seconds=0.0)
+        reclaimed = await claim_tasks("nightly", "worker-b", 10)
+
+        return reclaimed, await renew_leases("nightly", "worker-a", reclaimed)
+
+    reclaimed, renewed = asyncio.run(run())
+
+    assert reclaimed == ["Dark Magician"]
+    assert renewed == 0
+
+
+def test_retried_tasks_forget_their_last_error() -> None:
+    async def run() -> tuple[int, list[tuple[str, str | None]]]:
+        await enqueue_cards("nightly", ["Dark Magician"])
+        claimed = await claim_tasks("nightly", "worker-a", 10)
+        await complete_tasks(
+            "nightly",
+            "worker-a",
+            [TaskResult(card_name, error="HTTP 503") for card_name in claimed],
+            max_attempts=1,
+        )
+        retried = await retry_failed("nightly")
+
+        async with job_queue.queue_session() as db:
+            async with db.execute("SELECT state, error FROM scrape_tasks") as cursor:
+                rows = await cursor.fetchall()
+
+        return retried, [tuple(row) for row in rows]
+
+    retried, rows = asyncio.run(run())
+
+    assert retried == 1
+    assert rows == [("pending", None)]
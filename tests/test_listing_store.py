@@ -0,0 +1,103 @@
+import asyncio
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.models.cards import CardListing
+from src.services import http_transport, listing_store, scraper
+
+
+LISTING = CardListing(
+    "Dark Magician", "Starter Deck: Yugi", "YSYR-EN006", 199, "Common", "NM", 3
+)
+MAX_AGE_SECONDS = 3600
+PAGE_HTML = (Path(__file__).parent / "fixtures" / "card_page_rows.html").read_text()
+
+
+def _backdate(path: Path, table: str, column: str) -> None:
+    with sqlite3.connect(path) as db:
+        db.execute(
+            f"UPDATE {table} SET {column} = ?", (time.time() - MAX_AGE_SECONDS - 1,)
+        )
+
+
+def _keys(path: Path, table: str, column: str) -> list[str]:
+    with sqlite3.connect(path) as db:
+        return [row[0] for row in db.execute(f"SELECT {column} FROM {table}")]
+
+
+def test_saving_listings_drops_expired_ones(store_path: Path) -> None:
+    asyncio.run(listing_store.save_listings({"old": [LISTING]}))
+    _backdate(store_path, "card_listings", "fetched_at")
+
+    asyncio.run(
+        listing_store.save_listings({"new": [LISTING]}, max_age_seconds=MAX_AGE_SECONDS)
+    )
+
+    assert _keys(store_path, "card_listings", "slug") == ["new"]
+
+
+def test_saving_missing_pages_drops_expired_ones(store_path: Path) -> None:
+    asyncio.run(listing_store.save_missing(["old"]))
+    _backdate(store_path, "missing_pages", "checked_at")
+
+    asyncio.run(listing_store.save_missing(["new"], ttl_seconds=MAX_AGE_SECONDS))
+
+    assert _keys(store_path, "missing_pages", "slug") == ["new"]
+
+
+def test_saving_aliases_drops_expired_ones(store_path: Path) -> None:
+    url = "https://www.coolstuffinc.com/p/YuGiOh/Dark+Magician"
+    asyncio.run(listing_store.save_aliases({"old": ("dark-magician", url)}))
+    _backdate(store_path, "card_aliases", "resolved_at")
+
+    asyncio.run(
+        listing_store.save_aliases(
+            {"new": ("dark-magician", url)}, max_age_seconds=MAX_AGE_SECONDS
+        )
+    )
+
+    assert _keys(store_path, "card_aliases", "alias") == ["new"]
+
+
+def test_rows_are_kept_without_a_max_age(store_path: Path) -> None:
+    asyncio.run(listing_store.save_listings({"old": [LISTING]}))
+    _backdate(store_path, "card_listings", "fetched_at")
+
+    asyncio.run(listing_store.save_listings({"new": [LISTING]}))
+
+    assert sorted(_keys(store_path, "card_listings", "slug")) == ["new", "old"]
+
+
+def test_reimport_after_restart_is_served_from_the_store(
+    monkeypatch: pytest.MonkeyPatch, forget_in_memory_state: Callable[[], None]
+) -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+
+        return httpx.Response(200, text=PAGE_HTML)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+    deck = ["Dark Magician", "Dark Magician Girl"]
+
+    async def scrape() -> list[tuple[str, list[CardListing]]]:
+        return [result async for result in scraper.iter_scrape_cards(deck)]
+
+    first = asyncio.run(scrape())
+    fetched = len(requested)
+    forget_in_memory_state()
+    requested.clear()
+
+    second = asyncio.run(scrape())
+
+    assert fetched == len(deck)
+    assert all(listings for _card_name, listings in first)
+    assert requested == []
+    assert dict(second) == dict(first)
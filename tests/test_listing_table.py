@@ -0,0 +1,95 @@
+import pytest
+
+from src.models.cards import CardListing
+from src.models.listing_table import ListingTable
+from src.utils import sort_listings
+
+
+LISTINGS = [
+    CardListing("Dark Magician", "LOB", "LOB-005", 1299, "Ultra Rare", "Near Mint", 2),
+    CardListing("Dark Magician", "SDY", "SDY-006", None, "Ultra Rare", "Played", 0),
+    CardListing("Dark Magician", "YGLD", "YGLD-ENA03", 199, "Common", "Near Mint", 9),
+    CardListing("Dark Magician", "LDK2", "LDK2-ENY10", 499, "Common", "Played", 0),
+    CardListing("Dark Magician", "DDS", "DDS-001", None, "Secret Rare", "Near Mint", 1),
+    CardListing(
+        "Dark Magician", "MVP1", "MVP1-EN055", 499, "Gold Rare", "Near Mint", 4
+    ),
+]
+
+
+@pytest.fixture
+def table() -> ListingTable:
+    table = ListingTable()
+    table.extend(LISTINGS)
+
+    return table
+
+
+def _rows(table: ListingTable, indices) -> list[CardListing]:
+    return [table.listings[index] for index in indices]
+
+
+def _priced(listings: list[CardListing]) -> list[CardListing]:
+    return [listing for listing in listings if listing.price_cents is not None]
+
+
+def _unpriced(listings: list[CardListing]) -> list[CardListing]:
+    return [listing for listing in listings if listing.price_cents is None]
+
+
+def test_price_order_matches_sort_listings_with_missing_prices_last(
+    table: ListingTable,
+) -> None:
+    # sort_listings counts a missing price as $0, so drop those from its order.
+    expected = _priced(sort_listings(LISTINGS)) + _unpriced(LISTINGS)
+
+    assert _rows(table, table.order("price")) == expected
+
+
+def test_descending_price_order_keeps_missing_prices_last(
+    table: ListingTable,
+) -> None:
+    expected = sorted(
+        _priced(LISTINGS), key=lambda listing: listing.price_cents, reverse=True
+    ) + _unpriced(LISTINGS)
+
+    assert _rows(table, table.order("price", descending=True)) == expected
+
+
+def test_stock_order(table: ListingTable) -> None:
+    expected = sorted(LISTINGS, key=lambda listing: listing.stock, reverse=True)
+
+    assert _rows(table, table.order("stock", descending=True)) == expected
+
+
+def test_filters_apply_on_top_of_the_sort_order(table: ListingTable) -> None:
+    rarity_id = table.rarities.index("Common")
+    condition_id = table.conditions.index("Near Mint")
+
+    in_stock = table.select(sort_key="price", in_stock_only=True)
+    common = table.select(sort_key="price", rarity_id=rarity_id)
+    near_mint_in_stock = table.select(in_stock_only=True, condition_id=condition_id)
+
+    by_price = _rows(table, table.order("price"))
+
+    assert _rows(table, in_stock) == [row for row in by_price if row.stock]
+    assert _rows(table, common) == [row for row in by_price if row.rarity == "Common"]
+    assert _rows(table, near_mint_in_stock) == [
+        row for row in LISTINGS if row.stock and row.condition == "Near Mint"
+    ]
+
+
+def test_new_rows_invalidate_cached_orders(table: ListingTable) -> None:
+    table.order("price")
+    cheapest = CardListing(
+        "Dark Magician", "SBC1", "SBC1-ENA01", 25, "Common", "Near Mint", 1
+    )
+
+    table.extend([cheapest])
+
+    assert table.listings[table.order("price")[0]] == cheapest
+
+
+def test_unknown_sort_key_is_rejected(table: ListingTable) -> None:
+    with pytest.raises(ValueError):
+        table.order("name")
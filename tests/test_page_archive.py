@@ -0,0 +1,110 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.services import http_transport, scraper
+from src.services.listing_store import load_digests
+from src.services.page_archive import (
+    ArchivedPage,
+    archive_page,
+    iter_latest_pages,
+    save_pages,
+)
+from src.usecases.reparse_archive import ReparseStats, _reparse_batch
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+PAGE_URL = "https://www.coolstuffinc.com/p/YuGiOh/Dark+Magician"
+
+
+def _page(fetched_at: float, partial: bool = False) -> ArchivedPage:
+    page = archive_page(PAGE_URL, "dark-magician", "Dark Magician", PAGE_HTML, partial)
+    page.fetched_at = fetched_at
+
+    return page
+
+
+async def _latest() -> list[ArchivedPage]:
+    return [page async for pages in iter_latest_pages() for page in pages]
+
+
+def test_only_the_newest_pages_per_card_are_kept(archive_path: Path) -> None:
+    async def run() -> None:
+        for fetched_at in range(1, 6):
+            await save_pages([_page(fetched_at)])
+
+    asyncio.run(run())
+
+    with sqlite3.connect(archive_path) as db:
+        kept = db.execute(
+            "SELECT fetched_at FROM archived_pages ORDER BY fetched_at"
+        ).fetchall()
+
+    assert kept == [(3.0,), (4.0,), (5.0,)]
+
+
+def test_partial_pages_are_not_reparsed() -> None:
+    async def run() -> list[ArchivedPage]:
+        await save_pages([_page(1.0), _page(2.0, partial=True)])
+
+        return await _latest()
+
+    (latest,) = asyncio.run(run())
+
+    assert latest.fetched_at == 1.0
+    assert latest.html() == PAGE_HTML
+
+
+def test_archiving_reads_card_pages_in_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=PAGE_HTML)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def fetch() -> scraper.CardPage | None:
+        return await scraper.fetch_card_page(client, PAGE_URL)
+
+    streamed = asyncio.run(fetch())
+    monkeypatch.setattr(scraper, "ARCHIVE_CARD_PAGES", True)
+    archived = asyncio.run(fetch())
+
+    assert streamed is not None and streamed.partial
+    assert archived is not None and not archived.partial
+    assert archived.html == PAGE_HTML
+
+
+def test_streamed_listings_are_reparsed_from_the_full_archived_page(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=PAGE_HTML)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+
+    async def run() -> tuple[str, ReparseStats, str]:
+        await save_pages([_page(1.0)])
+        # A later run without archiving streams only the product region.
+        await scraper.scrape_cards(["Dark Magician"])
+        streamed_digest = (await load_digests(["dark-magician"]))["dark-magician"]
+        stats = ReparseStats()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await _reparse_batch(executor, await _latest(), True, stats)
+
+        return (
+            streamed_digest,
+            stats,
+            (await load_digests(["dark-magician"]))["dark-magician"],
+        )
+
+    streamed_digest, stats, reparsed_digest = asyncio.run(run())
+
+    assert streamed_digest != scraper.page_digest(PAGE_HTML)
+    assert (stats.reparsed, stats.skipped) == (1, 0)
+    assert reparsed_digest == streamed_digest
@@ -0,0 +1,75 @@
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.services import http_transport, scraper
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+
+
+@pytest.fixture(autouse=True)
+def site(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=PAGE_HTML)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+
+
+def _count_parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    parsed: list[str] = []
+    parse_card_page = scraper.parse_card_page
+
+    def counting_parse(html: str, card_name: str, engine: str | None = None):
+        parsed.append(card_name)
+        return parse_card_page(html, card_name, engine)
+
+    monkeypatch.setattr(scraper, "parse_card_page", counting_parse)
+
+    return parsed
+
+
+def _rescrape_expired(
+    monkeypatch: pytest.MonkeyPatch,
+    forget_in_memory_state: Callable[[], None],
+    parser_version: int | None = None,
+) -> int:
+    """Scrapes once, then again after restarting with the stored listings expired."""
+    asyncio.run(scraper.scrape_cards(["Dark Magician"]))
+
+    if parser_version is not None:
+        monkeypatch.setattr(scraper, "PARSER_VERSION", parser_version)
+
+    forget_in_memory_state()
+    monkeypatch.setattr(scraper, "LISTING_STORE_TTL_SECONDS", 0)
+
+    return len(asyncio.run(scraper.scrape_cards(["Dark Magician"])))
+
+
+def test_unchanged_page_is_not_parsed_again(
+    monkeypatch: pytest.MonkeyPatch, forget_in_memory_state: Callable[[], None]
+) -> None:
+    parsed = _count_parses(monkeypatch)
+
+    found = _rescrape_expired(monkeypatch, forget_in_memory_state)
+
+    assert found > 0
+    assert parsed == ["Dark Magician"]
+
+
+def test_parser_version_bump_parses_stored_pages_again(
+    monkeypatch: pytest.MonkeyPatch, forget_in_memory_state: Callable[[], None]
+) -> None:
+    parsed = _count_parses(monkeypatch)
+
+    found = _rescrape_expired(
+        monkeypatch, forget_in_memory_state, scraper.PARSER_VERSION + 1
+    )
+
+    assert found > 0
+    assert parsed == ["Dark Magician", "Dark Magician"]
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from src.models.cards import CardListing
+from src.services import scraper
+from src.services.scraper import available_parser_engines, parse_card_listings
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+FIXTURE_PAGES = ("card_page_rows.html", "card_page_text.html", "card_page_empty.html")
+CARD_NAME = "Dark Magician"
+
+
+def _fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("scoped", [True, False])
+@pytest.mark.parametrize("page", FIXTURE_PAGES)
+@pytest.mark.parametrize("engine", available_parser_engines())
+def test_engines_parse_fixture_pages_identically(
+    monkeypatch: pytest.MonkeyPatch, engine: str, page: str, scoped: bool
+) -> None:
+    monkeypatch.setattr(scraper, "SCOPED_PARSE", scoped)
+    html = _fixture(page)
+
+    assert parse_card_listings(html, CARD_NAME, engine) == parse_card_listings(
+        html, CARD_NAME, "html.parser"
+    )
+
+
+def test_structured_rows() -> None:
+    listings = parse_card_listings(_fixture("card_page_rows.html"), "dark magician")
+
+    assert listings == [
+        CardListing(
+            name="Dark Magician - Starter Deck: Yugi",
+            set="Starter Deck: Yugi",
+            code="YSYR-EN006",
+            price_cents=499,
+            rarity="Ultra Rare",
+            condition="Near Mint",
+            stock=3,
+        ),
+        CardListing(
+            name="Dark Magician - Legend of Blue Eyes White Dragon",
+            set="Legend of Blue Eyes White Dragon",
+            code="LOB-EN005",
+            price_cents=120450,
+            rarity="Ultra Rare",
+            condition="Played",
+            stock=12,
+        ),
+        CardListing(
+            name="Dark Magician - Legendary Collection Kaiba",
+            set="Legendary Collection Kaiba",
+            code="LCKC-EN001",
+            price_cents=1250,
+            rarity="Secret Rare",
+            condition="Near Mint",
+            stock=0,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("engine", available_parser_engines())
+def test_text_fallback_ignores_scripts_and_styles(engine: str) -> None:
+    listings = parse_card_listings(_fixture("card_page_text.html"), CARD_NAME, engine)
+
+    assert [
+        (listing.code, listing.price_cents, listing.condition, listing.stock)
+        for listing in listings
+    ] == [
+        ("YSYR-EN006", 499, "Near Mint", 3),
+        ("LOB-EN005", 120450, "Played", 12),
+        ("LOB-EN005", 135000, "Near Mint", 0),
+    ]
+    assert {listing.rarity for listing in listings} == {"Ultra Rare"}
+
+
+@pytest.mark.parametrize("engine", available_parser_engines())
+def test_empty_page_has_no_listings(engine: str) -> None:
+    assert (
+        parse_card_listings(_fixture("card_page_empty.html"), CARD_NAME, engine) == []
+    )
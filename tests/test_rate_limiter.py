@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from src.services.rate_limiter import HostRateLimiter, TokenBucket
+
+
+class FakeClock:
+    """A manual clock whose ``sleep`` advances time instead of waiting."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+async def _blocked_sleep(seconds: float) -> None:
+    await asyncio.Event().wait()
+
+
+def _bucket(clock: FakeClock, rate: float = 2.0, burst: int = 3) -> TokenBucket:
+    return TokenBucket(rate, burst, clock=clock, sleep=clock.sleep)
+
+
+def test_burst_is_served_without_waiting() -> None:
+    clock = FakeClock()
+    bucket = _bucket(clock)
+
+    async def run() -> None:
+        for _ in range(3):
+            await bucket.acquire()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == []
+    assert bucket.tokens == 0
+
+
+def test_requests_after_the_burst_are_spaced_by_the_rate() -> None:
+    clock = FakeClock()
+    bucket = _bucket(clock)
+
+    async def run() -> None:
+        for _ in range(6):
+            await bucket.acquire()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == [0.5, 0.5, 0.5]
+    assert clock.now == 1.5
+    assert bucket.waits == 3
+
+
+def test_concurrent_reservations_queue_in_call_order() -> None:
+    clock = FakeClock()
+    bucket = _bucket(clock, rate=4.0, burst=1)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.25, 0.5, 0.75]
+
+
+def test_refill_is_capped_at_the_burst() -> None:
+    clock = FakeClock()
+    bucket = _bucket(clock)
+
+    for _ in range(3):
+        bucket.reserve()
+
+    clock.now += 100.0
+
+    assert bucket.tokens == 3
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+
+
+def test_cancelled_wait_refunds_its_token() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(1.0, 1, clock=clock, sleep=_blocked_sleep)
+
+    async def run() -> None:
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+
+        assert bucket.tokens == -1
+
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(run())
+
+    assert bucket.tokens == 0
+    assert bucket.reserve() == 1.0
+
+
+def test_host_overrides_apply_per_host() -> None:
+    clock = FakeClock()
+    limiter = HostRateLimiter(
+        default_rate=1.0, default_burst=2, clock=clock, sleep=clock.sleep
+    )
+    limiter.set_host_rate("Fast.Example", 10.0, burst=5)
+    limiter.set_host_rate("unlimited.example", None)
+
+    fast = limiter.bucket("fast.example")
+    default = limiter.bucket("other.example")
+
+    assert (fast.rate, fast.burst) == (10.0, 5)
+    assert (default.rate, default.burst) == (1.0, 2)
+    assert limiter.bucket("unlimited.example") is None
+
+    async def run() -> None:
+        for _ in range(3):
+            await limiter.acquire("https://other.example/p/1")
+
+        for _ in range(20):
+            await limiter.acquire("https://unlimited.example/p/1")
+
+    asyncio.run(run())
+
+    assert clock.sleeps == [1.0]
+
+
+def test_changing_a_host_rate_replaces_its_bucket() -> None:
+    clock = FakeClock()
+    limiter = HostRateLimiter(
+        default_rate=1.0, default_burst=1, clock=clock, sleep=clock.sleep
+    )
+    before = limiter.bucket("example.com")
+    before.reserve()
+
+    limiter.set_host_rate("example.com", 2.0)
+    after = limiter.bucket("example.com")
+
+    assert after is not before
+    assert after.rate == 2.0
+    assert after.reserve() == 0.0
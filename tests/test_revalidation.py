@@ -0,0 +1,66 @@
+import asyncio
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.services import http_transport, listing_store, scraper
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+ETAG = '"dm-v1"'
+LAST_MODIFIED = "Tue, 13 Oct 2026 08:00:00 GMT"
+
+
+def test_expired_listings_are_revalidated_with_stored_validators(
+    monkeypatch: pytest.MonkeyPatch,
+    store_path: Path,
+    forget_in_memory_state: Callable[[], None],
+) -> None:
+    conditional_headers: list[tuple[str | None, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        validators = (
+            request.headers.get("If-None-Match"),
+            request.headers.get("If-Modified-Since"),
+        )
+        conditional_headers.append(validators)
+
+        if validators == (ETAG, LAST_MODIFIED):
+            return httpx.Response(304)
+
+        return httpx.Response(
+            200,
+            text=PAGE_HTML,
+            headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED},
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+
+    first = asyncio.run(scraper.scrape_cards(["Dark Magician"]))
+
+    # Restart with the stored listings past their TTL.
+    expired_at = time.time() - scraper.LISTING_STORE_TTL_SECONDS - 60
+
+    with sqlite3.connect(store_path) as db:
+        db.execute("UPDATE card_listings SET fetched_at = ?", (expired_at,))
+
+    forget_in_memory_state()
+    monkeypatch.setattr(
+        scraper, "parse_card_page", lambda *args: pytest.fail("304 was reparsed")
+    )
+    revalidated_after = time.time()
+
+    second = asyncio.run(scraper.scrape_cards(["Dark Magician"]))
+    stored = asyncio.run(listing_store.load_listings(["dark-magician"], 3600 * 24))
+
+    assert conditional_headers == [(None, None), (ETAG, LAST_MODIFIED)]
+    assert first and second == first
+    fetched_at, listings = stored["dark-magician"]
+    assert fetched_at >= revalidated_after
+    assert listings == first
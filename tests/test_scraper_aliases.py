@@ -0,0 +1,80 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.services import http_transport, listing_store, scraper
+from src.services.listing_store import load_aliases, load_missing
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+MOVED_URL = "https://www.coolstuffinc.com/p/YuGiOh/Dark+Magician"
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, pages: dict[str, int]) -> list[str]:
+    """Serves the fixture page, or the status code ``pages`` gives a URL."""
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        requested.append(url)
+
+        return httpx.Response(pages.get(url, 200), text=PAGE_HTML)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+
+    return requested
+
+
+async def _remember_alias(card_name: str) -> str:
+    key = scraper._card_cache_key(card_name)
+    await listing_store.save_aliases({key: ("dark-magician", MOVED_URL)})
+
+    return key
+
+
+def test_dead_alias_falls_back_to_the_requested_url(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    own_url = scraper.card_page_url("Dark Magician (alt)")
+    requested = _serve(monkeypatch, {MOVED_URL: 404})
+
+    async def run() -> tuple[int, dict[str, tuple[str, str]]]:
+        key = await _remember_alias("Dark Magician (alt)")
+        listings = await scraper.scrape_cards(["Dark Magician (alt)"])
+
+        return len(listings), await load_aliases([key], 3600)
+
+    found, aliases = asyncio.run(run())
+
+    assert requested == [MOVED_URL, own_url]
+    assert found > 0
+    # The page names itself "Dark Magician", so the alias is relearned.
+    assert aliases == {"dark-magician-alt": ("dark-magician", own_url)}
+
+
+def test_dead_alias_and_missing_page_is_recorded_missing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    own_url = scraper.card_page_url("Dark Magician (alt)")
+    requested = _serve(monkeypatch, {MOVED_URL: 404, own_url: 404})
+
+    async def run() -> tuple[int, dict[str, tuple[str, str]], dict[str, float]]:
+        key = await _remember_alias("Dark Magician (alt)")
+        listings = await scraper.scrape_cards(["Dark Magician (alt)"])
+
+        return (
+            len(listings),
+            await load_aliases([key], 3600),
+            await load_missing([key, "dark-magician"], 3600),
+        )
+
+    found, aliases, missing = asyncio.run(run())
+
+    assert requested == [MOVED_URL, own_url]
+    assert found == 0
+    assert aliases == {}
+    assert list(missing) == ["dark-magician-alt"]
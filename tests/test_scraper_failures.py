@@ -0,0 +1,36 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.services import http_transport, scraper
+
+
+def test_pages_that_keep_failing_are_backed_off(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+
+        return httpx.Response(503)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+
+    async def search() -> int:
+        before = len(requested)
+        await scraper.scrape_cards(["Dark Magician"])
+
+        return len(requested) - before
+
+    first, second, backed_off = (asyncio.run(search()) for _ in range(3))
+
+    assert first == second == 1
+    assert backed_off == 0
+
+    failures, _retry_at = scraper._TRANSIENT_FAILURES.get("dark-magician")
+    scraper._TRANSIENT_FAILURES.set("dark-magician", (failures, 0.0))
+
+    assert asyncio.run(search()) == 1
@@ -0,0 +1,88 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.services import http_transport, listing_store, scraper
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+
+
+async def _wait_for_flight(key: str) -> None:
+    while key not in scraper._IN_FLIGHT:
+        await asyncio.sleep(0)
+
+
+def test_joined_fetch_is_stored_when_its_owner_is_cancelled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requested: list[str] = []
+    join_or_start_fetch = scraper._join_or_start_fetch
+
+    async def run() -> tuple[int, dict[str, tuple[float, list]]]:
+        release = asyncio.Event()
+        joined = asyncio.Event()
+
+        def join_or_start(key: str, *args: object) -> asyncio.Task:
+            if key in scraper._IN_FLIGHT:
+                joined.set()
+
+            return join_or_start_fetch(key, *args)
+
+        monkeypatch.setattr(scraper, "_join_or_start_fetch", join_or_start)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            await release.wait()
+
+            return httpx.Response(200, text=PAGE_HTML)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+
+        owner = asyncio.create_task(scraper.scrape_cards(["Dark Magician"]))
+        await _wait_for_flight("dark-magician")
+        joiner = asyncio.create_task(scraper.scrape_cards(["Dark Magician"]))
+        await joined.wait()
+
+        owner.cancel()
+        release.set()
+        listings = await joiner
+
+        return len(listings), await listing_store.load_listings(["dark-magician"], 3600)
+
+    found, stored = asyncio.run(run())
+
+    assert len(requested) == 1
+    assert found > 0
+    assert len(stored["dark-magician"][1]) == found
+
+
+def test_fetch_is_stored_when_every_caller_is_cancelled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def run() -> dict[str, tuple[float, list]]:
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await release.wait()
+
+            return httpx.Response(200, text=PAGE_HTML)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+
+        owner = asyncio.create_task(scraper.scrape_cards(["Dark Magician"]))
+        await _wait_for_flight("dark-magician")
+        flight = scraper._IN_FLIGHT["dark-magician"]
+        owner.cancel()
+        release.set()
+        await flight
+        await scraper.flush_store_writes()
+
+        return await listing_store.load_listings(["dark-magician"], 3600)
+
+    assert "dark-magician" in asyncio.run(run())
@@ -0,0 +1,125 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.services import http_transport, metrics, ygopro_api
+from src.services.scraper import available_parser_engines
+from src.services.site_search import (
+    SearchResultsPage,
+    fetch_search_page,
+    parse_search_results,
+)
+from src.usecases.search_cards import search_cards, search_results_page
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SEARCH_HTML = (FIXTURES / "search_results.html").read_text()
+CARD_PAGE_HTML = (FIXTURES / "card_page_rows.html").read_text()
+QUERY = "dark magician"
+
+
+def _use_site(monkeypatch: pytest.MonkeyPatch, handler) -> list[httpx.URL]:
+    requested: list[httpx.URL] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url)
+
+        return handler(request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+    monkeypatch.setattr(http_transport, "_HTTP_CLIENT", client)
+
+    return requested
+
+
+@pytest.mark.parametrize("engine", available_parser_engines())
+def test_rows_are_named_from_their_own_markup(engine: str) -> None:
+    listings, _last_page, row_count = parse_search_results(SEARCH_HTML, QUERY, engine)
+
+    assert row_count == 4
+    assert [(listing.name, listing.code) for listing in listings] == [
+        ("Dark Magician - Starter Deck: Yugi", "YSYR-EN006"),
+        ("Dark Magician Girl - Magician's Force", "MFC-EN000"),
+        (f"{QUERY} - Legend of Blue Eyes White Dragon", "LOB-EN005"),
+    ]
+    assert [listing.price_cents for listing in listings] == [499, 8900, 120450]
+    assert [listing.stock for listing in listings] == [3, 2, 0]
+
+
+@pytest.mark.parametrize("engine", available_parser_engines())
+def test_last_page_is_the_highest_linked_page(engine: str) -> None:
+    _listings, last_page, _row_count = parse_search_results(SEARCH_HTML, QUERY, engine)
+
+    assert last_page == 3
+
+
+def test_page_without_pagination_has_no_last_page() -> None:
+    html = SEARCH_HTML.split('<div class="pagination">')[0] + "</body></html>"
+
+    assert parse_search_results(html, QUERY)[1] is None
+
+
+@pytest.mark.parametrize(("page", "has_more"), [(1, True), (2, True), (3, False)])
+def test_has_more_follows_the_pagination_links(
+    monkeypatch: pytest.MonkeyPatch, page: int, has_more: bool
+) -> None:
+    requested = _use_site(
+        monkeypatch, lambda request: httpx.Response(200, text=SEARCH_HTML)
+    )
+
+    results = asyncio.run(fetch_search_page(QUERY, page))
+
+    assert results is not None
+    assert (results.page, results.has_more) == (page, has_more)
+    assert requested[0].params["page"] == str(page)
+    assert requested[0].params["q"] == QUERY
+
+
+def test_short_page_without_pagination_has_no_more(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    html = SEARCH_HTML.split('<div class="pagination">')[0] + "</body></html>"
+    _use_site(monkeypatch, lambda request: httpx.Response(200, text=html))
+
+    results = asyncio.run(fetch_search_page(QUERY))
+
+    assert results is not None and results.listings
+    assert results.has_more is False
+
+
+def test_server_error_falls_back_to_per_card_pages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ygopro_api._YGOPRO_FUZZY_CACHE.clear()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("main_search.php"):
+            return httpx.Response(500)
+
+        if request.url.host == "db.ygoprodeck.com":
+            return httpx.Response(200, json={"data": [{"name": "Dark Magician"}]})
+
+        return httpx.Response(200, text=CARD_PAGE_HTML)
+
+    requested = _use_site(monkeypatch, handler)
+
+    async def run() -> tuple[SearchResultsPage | None, list]:
+        return await search_results_page(QUERY), await search_cards(QUERY)
+
+    first_page, listings = asyncio.run(run())
+
+    assert first_page is None
+    assert [listing.code for listing in listings] == [
+        "YSYR-EN006",
+        "LOB-EN005",
+        "LCKC-EN001",
+    ]
+    assert [url.path for url in requested] == [
+        "/main_search.php",
+        "/main_search.php",
+        "/api/v7/cardinfo.php",
+        "/p/YuGiOh/Dark+Magician",
+    ]
+    assert metrics.get_counter("scrape.fetch.http_errors") == 2
@@ -0,0 +1,102 @@
+import pytest
+
+from src.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[str, int] = TTLCache(60, max_entries=2, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_entries_expire_after_their_ttl() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(60, clock=clock)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl_seconds=10)
+
+    clock.now = 10
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+
+    clock.now = 60
+    assert cache.get("default") is None
+    assert len(cache) == 0
+    assert cache.expirations == 2
+
+
+def test_expired_entries_stay_readable_for_the_stale_window() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(60, stale_seconds=30, clock=clock)
+    cache.set("a", 1)
+
+    assert cache.get_stale("a") == 1
+
+    clock.now = 70
+    assert cache.get("a") is None
+    assert cache.get_stale("a") == 1
+
+    clock.now = 90
+    assert cache.get_stale("a") is None
+    assert len(cache) == 0
+
+
+def test_sweep_drops_entries_past_their_stale_window_on_write() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(
+        10, stale_seconds=5, sweep_interval_seconds=20, clock=clock
+    )
+    cache.set("old", 1)
+    clock.now = 20
+    cache.set("new", 2)
+
+    assert len(cache) == 1
+    assert cache.get("new") == 2
+
+
+def test_byte_budget_evicts_oldest_entries() -> None:
+    cache: TTLCache[str, str] = TTLCache(
+        60, max_bytes=10, sizeof=len, clock=FakeClock()
+    )
+    cache.set("a", "xxxx")
+    cache.set("b", "yyyy")
+    cache.set("c", "zzzz")
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 8
+    assert cache.evictions == 1
+
+    cache.set("b", "y")
+    assert cache.size_bytes == 5
+
+
+def test_byte_budget_needs_a_sizeof_function() -> None:
+    with pytest.raises(ValueError):
+        TTLCache(60, max_bytes=10)
+
+
+def test_hits_and_misses_are_counted() -> None:
+    cache: TTLCache[str, int] = TTLCache(60, clock=FakeClock())
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    snapshot = cache.snapshot()
+
+    assert (snapshot["hits"], snapshot["misses"], snapshot["entries"]) == (2, 1, 1)